@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Measures the Python overhead of trapping *X* errors around one injected
+event, comparing the reusable :class:`pymouse.x11.ErrorGuard` to the
+contextmanager that used to be built for every event.
+
+The display is a stub whose ``sync`` and ``flush`` do nothing, so only the
+cost of the guard itself is measured; no X server is needed.
+"""
+
+from contextlib import contextmanager
+import time
+
+from pymouse.x11 import X11Error, error_guard
+
+
+class StubDisplay(object):
+    """Stands in for :class:`Xlib.display.Display`."""
+    def __init__(self):
+        self.display = self
+        self.error_handler = None
+        self.request_serial = 1
+
+    def set_error_handler(self, handler):
+        old, self.error_handler = self.error_handler, handler
+        return old
+
+    def sync(self):
+        pass
+
+    def flush(self):
+        pass
+
+
+def per_call_manager(display):
+    """The previous implementation of :func:`pymouse.x11.display_manager`."""
+    @contextmanager
+    def manager():
+        errors = []
+
+        def handler(*args):
+            errors.append(args)
+
+        old_handler = display.set_error_handler(handler)
+        yield display
+        display.sync()
+        display.set_error_handler(old_handler)
+        if errors:
+            raise X11Error(errors)
+
+    return manager()
+
+
+def measure(description, function, count):
+    start = time.perf_counter()
+    function(count)
+    elapsed = time.perf_counter() - start
+    print('{0:<40} {1:>9.0f} ns per event'.format(
+        description, elapsed * 1e9 / count))
+
+
+def main():
+    count = 200000
+    display = StubDisplay()
+
+    def empty(count):
+        for i in range(count):
+            pass
+
+    def per_call(count):
+        for i in range(count):
+            with per_call_manager(display):
+                pass
+
+    guard = error_guard(display)
+
+    def reused(count):
+        for i in range(count):
+            with guard:
+                pass
+
+    def batched(count):
+        with guard.batch():
+            for i in range(count):
+                with guard:
+                    pass
+
+    def deferred(count):
+        guard.deferred = True
+        try:
+            for i in range(count):
+                with guard:
+                    pass
+        finally:
+            guard.deferred = False
+
+    measure('empty loop', empty, count)
+    measure('per-call contextmanager', per_call, count)
+    measure('reused guard', reused, count)
+    measure('reused guard, deferred checks', deferred, count)
+    measure('reused guard, within a batch', batched, count)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Measures the time taken to construct a PyKeyboard sharing an open connection,
+with the special keys resolved lazily, and compares it to resolving all of
+them up front as the constructor used to.
+
+This needs a running X server; DISPLAY must be set.
+"""
+
+import time
+
+from pykeyboard.x11 import PyKeyboard, _SpecialKey, _SpecialKeys
+from pykeyboard.x11_keymap import string_to_keysym
+
+
+def eager_assignment(keyboard):
+    """Resolves every special key without any caching, like the previous
+    constructor did.
+    """
+    lookup = lambda name: keyboard.display.keysym_to_keycode(
+        string_to_keysym(name))
+    for name, value in vars(PyKeyboard).items():
+        if isinstance(value, _SpecialKey):
+            lookup(value.name)
+        elif isinstance(value, _SpecialKeys):
+            value.function(lookup)
+
+
+def measure(description, function, count):
+    start = time.time()
+    for i in range(count):
+        function()
+    elapsed = time.time() - start
+    print('{0:<40} {1:>9.3f} ms per keyboard'.format(
+        description, elapsed * 1000 / count))
+
+
+def main():
+    count = 200
+
+    #Keep the shared display open, as a long running process would, so that
+    #the keyboards reuse its connection and keymap; only the construction of
+    #the keyboards is measured then
+    with PyKeyboard(shared=True):
+        def lazy():
+            PyKeyboard(shared=True).close()
+
+        def eager():
+            keyboard = PyKeyboard(shared=True)
+            eager_assignment(keyboard)
+            keyboard.close()
+
+        def lazy_first_use():
+            keyboard = PyKeyboard(shared=True)
+            keyboard.function_keys
+            keyboard.backspace_key
+            keyboard.close()
+
+        measure('eager special keys (before)', eager, count)
+        measure('lazy special keys (after)', lazy, count)
+        measure('lazy, using two special keys', lazy_first_use, count)
+
+
+if __name__ == '__main__':
+    main()
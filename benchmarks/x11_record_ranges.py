@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Measures the data received and the CPU time spent by a mouse listener that
+does not want pointer motion while the pointer moves, comparing the record
+range PyMouseEvent used to ask for, which was built from event masks, with
+the exact range of button events.
+
+This needs a running X server; DISPLAY must be set.
+"""
+
+import threading
+import time
+
+from Xlib import X
+from Xlib.display import Display
+from Xlib.ext import record
+
+from pymouse.x11 import PyMouse
+from pymouse.x11_record import record_events, record_range, BUTTON_EVENTS
+
+
+class Recorder(threading.Thread):
+    """Records the device events in a range, and counts what arrives."""
+    def __init__(self, device_events):
+        threading.Thread.__init__(self)
+        self.daemon = True
+        self.control = Display()
+        self.data = Display()
+        self.ctx = self.data.record_create_context(
+            0, [record.AllClients], [record_range(device_events)])
+        self.bytes = 0
+        self.events = 0
+        self.cpu = 0.0
+
+    def run(self):
+        start = time.thread_time()
+        self.data.record_enable_context(self.ctx, self.handler)
+        self.cpu = time.thread_time() - start
+        self.data.record_free_context(self.ctx)
+
+    def handler(self, reply):
+        if reply.category != record.FromServer:
+            return
+        self.bytes += len(reply.data)
+        for event in record_events(reply, self.data):
+            self.events += 1
+
+    def stop(self):
+        self.control.record_disable_context(self.ctx)
+        self.control.sync()
+        self.join()
+        self.control.close()
+        self.data.close()
+
+
+def measure(description, device_events, moves):
+    recorder = Recorder(device_events)
+    recorder.start()
+    time.sleep(0.2)
+    with PyMouse() as mouse:
+        width, height = mouse.screen_size()
+        with mouse.batch():
+            for i in range(moves):
+                mouse.move(i % width, (i // width) % height)
+    time.sleep(0.2)
+    recorder.stop()
+    print('{0:<32} {1:>8} events {2:>10} bytes {3:>8.1f} ms CPU'.format(
+        description, recorder.events, recorder.bytes, recorder.cpu * 1000))
+
+
+def main():
+    moves = 20000
+    measure('masks (previous range)',
+            (X.ButtonPressMask, X.ButtonReleaseMask), moves)
+    measure('button events only', BUTTON_EVENTS, moves)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Counts the X server round trips made by PyMouse.click and PyMouse.scroll, and
+compares them to the previous implementation which pressed and released every
+button separately.
+
+This needs a running X server; DISPLAY must be set.
+"""
+
+import time
+
+from pymouse.base import PyMouseMeta
+from pymouse.x11 import PyMouse
+
+
+class RoundTripCounter(object):
+    """Counts the requests sent to a display that wait for a reply."""
+    def __init__(self, display):
+        self.count = 0
+        self.protocol_display = display.display
+        self.send_request = self.protocol_display.send_request
+        self.protocol_display.send_request = self
+
+    def __call__(self, request, wait_for_response):
+        if wait_for_response:
+            self.count += 1
+        return self.send_request(request, wait_for_response)
+
+    def reset(self):
+        count, self.count = self.count, 0
+        return count
+
+
+def old_scroll(mouse, vertical):
+    PyMouseMeta.click(mouse, *mouse.position(), button=4, n=vertical)
+
+
+def measure(description, counter, function, *args, **kwargs):
+    counter.reset()
+    start = time.time()
+    function(*args, **kwargs)
+    elapsed = time.time() - start
+    print('{0:<32} {1:>6} round trips {2:>9.2f} ms'.format(
+        description, counter.reset(), elapsed * 1000))
+
+
+def main():
+    mouse = PyMouse()
+    counter = RoundTripCounter(mouse.display)
+    x, y = mouse.position()
+    for n in (1, 10, 50):
+        measure('click n={0} (before)'.format(n), counter,
+                PyMouseMeta.click, mouse, x, y, button=1, n=n)
+        measure('click n={0} (after)'.format(n), counter,
+                mouse.click, x, y, button=1, n=n)
+    for n in (1, 10, 50):
+        measure('scroll {0} notches (before)'.format(n), counter,
+                old_scroll, mouse, n)
+        measure('scroll {0} notches (after)'.format(n), counter,
+                mouse.scroll, vertical=n)
+        mouse.scroll(vertical=-n)
+
+
+if __name__ == '__main__':
+    main()
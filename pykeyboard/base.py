@@ -18,9 +18,11 @@ As the base file, this provides a rough operational model along with the
 framework to be extended by each platform.
 """
 
-import time
+from contextlib import contextmanager
 from threading import Thread
 
+from pymouse.scheduler import Scheduler
+
 
 class PyKeyboardMeta(object):
     """
@@ -29,6 +31,35 @@ class PyKeyboardMeta(object):
     #: We add this named character for convenience
     space = ' '
 
+    #: The :class:`pymouse.scheduler.Scheduler` that paced the last call of
+    #: :meth:`tap_key` or :meth:`type_string`; see its ``statistics()``
+    scheduler = None
+
+    #: The time spent busy-waiting at the end of every interval, in seconds
+    scheduler_spin = 0
+
+    @contextmanager
+    def batch(self):
+        """
+        A context manager within which the generated key events may be queued
+        and sent together when it exits. Platforms that do not support this
+        send every event immediately.
+        """
+        yield self
+
+    def close(self):
+        """
+        Releases the resources held by this object, such as the connection to
+        the display server. The object must not be used afterwards.
+        """
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
     def press_key(self, character=''):
         """Press a given character key."""
         raise NotImplementedError
@@ -38,11 +69,17 @@ class PyKeyboardMeta(object):
         raise NotImplementedError
 
     def tap_key(self, character='', n=1, interval=0):
-        """Press and release a given character key n times."""
+        """
+        Press and release a given character key n times. Taps are started
+        every interval seconds, the last one being followed by an interval
+        as well.
+        """
+        scheduler = Scheduler(interval, self.scheduler_spin)
         for i in range(n):
             self.press_key(character)
             self.release_key(character)
-            time.sleep(interval)
+            scheduler.wait()
+        self.scheduler = scheduler
 
     def press_keys(self,characters=[]):
         """Press a given character key."""
@@ -54,12 +91,14 @@ class PyKeyboardMeta(object):
     def type_string(self, char_string, interval=0):
         """
         A convenience method for typing longer strings of characters. Generates
-        as few Shift events as possible."""
+        as few Shift events as possible. Characters are typed every interval
+        seconds, starting after one interval."""
+        scheduler = Scheduler(interval, self.scheduler_spin)
         shift = False
         for char in char_string:
+            scheduler.wait()
             if self.is_char_shifted(char):
                 if not shift:  # Only press Shift as needed
-                    time.sleep(interval)
                     self.press_key(self.shift_key)
                     shift = True
                 #In order to avoid tap_key pressing Shift, we need to pass the
@@ -69,17 +108,16 @@ class PyKeyboardMeta(object):
                     unshifted_char = ",./;'[]\\`1234567890-="[ch_index]
                 else:
                     unshifted_char = char.lower()
-                time.sleep(interval)
                 self.tap_key(unshifted_char)
             else:  # Unshifted already
                 if shift and char != ' ':  # Only release Shift as needed
                     self.release_key(self.shift_key)
                     shift = False
-                time.sleep(interval)
                 self.tap_key(char)
 
         if shift:  # Turn off Shift if it's still ON
             self.release_key(self.shift_key)
+        self.scheduler = scheduler
 
     def special_key_assignment(self):
         """Makes special keys more accessible."""
@@ -150,11 +188,20 @@ class PyKeyboardEventMeta(Thread):
     for key in modifier_bits.keys():
         modifiers[key] = False
 
-    def __init__(self, capture=False):
+    #: The form of the events passed to on_batch; see the platform listener
+    batch_format = 'list'
+
+    def __init__(self, capture=False, queue=None):
         Thread.__init__(self)
         self.daemon = True
         self.capture = capture
         self.state = True
+        #The pymouse.event_queue.EventQueue receiving the events, if any
+        self.queue = queue
+        #Whether on_batch is overridden
+        self._batch_hook = type(self).on_batch is not PyKeyboardEventMeta.on_batch
+        #configure_keys assigns the platform bits of this instance
+        self.modifier_bits = dict(self.modifier_bits)
         self.configure_keys()
 
     def run(self):
@@ -162,6 +209,12 @@ class PyKeyboardEventMeta(Thread):
 
     def stop(self):
         self.state = False
+        if self.queue is not None:
+            self.queue.close()
+
+    def close(self):
+        """Releases the resources held by the listener, once it has stopped."""
+        pass
 
     def handler(self):
         raise NotImplementedError
@@ -173,6 +226,20 @@ class PyKeyboardEventMeta(Thread):
         the key if one can be assigned (keyboard mask states will apply). The
         argument 'press' will be True if the key was depressed and False if the
         key was released.
+
+        By default, the event is put in the queue of the listener, if it has
+        one.
+        """
+        if self.queue is not None:
+            self.queue.put(('tap', keycode, character, press))
+
+    def on_batch(self, events):
+        """
+        Subclass this method to handle the key events received together from
+        the system in one call, instead of one call of tap() per event; tap()
+        is then not called. The listener still stops once escape() is true
+        for an event of the batch. The events are platform specific and given
+        in the form set by batch_format.
         """
         pass
 
@@ -17,31 +17,218 @@ from Xlib.display import Display
 from Xlib import X
 from Xlib.ext.xtest import fake_input
 from Xlib.ext import record
-from Xlib.protocol import rq
-import Xlib.XK
-import Xlib.keysymdef.xkb
 
 from .base import PyKeyboardMeta, PyKeyboardEventMeta
 
 import time
 import string
+from array import array
+from collections import OrderedDict
+from contextlib import contextmanager
+from itertools import groupby
+from threading import Thread
+from types import MappingProxyType
 
-from pymouse.x11 import display_manager
+from pymouse.scheduler import Scheduler
+from pymouse.x11 import (display_manager, display_batch, error_guard,
+                         open_display, close_display)
+from pymouse.x11_record import (record_events, record_batch, event_batch,
+                                record_range, KEY_EVENTS, RecordEvent)
 
-from .x11_keysyms import KEYSYMS
+from .x11_keymap import Keymap, translation_tables
+from .x11_keysyms import keysym_to_character
+
+
+class _SpecialKey(object):
+    """
+    A special key attribute of :class:`PyKeyboard`. Its keycode is looked up
+    in the keymap of the display when the attribute is accessed.
+    """
+    def __init__(self, name):
+        self.name = name
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        return instance.lookup_character_keycode(self.name)
+
+
+class _SpecialKeys(object):
+    """
+    A special key collection attribute of :class:`PyKeyboard`, created by
+    calling ``function`` with :meth:`PyKeyboard.lookup_character_keycode` on
+    first access. It is kept until the keyboard mapping changes.
+    """
+    def __init__(self, function):
+        self.function = function
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        instance.keymap.update()
+        generation = instance.keymap.generation
+        try:
+            cached_generation, value = instance._special_keys[self]
+            if cached_generation == generation:
+                return value
+        except KeyError:
+            pass
+        value = self.function(instance.lookup_character_keycode)
+        instance._special_keys[self] = (generation, value)
+        return value
 
 
 class PyKeyboard(PyKeyboardMeta):
     """
     The PyKeyboard implementation for X11 systems (mostly linux). This
     allows one to simulate keyboard input.
+
+    Every PyKeyboard has its own connection to the *X* server, unless
+    ``shared`` is true; it then shares the connection of the other PyMouse
+    and PyKeyboard objects created with ``shared=True`` on the same thread.
+    See :func:`pymouse.x11.acquire_display`.
     """
-    def __init__(self, display=None):
+    #: The number of compiled strings kept by :meth:`compile_string`
+    plan_cache_size = 128
+
+    #This set of keys compiled using the X11 keysymdef.h file as reference
+    #They comprise a relatively universal set of keys, though there may be
+    #exceptions which may come up for other OSes and vendors. Countless
+    #special cases exist which are not handled here, but may be extended.
+    #The keycodes are looked up lazily; see special_key_assignment.
+    #TTY Function Keys
+    backspace_key = _SpecialKey('BackSpace')
+    tab_key = _SpecialKey('Tab')
+    linefeed_key = _SpecialKey('Linefeed')
+    clear_key = _SpecialKey('Clear')
+    return_key = _SpecialKey('Return')
+    enter_key = return_key  # Because many keyboards call it "Enter"
+    pause_key = _SpecialKey('Pause')
+    scroll_lock_key = _SpecialKey('Scroll_Lock')
+    sys_req_key = _SpecialKey('Sys_Req')
+    escape_key = _SpecialKey('Escape')
+    delete_key = _SpecialKey('Delete')
+    #Modifier Keys
+    shift_l_key = _SpecialKey('Shift_L')
+    shift_r_key = _SpecialKey('Shift_R')
+    shift_key = shift_l_key  # Default Shift is left Shift
+    alt_l_key = _SpecialKey('Alt_L')
+    alt_r_key = _SpecialKey('Alt_R')
+    altgr_key = _SpecialKey('ISO_Level3_Shift')
+    alt_key = alt_l_key  # Default Alt is left Alt
+    control_l_key = _SpecialKey('Control_L')
+    control_r_key = _SpecialKey('Control_R')
+    control_key = control_l_key  # Default Ctrl is left Ctrl
+    caps_lock_key = _SpecialKey('Caps_Lock')
+    capital_key = caps_lock_key  # Some may know it as Capital
+    shift_lock_key = _SpecialKey('Shift_Lock')
+    meta_l_key = _SpecialKey('Meta_L')
+    meta_r_key = _SpecialKey('Meta_R')
+    super_l_key = _SpecialKey('Super_L')
+    windows_l_key = super_l_key  # Cross-support; also it's printed there
+    super_r_key = _SpecialKey('Super_R')
+    windows_r_key = super_r_key  # Cross-support; also it's printed there
+    hyper_l_key = _SpecialKey('Hyper_L')
+    hyper_r_key = _SpecialKey('Hyper_R')
+    #Cursor Control and Motion
+    home_key = _SpecialKey('Home')
+    up_key = _SpecialKey('Up')
+    down_key = _SpecialKey('Down')
+    left_key = _SpecialKey('Left')
+    right_key = _SpecialKey('Right')
+    end_key = _SpecialKey('End')
+    begin_key = _SpecialKey('Begin')
+    page_up_key = _SpecialKey('Page_Up')
+    page_down_key = _SpecialKey('Page_Down')
+    prior_key = _SpecialKey('Prior')
+    next_key = _SpecialKey('Next')
+    #Misc Functions
+    select_key = _SpecialKey('Select')
+    print_key = _SpecialKey('Print')
+    print_screen_key = print_key  # Seems to be the same thing
+    snapshot_key = print_key  # Another name for printscreen
+    execute_key = _SpecialKey('Execute')
+    insert_key = _SpecialKey('Insert')
+    undo_key = _SpecialKey('Undo')
+    redo_key = _SpecialKey('Redo')
+    menu_key = _SpecialKey('Menu')
+    apps_key = menu_key  # Windows...
+    find_key = _SpecialKey('Find')
+    cancel_key = _SpecialKey('Cancel')
+    help_key = _SpecialKey('Help')
+    break_key = _SpecialKey('Break')
+    mode_switch_key = _SpecialKey('Mode_switch')
+    script_switch_key = _SpecialKey('script_switch')
+    num_lock_key = _SpecialKey('Num_Lock')
+    #Keypad Keys: Dictionary structure
+    keypad_keys = _SpecialKeys(lambda lookup: dict(
+        (k, lookup('KP_'+str(k))) for k in [
+            'Space', 'Tab', 'Enter', 'F1', 'F2', 'F3', 'F4', 'Home',
+            'Left', 'Up', 'Right', 'Down', 'Prior', 'Page_Up', 'Next',
+            'Page_Down', 'End', 'Begin', 'Insert', 'Delete', 'Equal',
+            'Multiply', 'Add', 'Separator', 'Subtract', 'Decimal',
+            'Divide', 0, 1, 2, 3, 4, 5, 6, 7, 8, 9]))
+    numpad_keys = keypad_keys
+    #Function Keys/ Auxilliary Keys
+    #FKeys
+    function_keys = _SpecialKeys(
+        lambda lookup: [None] + [lookup('F'+str(i)) for i in range(1,36)])
+    #LKeys
+    l_keys = _SpecialKeys(
+        lambda lookup: [None] + [lookup('L'+str(i)) for i in range(1,11)])
+    #RKeys
+    r_keys = _SpecialKeys(
+        lambda lookup: [None] + [lookup('R'+str(i)) for i in range(1,16)])
+
+    #Unsupported keys from windows
+    kana_key = None
+    hangeul_key = None # old name - should be here for compatibility
+    hangul_key = None
+    junjua_key = None
+    final_key = None
+    hanja_key = None
+    kanji_key = None
+    convert_key = None
+    nonconvert_key = None
+    accept_key = None
+    modechange_key = None
+    sleep_key = None
+
+    def __init__(self, display=None, shared=False):
         PyKeyboardMeta.__init__(self)
-        self.display = Display(display)
-        self.display2 = Display(display)
+        self.display = open_display(display, shared)
+        #: The error guard of the display; see :class:`pymouse.x11.ErrorGuard`
+        self.guard = error_guard(self.display)
+        self._display_name = display
+        self._schedule_guard = None
+        self.keymap = Keymap.for_display(self.display)
+        self._plans = OrderedDict()
+        self._plans_generation = self.keymap.generation
         self.special_key_assignment()
 
+    @contextmanager
+    def batch(self):
+        """Queues all key events generated within the managed block, and sends
+        them to the *X* server in one go. This makes typing long strings
+        considerably faster::
+
+            with keyboard.batch():
+                keyboard.type_string(text)
+
+        See :func:`pymouse.x11.display_batch`.
+        """
+        with display_batch(self.display):
+            yield self
+
+    def close(self):
+        if self._schedule_guard is not None:
+            close_display(self._schedule_guard.display)
+            self._schedule_guard = None
+        if self.display is not None:
+            close_display(self.display)
+            self.guard = None
+            self.display = None
+
     def _handle_key(self, character, event):
         """Handles either a key press or release, depending on ``event``.
 
@@ -56,10 +243,10 @@ class PyKeyboard(PyKeyboardMeta):
             shifted = self.is_char_shifted(character)
         except AttributeError:
             # Handle the case of integer keycode argument
-            with display_manager(self.display) as d:
+            with self.guard as d:
                 fake_input(d, event, character)
         else:
-            with display_manager(self.display) as d:
+            with self.guard as d:
                 if shifted:
                     fake_input(d, event, self.shift_key)
                 keycode = self.lookup_character_keycode(character)
@@ -79,148 +266,190 @@ class PyKeyboard(PyKeyboardMeta):
         """
         self._handle_key(character, X.KeyRelease)
 
+    def schedule_string(self, char_string, interval=0):
+        """
+        Types a string like :meth:`type_string`, but leaves the timing to the
+        *X* server: the key press of every character is sent with an *XTest*
+        delay of ``interval`` seconds, and the whole string is sent in one go.
+
+        This method returns as soon as the events have been sent, without
+        waiting for the server to play them back, so the typing does not
+        drift with the scheduling of the calling thread.
+
+        While it plays delayed events back, the server holds back all other
+        requests of the connection that sent them, so the events are sent
+        over a connection of their own; see :attr:`schedule_guard`. This
+        keyboard, and the objects sharing its connection, may be used
+        meanwhile, and strings scheduled one after the other are typed one
+        after the other. Call ``schedule_guard.barrier()`` to wait for the
+        typing to finish and to report the *X* errors it caused.
+        """
+        delay = int(round(interval * 1000))
+        shift = self.shift_key
+        guard = self.schedule_guard
+        d = guard.display
+        for op in self.compile_string(char_string):
+            if op >> 8 == X.KeyPress and op & 0xff != shift:
+                fake_input(d, X.KeyPress, op & 0xff, time=delay)
+            else:
+                fake_input(d, op >> 8, op & 0xff)
+        guard.flush()
+
+    @property
+    def schedule_guard(self):
+        """
+        The :class:`pymouse.x11.ErrorGuard` of the connection used by
+        :meth:`schedule_string`, which is opened on first use. Its
+        ``barrier()`` waits until the scheduled typing has been played back,
+        and reports the errors it caused.
+        """
+        if self._schedule_guard is None:
+            self._schedule_guard = error_guard(Display(self._display_name))
+        return self._schedule_guard
+
+    def type_string(self, char_string, interval=0):
+        """
+        A convenience method for typing longer strings of characters. Generates
+        as few Shift events as possible. Characters are typed every interval
+        seconds, starting after one interval.
+
+        The keystrokes are sent in one batch; when an ``interval`` is given,
+        the events queued so far are flushed before waiting.
+        """
+        plan = self.compile_string(char_string)
+        shift = self.shift_key
+        scheduler = Scheduler(interval, self.scheduler_spin)
+        with display_batch(self.display) as d:
+            for op in plan:
+                if interval and op >> 8 == X.KeyPress and op & 0xff != shift:
+                    d.flush()
+                    scheduler.wait()
+                fake_input(d, op >> 8, op & 0xff)
+        self.scheduler = scheduler
+
+    def compile_string(self, char_string):
+        """
+        Compiles ``char_string`` to the keystrokes that type it. The result is
+        an array of operations, each being ``event << 8 | keycode``, where
+        ``event`` is either :attr:`Xlib.X.KeyPress` or
+        :attr:`Xlib.X.KeyRelease`.
+
+        The most recently used plans are cached for as long as the keyboard
+        mapping stays the same.
+        """
+        self.keymap.update()
+        if self._plans_generation != self.keymap.generation:
+            self._plans.clear()
+            self._plans_generation = self.keymap.generation
+        key = (char_string, self.shift_key)
+        try:
+            plan = self._plans.pop(key)
+        except KeyError:
+            plan = array('H', (
+                event << 8 | keycode
+                for event, keycode in self._keystrokes(char_string)))
+            while len(self._plans) >= self.plan_cache_size:
+                self._plans.popitem(last=False)
+        self._plans[key] = plan
+        return plan
+
+    def keymap_changed(self):
+        """
+        Checks the display for a changed keyboard mapping right away. Changes
+        are otherwise noticed the next time the display waits for the server.
+        """
+        self.keymap.update(poll=True)
+
+    def _keystrokes(self, char_string):
+        """
+        Yields the ``(event, keycode)`` pairs needed to type ``char_string``,
+        pressing and releasing Shift as seldom as possible, like
+        :meth:`type_string` does.
+        """
+        shift = False
+        for char in char_string:
+            if self.is_char_shifted(char):
+                if not shift:  # Only press Shift as needed
+                    yield X.KeyPress, self.shift_key
+                    shift = True
+                #Type the unshifted form of the character while Shift is held
+                if char in '<>?:"{}|~!@#$%^&*()_+':
+                    ch_index = '<>?:"{}|~!@#$%^&*()_+'.index(char)
+                    char = ",./;'[]\\`1234567890-="[ch_index]
+                else:
+                    char = char.lower()
+            elif shift and char != ' ':  # Only release Shift as needed
+                yield X.KeyRelease, self.shift_key
+                shift = False
+            keycode = self.lookup_character_keycode(char)
+            yield X.KeyPress, keycode
+            yield X.KeyRelease, keycode
+
+        if shift:  # Turn off Shift if it's still ON
+            yield X.KeyRelease, self.shift_key
+
     def special_key_assignment(self):
         """
         Determines the keycodes for common special keys on the keyboard. These
         are integer values and can be passed to the other key methods.
         Generally speaking, these are non-printable codes.
+
+        The keycodes are looked up when first accessed, and again after the
+        keyboard mapping has changed; calling this method forgets those
+        already looked up.
         """
-        #This set of keys compiled using the X11 keysymdef.h file as reference
-        #They comprise a relatively universal set of keys, though there may be
-        #exceptions which may come up for other OSes and vendors. Countless
-        #special cases exist which are not handled here, but may be extended.
-        #TTY Function Keys
-        self.backspace_key = self.lookup_character_keycode('BackSpace')
-        self.tab_key = self.lookup_character_keycode('Tab')
-        self.linefeed_key = self.lookup_character_keycode('Linefeed')
-        self.clear_key = self.lookup_character_keycode('Clear')
-        self.return_key = self.lookup_character_keycode('Return')
-        self.enter_key = self.return_key  # Because many keyboards call it "Enter"
-        self.pause_key = self.lookup_character_keycode('Pause')
-        self.scroll_lock_key = self.lookup_character_keycode('Scroll_Lock')
-        self.sys_req_key = self.lookup_character_keycode('Sys_Req')
-        self.escape_key = self.lookup_character_keycode('Escape')
-        self.delete_key = self.lookup_character_keycode('Delete')
-        #Modifier Keys
-        self.shift_l_key = self.lookup_character_keycode('Shift_L')
-        self.shift_r_key = self.lookup_character_keycode('Shift_R')
-        self.shift_key = self.shift_l_key  # Default Shift is left Shift
-        self.alt_l_key = self.lookup_character_keycode('Alt_L')
-        self.alt_r_key = self.lookup_character_keycode('Alt_R')
-        self.altgr_key = self.lookup_character_keycode('ISO_Level3_Shift')
-        self.alt_key = self.alt_l_key  # Default Alt is left Alt
-        self.control_l_key = self.lookup_character_keycode('Control_L')
-        self.control_r_key = self.lookup_character_keycode('Control_R')
-        self.control_key = self.control_l_key  # Default Ctrl is left Ctrl
-        self.caps_lock_key = self.lookup_character_keycode('Caps_Lock')
-        self.capital_key = self.caps_lock_key  # Some may know it as Capital
-        self.shift_lock_key = self.lookup_character_keycode('Shift_Lock')
-        self.meta_l_key = self.lookup_character_keycode('Meta_L')
-        self.meta_r_key = self.lookup_character_keycode('Meta_R')
-        self.super_l_key = self.lookup_character_keycode('Super_L')
-        self.windows_l_key = self.super_l_key  # Cross-support; also it's printed there
-        self.super_r_key = self.lookup_character_keycode('Super_R')
-        self.windows_r_key = self.super_r_key  # Cross-support; also it's printed there
-        self.hyper_l_key = self.lookup_character_keycode('Hyper_L')
-        self.hyper_r_key = self.lookup_character_keycode('Hyper_R')
-        #Cursor Control and Motion
-        self.home_key = self.lookup_character_keycode('Home')
-        self.up_key = self.lookup_character_keycode('Up')
-        self.down_key = self.lookup_character_keycode('Down')
-        self.left_key = self.lookup_character_keycode('Left')
-        self.right_key = self.lookup_character_keycode('Right')
-        self.end_key = self.lookup_character_keycode('End')
-        self.begin_key = self.lookup_character_keycode('Begin')
-        self.page_up_key = self.lookup_character_keycode('Page_Up')
-        self.page_down_key = self.lookup_character_keycode('Page_Down')
-        self.prior_key = self.lookup_character_keycode('Prior')
-        self.next_key = self.lookup_character_keycode('Next')
-        #Misc Functions
-        self.select_key = self.lookup_character_keycode('Select')
-        self.print_key = self.lookup_character_keycode('Print')
-        self.print_screen_key = self.print_key  # Seems to be the same thing
-        self.snapshot_key = self.print_key  # Another name for printscreen
-        self.execute_key = self.lookup_character_keycode('Execute')
-        self.insert_key = self.lookup_character_keycode('Insert')
-        self.undo_key = self.lookup_character_keycode('Undo')
-        self.redo_key = self.lookup_character_keycode('Redo')
-        self.menu_key = self.lookup_character_keycode('Menu')
-        self.apps_key = self.menu_key  # Windows...
-        self.find_key = self.lookup_character_keycode('Find')
-        self.cancel_key = self.lookup_character_keycode('Cancel')
-        self.help_key = self.lookup_character_keycode('Help')
-        self.break_key = self.lookup_character_keycode('Break')
-        self.mode_switch_key = self.lookup_character_keycode('Mode_switch')
-        self.script_switch_key = self.lookup_character_keycode('script_switch')
-        self.num_lock_key = self.lookup_character_keycode('Num_Lock')
-        #Keypad Keys: Dictionary structure
-        keypad = ['Space', 'Tab', 'Enter', 'F1', 'F2', 'F3', 'F4', 'Home',
-                  'Left', 'Up', 'Right', 'Down', 'Prior', 'Page_Up', 'Next',
-                  'Page_Down', 'End', 'Begin', 'Insert', 'Delete', 'Equal',
-                  'Multiply', 'Add', 'Separator', 'Subtract', 'Decimal',
-                  'Divide', 0, 1, 2, 3, 4, 5, 6, 7, 8, 9]
-        self.keypad_keys = dict((k, self.lookup_character_keycode('KP_'+str(k))) for k in keypad)
-        self.numpad_keys = self.keypad_keys
-        #Function Keys/ Auxilliary Keys
-        #FKeys
-        self.function_keys = [None] + [self.lookup_character_keycode('F'+str(i)) for i in range(1,36)]
-        #LKeys
-        self.l_keys = [None] + [self.lookup_character_keycode('L'+str(i)) for i in range(1,11)]
-        #RKeys
-        self.r_keys = [None] + [self.lookup_character_keycode('R'+str(i)) for i in range(1,16)]
-
-        #Unsupported keys from windows
-        self.kana_key = None
-        self.hangeul_key = None # old name - should be here for compatibility
-        self.hangul_key = None
-        self.junjua_key = None
-        self.final_key = None
-        self.hanja_key = None
-        self.kanji_key = None
-        self.convert_key = None
-        self.nonconvert_key = None
-        self.accept_key = None
-        self.modechange_key = None
-        self.sleep_key = None
+        self._special_keys = {}
 
     def lookup_character_keycode(self, character):
         """
         Looks up the keysym for the character then returns the keycode mapping
         for that keysym.
         """
-        keysym = Xlib.XK.string_to_keysym(character)
-        if not keysym:
-            try:
-                keysym = getattr(Xlib.keysymdef.xkb, 'XK_' + character, 0)
-            except:
-                keysym = 0
-        if not keysym:
-            keysym = Xlib.XK.string_to_keysym(KEYSYMS[character])
-        return self.display.keysym_to_keycode(keysym)
+        self.keymap.update()
+        return self.keymap.keycode(character)
 
 
 class PyKeyboardEvent(PyKeyboardEventMeta):
     """
     The PyKeyboardEvent implementation for X11 systems (mostly linux). This
     allows one to listen for keyboard input.
+
+    If ``queue`` is a :class:`pymouse.event_queue.EventQueue`, the events are
+    put in it instead of being handled on the listening thread, unless
+    :meth:`tap` is overridden.
+
+    If :meth:`on_batch` is overridden, it receives the key events of every
+    batch received from the server, as a list of
+    :class:`pymouse.x11_record.RecordEvent` tuples or, if :attr:`batch_format`
+    is ``'numpy'``, as a NumPy array; see
+    :func:`pymouse.x11_record.record_batch`. The keyboard mapping is kept up
+    to date before every batch, and the listener stops after a batch in which
+    :meth:`escape` is true for an event.
+
+    :attr:`modifiers` is a read-only mapping of the modifiers of the last key
+    event, replaced by another one for every event; copy it with ``dict()``
+    to keep or change it.
     """
-    def __init__(self, capture=False, display=None):
+    #The names of the keypad keys, without their KP_ prefix
+    _keypad_names = ['Space', 'Tab', 'Enter', 'F1', 'F2', 'F3', 'F4', 'Home',
+                     'Left', 'Up', 'Right', 'Down', 'Prior', 'Page_Up', 'Next',
+                     'Page_Down', 'End', 'Begin', 'Insert', 'Delete', 'Equal',
+                     'Multiply', 'Add', 'Separator', 'Subtract', 'Decimal',
+                     'Divide', '0', '1', '2', '3', '4', '5', '6', '7', '8', '9']
+
+    def __init__(self, capture=False, display=None, queue=None):
+        #The control connection is private, since it is used both by the
+        #recording thread and by the thread stopping the listener; recording
+        #blocks the connection it is enabled on, so it needs another one
         self.display = Display(display)
-        self.display2 = Display(display)
-        self.ctx = self.display2.record_create_context(
-            0,
-            [record.AllClients],
-            [{
-                    'core_requests': (0, 0),
-                    'core_replies': (0, 0),
-                    'ext_requests': (0, 0, 0, 0),
-                    'ext_replies': (0, 0, 0, 0),
-                    'delivered_events': (0, 0),
-                    'device_events': (X.KeyPress, X.KeyRelease),
-                    'errors': (0, 0),
-                    'client_started': False,
-                    'client_died': False,
-            }])
+        self.keymap = Keymap.for_display(self.display)
+        #The record connection and context are created when listening starts,
+        #unless a PyInputEvent records for this listener
+        self._display_name = display
+        self.display2 = None
+        self.ctx = None
+        #The PyInputEvent recording for this listener, if any
+        self._input = None
 
         self.lock_meaning = None
 
@@ -231,6 +460,24 @@ class PyKeyboardEvent(PyKeyboardEventMeta):
         self.modifier_keycodes = {}
         self.all_mod_keycodes = []
         self.keypad_keycodes = []
+
+        #The modifier mask of the last key event, and the modifiers views of
+        #all 256 masks; see _build_modifier_tables
+        self.modifier_state = 0
+        self._modifier_views = ()
+        self._modifier_keycode_set = bytearray(256)
+        self._keypad_keycode_set = bytearray(256)
+
+        #The characters of every keycode under every combination of the
+        #modifiers affecting them; see _build_char_table
+        self._combo_table = bytes(256)
+        self._char_table = []
+        self._mapping_changes = []
+        self.keymap.observe(self._mapping_changed)
+
+        #The number of key events whose keysym had neither a character nor a
+        #name; lookup_char_from_keycode returned None for them
+        self.unresolved_keysyms = 0
         #self.configure_keys()
 
         #Direct access to the display's keycode-to-keysym array
@@ -238,46 +485,135 @@ class PyKeyboardEvent(PyKeyboardEventMeta):
         #for i in range(len(self.display._keymap_codes)):
         #    print('{0}: {1}'.format(i, self.display._keymap_codes[i]))
 
-        PyKeyboardEventMeta.__init__(self, capture)
+        PyKeyboardEventMeta.__init__(self, capture, queue)
 
     def run(self):
         """Begin listening for keyboard input events."""
         self.state = True
-        if self.capture:
-            self.display2.screen().root.grab_keyboard(X.KeyPressMask | X.KeyReleaseMask, X.GrabModeAsync, X.GrabModeAsync, X.CurrentTime)
-
+        self._prepare()
         self.display2.record_enable_context(self.ctx, self.handler)
         self.display2.record_free_context(self.ctx)
+        self.ctx = None
+
+    def events(self):
+        """
+        Returns an asynchronous iterator over the key events, to be used
+        instead of :meth:`start` by *asyncio* programs::
+
+            async for event in listener.events():
+                print(event)
+
+        The events are ``('tap', keycode, character, press)`` tuples; the
+        iteration ends when the listener is stopped. Breaking out of the loop
+        stops the listener only once the iterator is closed; see
+        :func:`pymouse.x11_async.listen`.
+        """
+        from pymouse.x11_async import listen
+        return listen(self)
+
+    def _prepare(self):
+        """Creates the record context if necessary, and grabs the keyboard if
+        capturing was asked for.
+        """
+        if self.ctx is None:
+            if self.display2 is None:
+                self.display2 = Display(self._display_name)
+            self.ctx = self.display2.record_create_context(
+                0, [record.AllClients], [record_range(KEY_EVENTS)])
+        self._grab()
+
+    def _grab(self):
+        """Grabs the keyboard if capturing was asked for."""
+        if self.capture:
+            display = self.display2 if self.display2 is not None else self.display
+            display.screen().root.grab_keyboard(X.KeyPressMask | X.KeyReleaseMask, X.GrabModeAsync, X.GrabModeAsync, X.CurrentTime)
 
     def stop(self):
         """Stop listening for keyboard input events."""
-        self.state = False
+        PyKeyboardEventMeta.stop(self)
+        if self._input is not None and self._input.state:
+            self._input.stop()
         with display_manager(self.display) as d:
-            d.record_disable_context(self.ctx)
-            d.ungrab_keyboard(X.CurrentTime)
-        with display_manager(self.display2):
-            d.record_disable_context(self.ctx)
+            if self.ctx is not None:
+                d.record_disable_context(self.ctx)
             d.ungrab_keyboard(X.CurrentTime)
+        if self.display2 is not None:
+            with display_manager(self.display2) as d:
+                if self.ctx is not None:
+                    d.record_disable_context(self.ctx)
+                d.ungrab_keyboard(X.CurrentTime)
+
+    def close(self):
+        """Releases the connections to the *X* server. The listener must have
+        been stopped, or never started.
+        """
+        if self.display is not None:
+            close_display(self.display)
+            if self.display2 is not None:
+                close_display(self.display2)
+            self.display = self.display2 = None
 
     def handler(self, reply):
         """Upper level handler of keyboard events."""
-        data = reply.data
-        while len(data):
-            event, data = rq.EventField(None).parse_binary_value(data, self.display.display, None, None)
+        if self._batch_hook:
+            self._handle_batch(
+                record_batch(reply, self.display, self.batch_format))
+        else:
+            self.handle_events(record_events(reply, self.display))
+
+    def handle_events(self, events):
+        """Handles a batch of recorded key events; see
+        :func:`pymouse.x11_record.record_events`.
+        """
+        if self._batch_hook:
+            self._handle_batch(event_batch(events, self.batch_format))
+            return
+        self._update_keymap()
+        for event in events:
             if self.escape(event):  # Quit if this returns True
                 self.stop()
             else:
                 self._tap(event)
 
+    def _handle_batch(self, events):
+        """
+        Passes a batch of key events to :meth:`on_batch`, and stops listening
+        afterwards if :meth:`escape` is true for any of them.
+        """
+        self._update_keymap()
+        if len(events):
+            self.on_batch(events)
+            if self._batch_escaped(events):
+                self.stop()
+
+    def _batch_escaped(self, events):
+        """Returns whether :meth:`escape` is true for any event of a batch."""
+        if self.batch_format == 'numpy':
+            if type(self).escape is PyKeyboardEvent.escape:
+                escape = self.lookup_character_keycode('Escape')
+                return bool((events['detail'] == escape).any())
+            size = len(RecordEvent._fields)
+            events = (RecordEvent._make(row[:size])
+                      for row in events.tolist())
+        return any(self.escape(event) for event in events)
+
+    def _update_keymap(self):
+        """Applies the mapping changes the display has been notified of."""
+        #The control connection is private, and besides mapping changes only
+        #receives the input grabbed when capturing
+        self.keymap.update(poll=True, discard=True)
+        if self._mapping_changes:
+            self._apply_mapping_changes()
+
     def _tap(self, event):
         keycode = event.detail
         press_bool = (event.type == X.KeyPress)
 
         #Detect modifier states from event.state
-        for mod, bit in self.modifier_bits.items():
-            self.modifiers[mod] = event.state & bit
+        state = self.modifier_state = event.state & 0xff
+        self.modifiers = self._modifier_views[state]
 
-        if keycode in self.all_mod_keycodes:
+        if self._modifier_keycode_set[keycode]:
             keysym = self.display.keycode_to_keysym(keycode, 0)
             character = self.keysym_to_string[keysym]
         else:
@@ -291,7 +627,19 @@ class PyKeyboardEvent(PyKeyboardEventMeta):
     def lookup_char_from_keycode(self, keycode):
         """
         This will conduct a lookup of the character or string associated with a
-        given keycode.
+        given keycode, under the modifiers of the last key event. If there is
+        none, None is returned and :attr:`unresolved_keysyms` is incremented.
+        """
+        char = self._char_table[
+            keycode << 4 | self._combo_table[self.modifier_state]]
+        if char is None:
+            self.unresolved_keysyms += 1
+        return char
+
+    def _resolve_keysym(self, keycode, combo):
+        """
+        Returns the keysym generated by ``keycode`` under the modifier
+        combination ``combo``; see :meth:`_build_combo_table`.
         """
 
         #TODO: Logic should be strictly adapted from X11's src/KeyBind.c
@@ -299,53 +647,118 @@ class PyKeyboardEvent(PyKeyboardEventMeta):
         #http://tronche.com/gui/x/xlib/input/keyboard-encoding.html
         #Which I suspect is not the whole story and may likely cause bugs
 
+        shift = combo & 1
+        caps_lock = combo & 2 and self.lock_meaning == 'Caps_Lock'
+        shift_lock = combo & 2 and self.lock_meaning == 'Shift_Lock'
+        num_lock = combo & 4
+        mode_switch = combo & 8
+
         keysym_index = 0
         #TODO: Display's Keysyms per keycode count? Do I need this?
         #If the Num_Lock is on, and the keycode corresponds to the keypad
-        if self.modifiers['Num_Lock'] and keycode in self.keypad_keycodes:
-            if self.modifiers['Shift'] or self.modifiers['Shift_Lock']:
+        if num_lock and self._keypad_keycode_set[keycode]:
+            if shift or shift_lock:
                 keysym_index = 0
             else:
                 keysym_index = 1
 
-        elif not self.modifiers['Shift'] and self.modifiers['Caps_Lock']:
+        elif not shift and caps_lock:
             #Use the first keysym if uppercase or uncased
             #Use the uppercase keysym if the first is lowercase (second)
             keysym_index = 0
             keysym = self.display.keycode_to_keysym(keycode, keysym_index)
-            #TODO: Support Unicode, Greek, and special latin characters
-            if keysym & 0x7f == keysym and chr(keysym) in 'abcdefghijklmnopqrstuvwxyz':
+            char = keysym_to_character(keysym)
+            if char is not None and char.islower():
                 keysym_index = 1
 
-        elif self.modifiers['Shift'] and self.modifiers['Caps_Lock']:
+        elif shift and caps_lock:
             keysym_index = 1
             keysym = self.display.keycode_to_keysym(keycode, keysym_index)
-            #TODO: Support Unicode, Greek, and special latin characters
-            if keysym & 0x7f == keysym and chr(keysym) in 'ABCDEFGHIJKLMNOPQRSTUVWXYZ':
+            char = keysym_to_character(keysym)
+            if char is not None and char.isupper():
                 keysym_index = 0
 
-        elif self.modifiers['Shift'] or self.modifiers['Shift_Lock']:
+        elif shift or shift_lock:
             keysym_index = 1
 
-        if self.modifiers['Mode_switch']:
+        if mode_switch:
             keysym_index += 2
 
         #Finally! Get the keysym
-        keysym = self.display.keycode_to_keysym(keycode, keysym_index)
+        return self.display.keycode_to_keysym(keycode, keysym_index)
 
+    def _keysym_char(self, keysym):
+        """Returns the character or name of a keysym, or None."""
         #If the character is ascii printable, return that character
         if keysym & 0x7f == keysym and self.ascii_printable(keysym):
             return chr(keysym)
 
-        #If the character was not printable, look for its name
-        try:
-            char = self.keysym_to_string[keysym]
-        except KeyError:
-            print('Unable to determine character.')
-            print('Keycode: {0} KeySym {1}'.format(keycode, keysym))
-            return None
-        else:
-            return char
+        #Otherwise look for its Unicode character, or else for its name
+        char = keysym_to_character(keysym)
+        if char is None:
+            char = self.keysym_to_string.get(keysym)
+        return char
+
+    def _build_combo_table(self):
+        """
+        Maps each of the 256 modifier masks to the combination of the
+        modifiers that select the character of a key: Shift (1), Lock (2),
+        Num_Lock (4) and Mode_switch (8).
+        """
+        bits = self.modifier_bits
+        masks = ((bits['Shift'], 1), (bits['Lock'], 2),
+                 (bits['Num_Lock'], 4), (bits['Mode_switch'], 8))
+        self._combo_table = bytes(
+            sum(combo for mask, combo in masks if state & mask)
+            for state in range(256))
+
+    def _build_char_table(self, first=None, last=None):
+        """
+        Resolves the characters of the keycodes from ``first`` to ``last``,
+        by default all of them, under all 16 modifier combinations. The
+        character of ``keycode`` under ``combo`` is then found at index
+        ``keycode << 4 | combo``.
+        """
+        info = self.display.display.info
+        size = (info.max_keycode + 1) << 4
+        if len(self._char_table) != size:
+            self._char_table = [None] * size
+            first = last = None
+        if first is None:
+            first, last = info.min_keycode, info.max_keycode
+        chars = self._char_table
+        for keycode in range(max(first, info.min_keycode),
+                             min(last, info.max_keycode) + 1):
+            for combo in range(16):
+                chars[keycode << 4 | combo] = self._keysym_char(
+                    self._resolve_keysym(keycode, combo))
+
+    def _mapping_changed(self, event):
+        """Called by the keymap when the mapping of the display changes."""
+        self._mapping_changes.append(event)
+
+    def _apply_mapping_changes(self):
+        """
+        Updates the tables after mapping changes: the keys are configured
+        anew if the modifier mapping changed, and only the characters of the
+        keycodes affected are resolved again if the keyboard mapping changed.
+        """
+        changes, self._mapping_changes = self._mapping_changes, []
+        if any(event.request != X.MappingKeyboard for event in changes):
+            self.configure_keys()
+            return
+
+        keypad = set(self.keypad_keycodes)
+        self.keypad_keycodes = [self.lookup_character_keycode('KP_' + name)
+                                for name in self._keypad_names]
+        self._build_modifier_tables()
+        for event in changes:
+            self._build_char_table(
+                event.first_keycode, event.first_keycode + event.count - 1)
+        #Keys joining or leaving the keypad decode differently with Num_Lock
+        for keycode in keypad.symmetric_difference(self.keypad_keycodes):
+            if keycode:
+                self._build_char_table(keycode, keycode)
 
     def escape(self, event):
         if event.detail == self.lookup_character_keycode('Escape'):
@@ -441,44 +854,49 @@ class PyKeyboardEvent(PyKeyboardEventMeta):
 
         #Acquire the full list of keypad keycodes
         self.keypad_keycodes = []
-        keypad = ['Space', 'Tab', 'Enter', 'F1', 'F2', 'F3', 'F4', 'Home',
-                  'Left', 'Up', 'Right', 'Down', 'Prior', 'Page_Up', 'Next',
-                  'Page_Down', 'End', 'Begin', 'Insert', 'Delete', 'Equal',
-                  'Multiply', 'Add', 'Separator', 'Subtract', 'Decimal',
-                  'Divide', '0', '1', '2', '3', '4', '5', '6', '7', '8', '9']
-        for keyname in keypad:
+        for keyname in self._keypad_names:
             keypad_keycode = self.lookup_character_keycode('KP_' + keyname)
             self.keypad_keycodes.append(keypad_keycode)
 
+        self._build_modifier_tables()
+        self._build_combo_table()
+        self._build_char_table()
+
+    def _build_modifier_tables(self):
+        """
+        Precomputes the read-only :attr:`modifiers` view of every modifier
+        mask, and the sets of modifier and keypad keycodes as bitsets indexed
+        by keycode, so that decoding a key event does not depend on the number
+        of modifiers.
+        """
+        bits = list(self.modifier_bits.items())
+        self._modifier_views = tuple(
+            MappingProxyType(dict((mod, state & bit) for mod, bit in bits))
+            for state in range(256))
+        self.modifiers = self._modifier_views[self.modifier_state]
+
+        self._modifier_keycode_set = bytearray(256)
+        for keycode in self.all_mod_keycodes:
+            self._modifier_keycode_set[keycode] = 1
+        self._keypad_keycode_set = bytearray(256)
+        for keycode in self.keypad_keycodes:
+            if keycode:
+                self._keypad_keycode_set[keycode] = 1
+
     def lookup_character_keycode(self, character):
         """
         Looks up the keysym for the character then returns the keycode mapping
         for that keysym.
         """
-        keysym = self.string_to_keysym.get(character, 0)
-        if keysym == 0:
-            keysym = self.string_to_keysym.get(KEYSYMS[character], 0)
-        return self.display.keysym_to_keycode(keysym)
+        return self.keymap.keycode(character)
 
     def get_translation_dicts(self):
         """
         Returns dictionaries for the translation of keysyms to strings and from
-        strings to keysyms.
-        """
-        keysym_to_string_dict = {}
-        string_to_keysym_dict = {}
-        #XK loads latin1 and miscellany on its own; load latin2-4 and greek
-        Xlib.XK.load_keysym_group('latin2')
-        Xlib.XK.load_keysym_group('latin3')
-        Xlib.XK.load_keysym_group('latin4')
-        Xlib.XK.load_keysym_group('greek')
-
-        #Make a standard dict and the inverted dict
-        for string, keysym in Xlib.XK.__dict__.items():
-            if string.startswith('XK_'):
-                string_to_keysym_dict[string[3:]] = keysym
-                keysym_to_string_dict[keysym] = string[3:]
-        return keysym_to_string_dict, string_to_keysym_dict
+        strings to keysyms. These are shared by all listeners, and read-only;
+        see :func:`pykeyboard.x11_keymap.translation_tables`.
+        """
+        return translation_tables()
 
     def ascii_printable(self, keysym):
         """
@@ -496,3 +914,84 @@ class PyKeyboardEvent(PyKeyboardEventMeta):
             return False
         else:
             return True
+
+
+def _is_key_event(event):
+    return event.type <= X.KeyRelease
+
+
+class PyInputEvent(Thread):
+    """
+    Listens for both mouse and keyboard input on X11 with a single record
+    connection, and hands the events to a :class:`pymouse.x11.PyMouseEvent`
+    and a :class:`PyKeyboardEvent` in the order they happened::
+
+        mouse = PyMouseEvent(queue=events)
+        keyboard = PyKeyboardEvent(queue=events)
+        PyInputEvent(mouse, keyboard).start()
+
+    The two listeners must not be started themselves; their handler methods,
+    queues, capturing and motion coalescing work as usual. Stopping either of
+    them stops the recording.
+
+    The control connection of the keyboard listener is used by both
+    listeners and decodes the events; the connection of the mouse listener is
+    closed. With the record connection, this makes two connections and one
+    thread, against four connections and two threads for the listeners on
+    their own. Every event is decoded once.
+    """
+    def __init__(self, mouse, keyboard, display=None):
+        Thread.__init__(self)
+        self.daemon = True
+        self.mouse = mouse
+        self.keyboard = keyboard
+        self.state = True
+        mouse._input = keyboard._input = self
+        if mouse.display is not keyboard.display:
+            close_display(mouse.display)
+            mouse.display = keyboard.display
+        self.display = keyboard.display
+        self.display2 = Display(display)
+        self.ctx = None
+
+    def run(self):
+        #Key events come first, then pointer events
+        device_events = (X.KeyPress, self.mouse._wanted_events()[1])
+        self.ctx = self.display2.record_create_context(
+            0, [record.AllClients], [record_range(device_events)])
+        self.mouse._grab()
+        self.keyboard._grab()
+        if self.state:
+            self.display2.record_enable_context(self.ctx, self.handler)
+        self.display2.record_free_context(self.ctx)
+        self.ctx = None
+
+    def handler(self, reply):
+        events = record_events(reply, self.display)
+        for is_key, group in groupby(events, _is_key_event):
+            if is_key:
+                self.keyboard.handle_events(group)
+            else:
+                self.mouse.handle_events(group)
+        if self.state and not (self.mouse.state and self.keyboard.state):
+            self.stop()
+
+    def stop(self):
+        """Stops both listeners and the recording."""
+        self.state = False
+        if self.mouse.state:
+            self.mouse.stop()
+        if self.keyboard.state:
+            self.keyboard.stop()
+        if self.ctx is not None:
+            with display_manager(self.display) as d:
+                d.record_disable_context(self.ctx)
+
+    def close(self):
+        """Releases the record connection to the *X* server. The listener
+        must have been stopped, or never started. The two listeners are not
+        closed; the control connection is closed with the keyboard listener.
+        """
+        if self.display2 is not None:
+            close_display(self.display2)
+            self.display = self.display2 = None
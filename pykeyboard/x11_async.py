@@ -0,0 +1,97 @@
+#Copyright 2013 Paul Barton
+#
+#This program is free software: you can redistribute it and/or modify
+#it under the terms of the GNU General Public License as published by
+#the Free Software Foundation, either version 3 of the License, or
+#(at your option) any later version.
+#
+#This program is distributed in the hope that it will be useful,
+#but WITHOUT ANY WARRANTY; without even the implied warranty of
+#MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#GNU General Public License for more details.
+#
+#You should have received a copy of the GNU General Public License
+#along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+An *asyncio* front-end for PyKeyboard on X11. See :mod:`pymouse.x11_async`.
+"""
+
+import asyncio
+
+from Xlib import X
+from Xlib.ext.xtest import fake_input
+
+from pymouse.x11 import display_batch
+from pymouse.x11_async import sleep_until, sync
+
+from .x11 import PyKeyboard
+
+
+class AsyncPyKeyboard(object):
+    """
+    A PyKeyboard whose methods generating events are coroutines. Intervals
+    between keystrokes are awaited with :func:`asyncio.sleep`, against
+    deadlines so that they do not drift.
+
+    The special key attributes of the wrapped :attr:`keyboard` may be used as
+    keys, for instance ``keyboard.keyboard.tab_key``.
+    """
+    def __init__(self, display=None):
+        self.keyboard = PyKeyboard(display)
+        self.display = self.keyboard.display
+
+    async def _run(self, function, *args, **kwargs):
+        """Queues the events generated by a call of ``function``, and waits
+        for the server to process them.
+        """
+        with display_batch(self.display, sync=False):
+            result = function(*args, **kwargs)
+        await sync(self.display)
+        return result
+
+    def _play(self, ops):
+        """Queues the operations of a compiled plan."""
+        for op in ops:
+            fake_input(self.display, op >> 8, op & 0xff)
+
+    async def press_key(self, character=''):
+        await self._run(self.keyboard.press_key, character)
+
+    async def release_key(self, character=''):
+        await self._run(self.keyboard.release_key, character)
+
+    async def tap_key(self, character='', n=1, interval=0):
+        start = asyncio.get_running_loop().time()
+        for i in range(n):
+            await self._run(self.keyboard.tap_key, character)
+            await sleep_until(start + (i + 1) * interval)
+
+    async def press_keys(self, characters=[]):
+        await self._run(self.keyboard.press_keys, characters)
+
+    async def type_string(self, char_string, interval=0):
+        plan = self.keyboard.compile_string(char_string)
+        shift = self.keyboard.shift_key
+        start = asyncio.get_running_loop().time()
+        count = 0
+        segment = []
+        for op in plan:
+            if interval and op >> 8 == X.KeyPress and op & 0xff != shift:
+                if segment:
+                    await self._run(self._play, segment)
+                    segment = []
+                count += 1
+                await sleep_until(start + count * interval)
+            segment.append(op)
+        if segment:
+            await self._run(self._play, segment)
+
+    def close(self):
+        self.keyboard.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
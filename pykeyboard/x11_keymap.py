@@ -0,0 +1,250 @@
+#Copyright 2013 Paul Barton
+#
+#This program is free software: you can redistribute it and/or modify
+#it under the terms of the GNU General Public License as published by
+#the Free Software Foundation, either version 3 of the License, or
+#(at your option) any later version.
+#
+#This program is distributed in the hope that it will be useful,
+#but WITHOUT ANY WARRANTY; without even the implied warranty of
+#MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#GNU General Public License for more details.
+#
+#You should have received a copy of the GNU General Public License
+#along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+A cache of the keyboard mapping of an *X* display connection, shared by all
+PyKeyboard instances using that connection, and the keysym name tables
+shared by all keyboards and listeners.
+"""
+
+import marshal
+import os
+import threading
+import weakref
+from types import MappingProxyType
+
+from Xlib import X
+import Xlib
+import Xlib.XK
+
+from . import x11_keysyms
+
+
+#: The path of a file caching the keysym name tables between runs, or None.
+#: Loading the tables from the cache skips the introspection of *Xlib.XK*.
+KEYSYM_CACHE = None
+
+#: The keysym groups of *Xlib.XK* named in the tables; latin1 and miscellany
+#: are always loaded by *Xlib*
+KEYSYM_GROUPS = ('latin2', 'latin3', 'latin4', 'greek')
+
+_translation_tables = None
+_translation_tables_lock = threading.Lock()
+
+
+def translation_tables():
+    """
+    Returns the read-only ``(keysym_to_string, string_to_keysym)``
+    dictionaries translating between keysyms and their names, in the keysym
+    groups of :data:`KEYSYM_GROUPS`.
+
+    The tables are built once per process, on first use, from
+    :data:`KEYSYM_CACHE` if it is set and valid, otherwise from *Xlib.XK*.
+    """
+    global _translation_tables
+    if _translation_tables is None:
+        with _translation_tables_lock:
+            if _translation_tables is None:
+                tables = _load_translation_tables()
+                _translation_tables = tuple(
+                    MappingProxyType(table) for table in tables)
+    return _translation_tables
+
+
+def _cache_key():
+    """Identifies what the cached tables were built from."""
+    return (Xlib.__version__, KEYSYM_GROUPS)
+
+
+def _load_translation_tables():
+    """Returns new translation tables, using and updating the cache."""
+    path = KEYSYM_CACHE
+    if path is not None:
+        try:
+            with open(path, 'rb') as cache:
+                key, tables = marshal.loads(cache.read())
+            if key == _cache_key():
+                return tables
+        except (OSError, EOFError, ValueError, TypeError):
+            pass
+
+    keysym_to_string = {}
+    string_to_keysym = {}
+    for group in KEYSYM_GROUPS:
+        Xlib.XK.load_keysym_group(group)
+    #Make a standard dict and the inverted dict
+    for string, keysym in Xlib.XK.__dict__.items():
+        if string.startswith('XK_'):
+            string_to_keysym[string[3:]] = keysym
+            keysym_to_string[keysym] = string[3:]
+    tables = (keysym_to_string, string_to_keysym)
+
+    if path is not None:
+        try:
+            temporary = '{0}.{1}'.format(path, os.getpid())
+            with open(temporary, 'wb') as cache:
+                marshal.dump((_cache_key(), tables), cache)
+            os.replace(temporary, path)
+        except OSError:
+            pass
+    return tables
+
+
+def string_to_keysym(character):
+    """
+    Looks up the keysym for a character or keysym name in the index of
+    :mod:`pykeyboard.x11_keysyms`. A :class:`KeyError` is raised if it is
+    unknown.
+    """
+    keysym = x11_keysyms.lookup(character)
+    if not keysym:
+        raise KeyError(character)
+    return keysym
+
+
+class Keymap(object):
+    """
+    Maps characters and keysym names to the ``(keycode, shift level, group)``
+    that generates them on a display.
+
+    The table is built once from the keyboard mapping of the display, and is
+    rebuilt when the display reports a changed mapping through
+    ``MappingNotify``; :attr:`generation` is then incremented, and the
+    callbacks registered with :meth:`observe` are told what changed. Use
+    :meth:`for_display` to get the instance shared by all users of a display.
+    """
+    def __init__(self, display):
+        self.display = display
+        self.generation = 0
+        self._observers = []
+        self._keysyms = {}
+        self._characters = {}
+        self._build()
+
+    @classmethod
+    def for_display(cls, display):
+        """Returns the keymap shared by all users of ``display``. It is kept
+        by the display, and dropped when the display is closed with
+        :func:`pymouse.x11.close_display`.
+        """
+        try:
+            return display._keymap
+        except AttributeError:
+            keymap = display._keymap = cls(display)
+            return keymap
+
+    def observe(self, callback):
+        """
+        Calls ``callback(event)`` with every ``MappingNotify`` event handled
+        by :meth:`update`, once the table has been rebuilt. The event tells
+        whether the keyboard or the modifier mapping changed, and the range of
+        keycodes affected.
+
+        Only a weak reference to the callback is kept, which must be a bound
+        method.
+        """
+        self._observers.append(weakref.WeakMethod(callback))
+
+    def _build(self):
+        """
+        Builds the keysym table from the keymap cache of the display. When a
+        keysym is generated by several keys, the lowest index and keycode wins,
+        like :meth:`Xlib.display.Display.keysym_to_keycode`.
+        """
+        info = self.display.display.info
+        codes = self.display._keymap_codes[
+            info.min_keycode:info.max_keycode + 1]
+        keysyms = {}
+        for index in range(max(map(len, codes), default=0)):
+            for keycode, syms in enumerate(codes, info.min_keycode):
+                if index < len(syms):
+                    keysym = syms[index]
+                    if keysym != X.NoSymbol and keysym not in keysyms:
+                        keysyms[keysym] = (keycode, index % 2, index // 2)
+        self._keysyms = keysyms
+        self._characters = {}
+
+    def update(self, poll=False, discard=False):
+        """
+        Handles any ``MappingNotify`` events received by the display, and
+        rebuilds the table if the keyboard mapping changed.
+
+        Events are read by the display whenever it waits for the server, for
+        instance when it is sync'd. If ``poll`` is true, the display also
+        checks for events not yet read, without blocking.
+
+        Other events are left in the queue of the display, unless
+        ``discard`` is true; this is meant for connections nobody else reads
+        events from.
+
+        :return: whether the table was rebuilt
+        """
+        display = self.display
+        if poll:
+            pending = display.pending_events()
+        else:
+            pending = display.display.event_queue
+        if not pending:
+            return False
+
+        changes = []
+        lock = display.display.event_queue_write_lock
+        lock.acquire()
+        try:
+            events = display.display.event_queue
+            if any(event.type == X.MappingNotify for event in events):
+                changes = [event for event in events
+                           if event.type == X.MappingNotify]
+                if not discard:
+                    events[:] = [event for event in events
+                                 if event.type != X.MappingNotify]
+            if discard:
+                del events[:]
+        finally:
+            lock.release()
+        for event in changes:
+            display.refresh_keyboard_mapping(event)
+        if changes:
+            self._build()
+            self.generation += 1
+            for observer in list(self._observers):
+                callback = observer()
+                if callback is None:
+                    self._observers.remove(observer)
+                    continue
+                for event in changes:
+                    callback(event)
+        return bool(changes)
+
+    def lookup(self, character):
+        """
+        Returns the ``(keycode, shift level, group)`` that generates
+        ``character``, which is either a character or a keysym name. The
+        keycode is 0 if no key generates it.
+        """
+        try:
+            return self._characters[character]
+        except KeyError:
+            keysym = string_to_keysym(character)
+            entry = self._characters[character] = self._keysyms.get(
+                keysym, (0, 0, 0))
+            return entry
+
+    def keycode(self, character):
+        """Returns the keycode that generates ``character``, or 0."""
+        try:
+            return self._characters[character][0]
+        except KeyError:
+            return self.lookup(character)[0]
@@ -13,843 +13,984 @@
 #
 # You should have received a copy of the GNU General Public License along with
 # this program. If not, see <http://www.gnu.org/licenses/>.
+"""
+An index from characters and keysym names to keysyms, and the table of the
+characters of the keysyms predating Unicode.
 
-KEYSYMS = {
-    u'\u0020': 'space',
-    u'\u0021': 'exclam',
-    u'\u0022': 'quotedbl',
-    u'\u0023': 'numbersign',
-    u'\u0024': 'dollar',
-    u'\u0025': 'percent',
-    u'\u0026': 'ampersand',
-    u'\u0027': 'apostrophe',
-    u'\u0027': 'quoteright',
-    u'\u0028': 'parenleft',
-    u'\u0029': 'parenright',
-    u'\u002a': 'asterisk',
-    u'\u002b': 'plus',
-    u'\u002c': 'comma',
-    u'\u002d': 'minus',
-    u'\u002e': 'period',
-    u'\u002f': 'slash',
-    u'\u0030': '0',
-    u'\u0031': '1',
-    u'\u0032': '2',
-    u'\u0033': '3',
-    u'\u0034': '4',
-    u'\u0035': '5',
-    u'\u0036': '6',
-    u'\u0037': '7',
-    u'\u0038': '8',
-    u'\u0039': '9',
-    u'\u003a': 'colon',
-    u'\u003b': 'semicolon',
-    u'\u003c': 'less',
-    u'\u003d': 'equal',
-    u'\u003e': 'greater',
-    u'\u003f': 'question',
-    u'\u0040': 'at',
-    u'\u0041': 'A',
-    u'\u0042': 'B',
-    u'\u0043': 'C',
-    u'\u0044': 'D',
-    u'\u0045': 'E',
-    u'\u0046': 'F',
-    u'\u0047': 'G',
-    u'\u0048': 'H',
-    u'\u0049': 'I',
-    u'\u004a': 'J',
-    u'\u004b': 'K',
-    u'\u004c': 'L',
-    u'\u004d': 'M',
-    u'\u004e': 'N',
-    u'\u004f': 'O',
-    u'\u0050': 'P',
-    u'\u0051': 'Q',
-    u'\u0052': 'R',
-    u'\u0053': 'S',
-    u'\u0054': 'T',
-    u'\u0055': 'U',
-    u'\u0056': 'V',
-    u'\u0057': 'W',
-    u'\u0058': 'X',
-    u'\u0059': 'Y',
-    u'\u005a': 'Z',
-    u'\u005b': 'bracketleft',
-    u'\u005c': 'backslash',
-    u'\u005d': 'bracketright',
-    u'\u005e': 'asciicircum',
-    u'\u005f': 'underscore',
-    u'\u0060': 'grave',
-    u'\u0060': 'quoteleft',
-    u'\u0061': 'a',
-    u'\u0062': 'b',
-    u'\u0063': 'c',
-    u'\u0064': 'd',
-    u'\u0065': 'e',
-    u'\u0066': 'f',
-    u'\u0067': 'g',
-    u'\u0068': 'h',
-    u'\u0069': 'i',
-    u'\u006a': 'j',
-    u'\u006b': 'k',
-    u'\u006c': 'l',
-    u'\u006d': 'm',
-    u'\u006e': 'n',
-    u'\u006f': 'o',
-    u'\u0070': 'p',
-    u'\u0071': 'q',
-    u'\u0072': 'r',
-    u'\u0073': 's',
-    u'\u0074': 't',
-    u'\u0075': 'u',
-    u'\u0076': 'v',
-    u'\u0077': 'w',
-    u'\u0078': 'x',
-    u'\u0079': 'y',
-    u'\u007a': 'z',
-    u'\u007b': 'braceleft',
-    u'\u007c': 'bar',
-    u'\u007d': 'braceright',
-    u'\u007e': 'asciitilde',
-    u'\u00a0': 'nobreakspace',
-    u'\u00a1': 'exclamdown',
-    u'\u00a2': 'cent',
-    u'\u00a3': 'sterling',
-    u'\u00a4': 'currency',
-    u'\u00a5': 'yen',
-    u'\u00a6': 'brokenbar',
-    u'\u00a7': 'section',
-    u'\u00a8': 'diaeresis',
-    u'\u00a9': 'copyright',
-    u'\u00aa': 'ordfeminine',
-    u'\u00ab': 'guillemotleft',
-    u'\u00ac': 'notsign',
-    u'\u00ad': 'hyphen',
-    u'\u00ae': 'registered',
-    u'\u00af': 'macron',
-    u'\u00b0': 'degree',
-    u'\u00b1': 'plusminus',
-    u'\u00b2': 'twosuperior',
-    u'\u00b3': 'threesuperior',
-    u'\u00b4': 'acute',
-    u'\u00b5': 'mu',
-    u'\u00b6': 'paragraph',
-    u'\u00b7': 'periodcentered',
-    u'\u00b8': 'cedilla',
-    u'\u00b9': 'onesuperior',
-    u'\u00ba': 'masculine',
-    u'\u00bb': 'guillemotright',
-    u'\u00bc': 'onequarter',
-    u'\u00bd': 'onehalf',
-    u'\u00be': 'threequarters',
-    u'\u00bf': 'questiondown',
-    u'\u00c0': 'Agrave',
-    u'\u00c1': 'Aacute',
-    u'\u00c2': 'Acircumflex',
-    u'\u00c3': 'Atilde',
-    u'\u00c4': 'Adiaeresis',
-    u'\u00c5': 'Aring',
-    u'\u00c6': 'AE',
-    u'\u00c7': 'Ccedilla',
-    u'\u00c8': 'Egrave',
-    u'\u00c9': 'Eacute',
-    u'\u00ca': 'Ecircumflex',
-    u'\u00cb': 'Ediaeresis',
-    u'\u00cc': 'Igrave',
-    u'\u00cd': 'Iacute',
-    u'\u00ce': 'Icircumflex',
-    u'\u00cf': 'Idiaeresis',
-    u'\u00d0': 'ETH',
-    u'\u00d0': 'Eth',
-    u'\u00d1': 'Ntilde',
-    u'\u00d2': 'Ograve',
-    u'\u00d3': 'Oacute',
-    u'\u00d4': 'Ocircumflex',
-    u'\u00d5': 'Otilde',
-    u'\u00d6': 'Odiaeresis',
-    u'\u00d7': 'multiply',
-    u'\u00d8': 'Ooblique',
-    u'\u00d9': 'Ugrave',
-    u'\u00da': 'Uacute',
-    u'\u00db': 'Ucircumflex',
-    u'\u00dc': 'Udiaeresis',
-    u'\u00dd': 'Yacute',
-    u'\u00de': 'THORN',
-    u'\u00de': 'Thorn',
-    u'\u00df': 'ssharp',
-    u'\u00e0': 'agrave',
-    u'\u00e1': 'aacute',
-    u'\u00e2': 'acircumflex',
-    u'\u00e3': 'atilde',
-    u'\u00e4': 'adiaeresis',
-    u'\u00e5': 'aring',
-    u'\u00e6': 'ae',
-    u'\u00e7': 'ccedilla',
-    u'\u00e8': 'egrave',
-    u'\u00e9': 'eacute',
-    u'\u00ea': 'ecircumflex',
-    u'\u00eb': 'ediaeresis',
-    u'\u00ec': 'igrave',
-    u'\u00ed': 'iacute',
-    u'\u00ee': 'icircumflex',
-    u'\u00ef': 'idiaeresis',
-    u'\u00f0': 'eth',
-    u'\u00f1': 'ntilde',
-    u'\u00f2': 'ograve',
-    u'\u00f3': 'oacute',
-    u'\u00f4': 'ocircumflex',
-    u'\u00f5': 'otilde',
-    u'\u00f6': 'odiaeresis',
-    u'\u00f7': 'division',
-    u'\u00f8': 'oslash',
-    u'\u00f9': 'ugrave',
-    u'\u00fa': 'uacute',
-    u'\u00fb': 'ucircumflex',
-    u'\u00fc': 'udiaeresis',
-    u'\u00fd': 'yacute',
-    u'\u00fe': 'thorn',
-    u'\u00ff': 'ydiaeresis',
-    u'\u0104': 'Aogonek',
-    u'\u02d8': 'breve',
-    u'\u0141': 'Lstroke',
-    u'\u013d': 'Lcaron',
-    u'\u015a': 'Sacute',
-    u'\u0160': 'Scaron',
-    u'\u015e': 'Scedilla',
-    u'\u0164': 'Tcaron',
-    u'\u0179': 'Zacute',
-    u'\u017d': 'Zcaron',
-    u'\u017b': 'Zabovedot',
-    u'\u0105': 'aogonek',
-    u'\u02db': 'ogonek',
-    u'\u0142': 'lstroke',
-    u'\u013e': 'lcaron',
-    u'\u015b': 'sacute',
-    u'\u02c7': 'caron',
-    u'\u0161': 'scaron',
-    u'\u015f': 'scedilla',
-    u'\u0165': 'tcaron',
-    u'\u017a': 'zacute',
-    u'\u02dd': 'doubleacute',
-    u'\u017e': 'zcaron',
-    u'\u017c': 'zabovedot',
-    u'\u0154': 'Racute',
-    u'\u0102': 'Abreve',
-    u'\u0139': 'Lacute',
-    u'\u0106': 'Cacute',
-    u'\u010c': 'Ccaron',
-    u'\u0118': 'Eogonek',
-    u'\u011a': 'Ecaron',
-    u'\u010e': 'Dcaron',
-    u'\u0110': 'Dstroke',
-    u'\u0143': 'Nacute',
-    u'\u0147': 'Ncaron',
-    u'\u0150': 'Odoubleacute',
-    u'\u0158': 'Rcaron',
-    u'\u016e': 'Uring',
-    u'\u0170': 'Udoubleacute',
-    u'\u0162': 'Tcedilla',
-    u'\u0155': 'racute',
-    u'\u0103': 'abreve',
-    u'\u013a': 'lacute',
-    u'\u0107': 'cacute',
-    u'\u010d': 'ccaron',
-    u'\u0119': 'eogonek',
-    u'\u011b': 'ecaron',
-    u'\u010f': 'dcaron',
-    u'\u0111': 'dstroke',
-    u'\u0144': 'nacute',
-    u'\u0148': 'ncaron',
-    u'\u0151': 'odoubleacute',
-    u'\u0159': 'rcaron',
-    u'\u016f': 'uring',
-    u'\u0171': 'udoubleacute',
-    u'\u0163': 'tcedilla',
-    u'\u02d9': 'abovedot',
-    u'\u0126': 'Hstroke',
-    u'\u0124': 'Hcircumflex',
-    u'\u0130': 'Iabovedot',
-    u'\u011e': 'Gbreve',
-    u'\u0134': 'Jcircumflex',
-    u'\u0127': 'hstroke',
-    u'\u0125': 'hcircumflex',
-    u'\u0131': 'idotless',
-    u'\u011f': 'gbreve',
-    u'\u0135': 'jcircumflex',
-    u'\u010a': 'Cabovedot',
-    u'\u0108': 'Ccircumflex',
-    u'\u0120': 'Gabovedot',
-    u'\u011c': 'Gcircumflex',
-    u'\u016c': 'Ubreve',
-    u'\u015c': 'Scircumflex',
-    u'\u010b': 'cabovedot',
-    u'\u0109': 'ccircumflex',
-    u'\u0121': 'gabovedot',
-    u'\u011d': 'gcircumflex',
-    u'\u016d': 'ubreve',
-    u'\u015d': 'scircumflex',
-    u'\u0138': 'kra',
-    u'\u0156': 'Rcedilla',
-    u'\u0128': 'Itilde',
-    u'\u013b': 'Lcedilla',
-    u'\u0112': 'Emacron',
-    u'\u0122': 'Gcedilla',
-    u'\u0166': 'Tslash',
-    u'\u0157': 'rcedilla',
-    u'\u0129': 'itilde',
-    u'\u013c': 'lcedilla',
-    u'\u0113': 'emacron',
-    u'\u0123': 'gcedilla',
-    u'\u0167': 'tslash',
-    u'\u014a': 'ENG',
-    u'\u014b': 'eng',
-    u'\u0100': 'Amacron',
-    u'\u012e': 'Iogonek',
-    u'\u0116': 'Eabovedot',
-    u'\u012a': 'Imacron',
-    u'\u0145': 'Ncedilla',
-    u'\u014c': 'Omacron',
-    u'\u0136': 'Kcedilla',
-    u'\u0172': 'Uogonek',
-    u'\u0168': 'Utilde',
-    u'\u016a': 'Umacron',
-    u'\u0101': 'amacron',
-    u'\u012f': 'iogonek',
-    u'\u0117': 'eabovedot',
-    u'\u012b': 'imacron',
-    u'\u0146': 'ncedilla',
-    u'\u014d': 'omacron',
-    u'\u0137': 'kcedilla',
-    u'\u0173': 'uogonek',
-    u'\u0169': 'utilde',
-    u'\u016b': 'umacron',
-    u'\u203e': 'overline',
-    u'\u3002': 'kana_fullstop',
-    u'\u300c': 'kana_openingbracket',
-    u'\u300d': 'kana_closingbracket',
-    u'\u3001': 'kana_comma',
-    u'\u30fb': 'kana_conjunctive',
-    u'\u30f2': 'kana_WO',
-    u'\u30a1': 'kana_a',
-    u'\u30a3': 'kana_i',
-    u'\u30a5': 'kana_u',
-    u'\u30a7': 'kana_e',
-    u'\u30a9': 'kana_o',
-    u'\u30e3': 'kana_ya',
-    u'\u30e5': 'kana_yu',
-    u'\u30e7': 'kana_yo',
-    u'\u30c3': 'kana_tsu',
-    u'\u30fc': 'prolongedsound',
-    u'\u30a2': 'kana_A',
-    u'\u30a4': 'kana_I',
-    u'\u30a6': 'kana_U',
-    u'\u30a8': 'kana_E',
-    u'\u30aa': 'kana_O',
-    u'\u30ab': 'kana_KA',
-    u'\u30ad': 'kana_KI',
-    u'\u30af': 'kana_KU',
-    u'\u30b1': 'kana_KE',
-    u'\u30b3': 'kana_KO',
-    u'\u30b5': 'kana_SA',
-    u'\u30b7': 'kana_SHI',
-    u'\u30b9': 'kana_SU',
-    u'\u30bb': 'kana_SE',
-    u'\u30bd': 'kana_SO',
-    u'\u30bf': 'kana_TA',
-    u'\u30c1': 'kana_CHI',
-    u'\u30c4': 'kana_TSU',
-    u'\u30c6': 'kana_TE',
-    u'\u30c8': 'kana_TO',
-    u'\u30ca': 'kana_NA',
-    u'\u30cb': 'kana_NI',
-    u'\u30cc': 'kana_NU',
-    u'\u30cd': 'kana_NE',
-    u'\u30ce': 'kana_NO',
-    u'\u30cf': 'kana_HA',
-    u'\u30d2': 'kana_HI',
-    u'\u30d5': 'kana_FU',
-    u'\u30d8': 'kana_HE',
-    u'\u30db': 'kana_HO',
-    u'\u30de': 'kana_MA',
-    u'\u30df': 'kana_MI',
-    u'\u30e0': 'kana_MU',
-    u'\u30e1': 'kana_ME',
-    u'\u30e2': 'kana_MO',
-    u'\u30e4': 'kana_YA',
-    u'\u30e6': 'kana_YU',
-    u'\u30e8': 'kana_YO',
-    u'\u30e9': 'kana_RA',
-    u'\u30ea': 'kana_RI',
-    u'\u30eb': 'kana_RU',
-    u'\u30ec': 'kana_RE',
-    u'\u30ed': 'kana_RO',
-    u'\u30ef': 'kana_WA',
-    u'\u30f3': 'kana_N',
-    u'\u309b': 'voicedsound',
-    u'\u309c': 'semivoicedsound',
-    u'\u060c': 'Arabic_comma',
-    u'\u061b': 'Arabic_semicolon',
-    u'\u061f': 'Arabic_question_mark',
-    u'\u0621': 'Arabic_hamza',
-    u'\u0622': 'Arabic_maddaonalef',
-    u'\u0623': 'Arabic_hamzaonalef',
-    u'\u0624': 'Arabic_hamzaonwaw',
-    u'\u0625': 'Arabic_hamzaunderalef',
-    u'\u0626': 'Arabic_hamzaonyeh',
-    u'\u0627': 'Arabic_alef',
-    u'\u0628': 'Arabic_beh',
-    u'\u0629': 'Arabic_tehmarbuta',
-    u'\u062a': 'Arabic_teh',
-    u'\u062b': 'Arabic_theh',
-    u'\u062c': 'Arabic_jeem',
-    u'\u062d': 'Arabic_hah',
-    u'\u062e': 'Arabic_khah',
-    u'\u062f': 'Arabic_dal',
-    u'\u0630': 'Arabic_thal',
-    u'\u0631': 'Arabic_ra',
-    u'\u0632': 'Arabic_zain',
-    u'\u0633': 'Arabic_seen',
-    u'\u0634': 'Arabic_sheen',
-    u'\u0635': 'Arabic_sad',
-    u'\u0636': 'Arabic_dad',
-    u'\u0637': 'Arabic_tah',
-    u'\u0638': 'Arabic_zah',
-    u'\u0639': 'Arabic_ain',
-    u'\u063a': 'Arabic_ghain',
-    u'\u0640': 'Arabic_tatweel',
-    u'\u0641': 'Arabic_feh',
-    u'\u0642': 'Arabic_qaf',
-    u'\u0643': 'Arabic_kaf',
-    u'\u0644': 'Arabic_lam',
-    u'\u0645': 'Arabic_meem',
-    u'\u0646': 'Arabic_noon',
-    u'\u0647': 'Arabic_ha',
-    u'\u0648': 'Arabic_waw',
-    u'\u0649': 'Arabic_alefmaksura',
-    u'\u064a': 'Arabic_yeh',
-    u'\u064b': 'Arabic_fathatan',
-    u'\u064c': 'Arabic_dammatan',
-    u'\u064d': 'Arabic_kasratan',
-    u'\u064e': 'Arabic_fatha',
-    u'\u064f': 'Arabic_damma',
-    u'\u0650': 'Arabic_kasra',
-    u'\u0651': 'Arabic_shadda',
-    u'\u0652': 'Arabic_sukun',
-    u'\u0452': 'Serbian_dje',
-    u'\u0453': 'Macedonia_gje',
-    u'\u0451': 'Cyrillic_io',
-    u'\u0454': 'Ukrainian_ie',
-    u'\u0455': 'Macedonia_dse',
-    u'\u0456': 'Ukrainian_i',
-    u'\u0457': 'Ukrainian_yi',
-    u'\u0458': 'Cyrillic_je',
-    u'\u0459': 'Cyrillic_lje',
-    u'\u045a': 'Cyrillic_nje',
-    u'\u045b': 'Serbian_tshe',
-    u'\u045c': 'Macedonia_kje',
-    u'\u045e': 'Byelorussian_shortu',
-    u'\u045f': 'Cyrillic_dzhe',
-    u'\u2116': 'numerosign',
-    u'\u0402': 'Serbian_DJE',
-    u'\u0403': 'Macedonia_GJE',
-    u'\u0401': 'Cyrillic_IO',
-    u'\u0404': 'Ukrainian_IE',
-    u'\u0405': 'Macedonia_DSE',
-    u'\u0406': 'Ukrainian_I',
-    u'\u0407': 'Ukrainian_YI',
-    u'\u0408': 'Cyrillic_JE',
-    u'\u0409': 'Cyrillic_LJE',
-    u'\u040a': 'Cyrillic_NJE',
-    u'\u040b': 'Serbian_TSHE',
-    u'\u040c': 'Macedonia_KJE',
-    u'\u040e': 'Byelorussian_SHORTU',
-    u'\u040f': 'Cyrillic_DZHE',
-    u'\u044e': 'Cyrillic_yu',
-    u'\u0430': 'Cyrillic_a',
-    u'\u0431': 'Cyrillic_be',
-    u'\u0446': 'Cyrillic_tse',
-    u'\u0434': 'Cyrillic_de',
-    u'\u0435': 'Cyrillic_ie',
-    u'\u0444': 'Cyrillic_ef',
-    u'\u0433': 'Cyrillic_ghe',
-    u'\u0445': 'Cyrillic_ha',
-    u'\u0438': 'Cyrillic_i',
-    u'\u0439': 'Cyrillic_shorti',
-    u'\u043a': 'Cyrillic_ka',
-    u'\u043b': 'Cyrillic_el',
-    u'\u043c': 'Cyrillic_em',
-    u'\u043d': 'Cyrillic_en',
-    u'\u043e': 'Cyrillic_o',
-    u'\u043f': 'Cyrillic_pe',
-    u'\u044f': 'Cyrillic_ya',
-    u'\u0440': 'Cyrillic_er',
-    u'\u0441': 'Cyrillic_es',
-    u'\u0442': 'Cyrillic_te',
-    u'\u0443': 'Cyrillic_u',
-    u'\u0436': 'Cyrillic_zhe',
-    u'\u0432': 'Cyrillic_ve',
-    u'\u044c': 'Cyrillic_softsign',
-    u'\u044b': 'Cyrillic_yeru',
-    u'\u0437': 'Cyrillic_ze',
-    u'\u0448': 'Cyrillic_sha',
-    u'\u044d': 'Cyrillic_e',
-    u'\u0449': 'Cyrillic_shcha',
-    u'\u0447': 'Cyrillic_che',
-    u'\u044a': 'Cyrillic_hardsign',
-    u'\u042e': 'Cyrillic_YU',
-    u'\u0410': 'Cyrillic_A',
-    u'\u0411': 'Cyrillic_BE',
-    u'\u0426': 'Cyrillic_TSE',
-    u'\u0414': 'Cyrillic_DE',
-    u'\u0415': 'Cyrillic_IE',
-    u'\u0424': 'Cyrillic_EF',
-    u'\u0413': 'Cyrillic_GHE',
-    u'\u0425': 'Cyrillic_HA',
-    u'\u0418': 'Cyrillic_I',
-    u'\u0419': 'Cyrillic_SHORTI',
-    u'\u041a': 'Cyrillic_KA',
-    u'\u041b': 'Cyrillic_EL',
-    u'\u041c': 'Cyrillic_EM',
-    u'\u041d': 'Cyrillic_EN',
-    u'\u041e': 'Cyrillic_O',
-    u'\u041f': 'Cyrillic_PE',
-    u'\u042f': 'Cyrillic_YA',
-    u'\u0420': 'Cyrillic_ER',
-    u'\u0421': 'Cyrillic_ES',
-    u'\u0422': 'Cyrillic_TE',
-    u'\u0423': 'Cyrillic_U',
-    u'\u0416': 'Cyrillic_ZHE',
-    u'\u0412': 'Cyrillic_VE',
-    u'\u042c': 'Cyrillic_SOFTSIGN',
-    u'\u042b': 'Cyrillic_YERU',
-    u'\u0417': 'Cyrillic_ZE',
-    u'\u0428': 'Cyrillic_SHA',
-    u'\u042d': 'Cyrillic_E',
-    u'\u0429': 'Cyrillic_SHCHA',
-    u'\u0427': 'Cyrillic_CHE',
-    u'\u042a': 'Cyrillic_HARDSIGN',
-    u'\u0386': 'Greek_ALPHAaccent',
-    u'\u0388': 'Greek_EPSILONaccent',
-    u'\u0389': 'Greek_ETAaccent',
-    u'\u038a': 'Greek_IOTAaccent',
-    u'\u03aa': 'Greek_IOTAdiaeresis',
-    u'\u038c': 'Greek_OMICRONaccent',
-    u'\u038e': 'Greek_UPSILONaccent',
-    u'\u03ab': 'Greek_UPSILONdieresis',
-    u'\u038f': 'Greek_OMEGAaccent',
-    u'\u0385': 'Greek_accentdieresis',
-    u'\u2015': 'Greek_horizbar',
-    u'\u03ac': 'Greek_alphaaccent',
-    u'\u03ad': 'Greek_epsilonaccent',
-    u'\u03ae': 'Greek_etaaccent',
-    u'\u03af': 'Greek_iotaaccent',
-    u'\u03ca': 'Greek_iotadieresis',
-    u'\u0390': 'Greek_iotaaccentdieresis',
-    u'\u03cc': 'Greek_omicronaccent',
-    u'\u03cd': 'Greek_upsilonaccent',
-    u'\u03cb': 'Greek_upsilondieresis',
-    u'\u03b0': 'Greek_upsilonaccentdieresis',
-    u'\u03ce': 'Greek_omegaaccent',
-    u'\u0391': 'Greek_ALPHA',
-    u'\u0392': 'Greek_BETA',
-    u'\u0393': 'Greek_GAMMA',
-    u'\u0394': 'Greek_DELTA',
-    u'\u0395': 'Greek_EPSILON',
-    u'\u0396': 'Greek_ZETA',
-    u'\u0397': 'Greek_ETA',
-    u'\u0398': 'Greek_THETA',
-    u'\u0399': 'Greek_IOTA',
-    u'\u039a': 'Greek_KAPPA',
-    u'\u039b': 'Greek_LAMBDA',
-    u'\u039b': 'Greek_LAMDA',
-    u'\u039c': 'Greek_MU',
-    u'\u039d': 'Greek_NU',
-    u'\u039e': 'Greek_XI',
-    u'\u039f': 'Greek_OMICRON',
-    u'\u03a0': 'Greek_PI',
-    u'\u03a1': 'Greek_RHO',
-    u'\u03a3': 'Greek_SIGMA',
-    u'\u03a4': 'Greek_TAU',
-    u'\u03a5': 'Greek_UPSILON',
-    u'\u03a6': 'Greek_PHI',
-    u'\u03a7': 'Greek_CHI',
-    u'\u03a8': 'Greek_PSI',
-    u'\u03a9': 'Greek_OMEGA',
-    u'\u03b1': 'Greek_alpha',
-    u'\u03b2': 'Greek_beta',
-    u'\u03b3': 'Greek_gamma',
-    u'\u03b4': 'Greek_delta',
-    u'\u03b5': 'Greek_epsilon',
-    u'\u03b6': 'Greek_zeta',
-    u'\u03b7': 'Greek_eta',
-    u'\u03b8': 'Greek_theta',
-    u'\u03b9': 'Greek_iota',
-    u'\u03ba': 'Greek_kappa',
-    u'\u03bb': 'Greek_lambda',
-    u'\u03bc': 'Greek_mu',
-    u'\u03bd': 'Greek_nu',
-    u'\u03be': 'Greek_xi',
-    u'\u03bf': 'Greek_omicron',
-    u'\u03c0': 'Greek_pi',
-    u'\u03c1': 'Greek_rho',
-    u'\u03c3': 'Greek_sigma',
-    u'\u03c2': 'Greek_finalsmallsigma',
-    u'\u03c4': 'Greek_tau',
-    u'\u03c5': 'Greek_upsilon',
-    u'\u03c6': 'Greek_phi',
-    u'\u03c7': 'Greek_chi',
-    u'\u03c8': 'Greek_psi',
-    u'\u03c9': 'Greek_omega',
-    u'\u23b7': 'leftradical',
-    u'\u2320': 'topintegral',
-    u'\u2321': 'botintegral',
-    u'\u23a1': 'topleftsqbracket',
-    u'\u23a3': 'botleftsqbracket',
-    u'\u23a4': 'toprightsqbracket',
-    u'\u23a6': 'botrightsqbracket',
-    u'\u239b': 'topleftparens',
-    u'\u239d': 'botleftparens',
-    u'\u239e': 'toprightparens',
-    u'\u23a0': 'botrightparens',
-    u'\u23a8': 'leftmiddlecurlybrace',
-    u'\u23ac': 'rightmiddlecurlybrace',
-    u'\u2264': 'lessthanequal',
-    u'\u2260': 'notequal',
-    u'\u2265': 'greaterthanequal',
-    u'\u222b': 'integral',
-    u'\u2234': 'therefore',
-    u'\u221d': 'variation',
-    u'\u221e': 'infinity',
-    u'\u2207': 'nabla',
-    u'\u223c': 'approximate',
-    u'\u2243': 'similarequal',
-    u'\u21d4': 'ifonlyif',
-    u'\u21d2': 'implies',
-    u'\u2261': 'identical',
-    u'\u221a': 'radical',
-    u'\u2282': 'includedin',
-    u'\u2283': 'includes',
-    u'\u2229': 'intersection',
-    u'\u222a': 'union',
-    u'\u2227': 'logicaland',
-    u'\u2228': 'logicalor',
-    u'\u2202': 'partialderivative',
-    u'\u0192': 'function',
-    u'\u2190': 'leftarrow',
-    u'\u2191': 'uparrow',
-    u'\u2192': 'rightarrow',
-    u'\u2193': 'downarrow',
-    u'\u25c6': 'soliddiamond',
-    u'\u2592': 'checkerboard',
-    u'\u2409': 'ht',
-    u'\u240c': 'ff',
-    u'\u240d': 'cr',
-    u'\u240a': 'lf',
-    u'\u2424': 'nl',
-    u'\u240b': 'vt',
-    u'\u2518': 'lowrightcorner',
-    u'\u2510': 'uprightcorner',
-    u'\u250c': 'upleftcorner',
-    u'\u2514': 'lowleftcorner',
-    u'\u253c': 'crossinglines',
-    u'\u23ba': 'horizlinescan1',
-    u'\u23bb': 'horizlinescan3',
-    u'\u2500': 'horizlinescan5',
-    u'\u23bc': 'horizlinescan7',
-    u'\u23bd': 'horizlinescan9',
-    u'\u251c': 'leftt',
-    u'\u2524': 'rightt',
-    u'\u2534': 'bott',
-    u'\u252c': 'topt',
-    u'\u2502': 'vertbar',
-    u'\u2003': 'emspace',
-    u'\u2002': 'enspace',
-    u'\u2004': 'em3space',
-    u'\u2005': 'em4space',
-    u'\u2007': 'digitspace',
-    u'\u2008': 'punctspace',
-    u'\u2009': 'thinspace',
-    u'\u200a': 'hairspace',
-    u'\u2014': 'emdash',
-    u'\u2013': 'endash',
-    u'\u2026': 'ellipsis',
-    u'\u2025': 'doubbaselinedot',
-    u'\u2153': 'onethird',
-    u'\u2154': 'twothirds',
-    u'\u2155': 'onefifth',
-    u'\u2156': 'twofifths',
-    u'\u2157': 'threefifths',
-    u'\u2158': 'fourfifths',
-    u'\u2159': 'onesixth',
-    u'\u215a': 'fivesixths',
-    u'\u2105': 'careof',
-    u'\u2012': 'figdash',
-    u'\u215b': 'oneeighth',
-    u'\u215c': 'threeeighths',
-    u'\u215d': 'fiveeighths',
-    u'\u215e': 'seveneighths',
-    u'\u2122': 'trademark',
-    u'\u2018': 'leftsinglequotemark',
-    u'\u2019': 'rightsinglequotemark',
-    u'\u201c': 'leftdoublequotemark',
-    u'\u201d': 'rightdoublequotemark',
-    u'\u211e': 'prescription',
-    u'\u2032': 'minutes',
-    u'\u2033': 'seconds',
-    u'\u271d': 'latincross',
-    u'\u2663': 'club',
-    u'\u2666': 'diamond',
-    u'\u2665': 'heart',
-    u'\u2720': 'maltesecross',
-    u'\u2020': 'dagger',
-    u'\u2021': 'doubledagger',
-    u'\u2713': 'checkmark',
-    u'\u2717': 'ballotcross',
-    u'\u266f': 'musicalsharp',
-    u'\u266d': 'musicalflat',
-    u'\u2642': 'malesymbol',
-    u'\u2640': 'femalesymbol',
-    u'\u260e': 'telephone',
-    u'\u2315': 'telephonerecorder',
-    u'\u2117': 'phonographcopyright',
-    u'\u2038': 'caret',
-    u'\u201a': 'singlelowquotemark',
-    u'\u201e': 'doublelowquotemark',
-    u'\u22a5': 'downtack',
-    u'\u230a': 'downstile',
-    u'\u2218': 'jot',
-    u'\u2395': 'quad',
-    u'\u22a4': 'uptack',
-    u'\u25cb': 'circle',
-    u'\u2308': 'upstile',
-    u'\u22a2': 'lefttack',
-    u'\u22a3': 'righttack',
-    u'\u2017': 'hebrew_doublelowline',
-    u'\u05d0': 'hebrew_aleph',
-    u'\u05d1': 'hebrew_bet',
-    u'\u05d1': 'hebrew_beth',
-    u'\u05d2': 'hebrew_gimel',
-    u'\u05d2': 'hebrew_gimmel',
-    u'\u05d3': 'hebrew_dalet',
-    u'\u05d3': 'hebrew_daleth',
-    u'\u05d4': 'hebrew_he',
-    u'\u05d5': 'hebrew_waw',
-    u'\u05d6': 'hebrew_zain',
-    u'\u05d6': 'hebrew_zayin',
-    u'\u05d7': 'hebrew_chet',
-    u'\u05d7': 'hebrew_het',
-    u'\u05d8': 'hebrew_tet',
-    u'\u05d8': 'hebrew_teth',
-    u'\u05d9': 'hebrew_yod',
-    u'\u05da': 'hebrew_finalkaph',
-    u'\u05db': 'hebrew_kaph',
-    u'\u05dc': 'hebrew_lamed',
-    u'\u05dd': 'hebrew_finalmem',
-    u'\u05de': 'hebrew_mem',
-    u'\u05df': 'hebrew_finalnun',
-    u'\u05e0': 'hebrew_nun',
-    u'\u05e1': 'hebrew_samech',
-    u'\u05e1': 'hebrew_samekh',
-    u'\u05e2': 'hebrew_ayin',
-    u'\u05e3': 'hebrew_finalpe',
-    u'\u05e4': 'hebrew_pe',
-    u'\u05e5': 'hebrew_finalzade',
-    u'\u05e5': 'hebrew_finalzadi',
-    u'\u05e6': 'hebrew_zade',
-    u'\u05e6': 'hebrew_zadi',
-    u'\u05e7': 'hebrew_kuf',
-    u'\u05e7': 'hebrew_qoph',
-    u'\u05e8': 'hebrew_resh',
-    u'\u05e9': 'hebrew_shin',
-    u'\u05ea': 'hebrew_taf',
-    u'\u05ea': 'hebrew_taw',
-    u'\u0e01': 'Thai_kokai',
-    u'\u0e02': 'Thai_khokhai',
-    u'\u0e03': 'Thai_khokhuat',
-    u'\u0e04': 'Thai_khokhwai',
-    u'\u0e05': 'Thai_khokhon',
-    u'\u0e06': 'Thai_khorakhang',
-    u'\u0e07': 'Thai_ngongu',
-    u'\u0e08': 'Thai_chochan',
-    u'\u0e09': 'Thai_choching',
-    u'\u0e0a': 'Thai_chochang',
-    u'\u0e0b': 'Thai_soso',
-    u'\u0e0c': 'Thai_chochoe',
-    u'\u0e0d': 'Thai_yoying',
-    u'\u0e0e': 'Thai_dochada',
-    u'\u0e0f': 'Thai_topatak',
-    u'\u0e10': 'Thai_thothan',
-    u'\u0e11': 'Thai_thonangmontho',
-    u'\u0e12': 'Thai_thophuthao',
-    u'\u0e13': 'Thai_nonen',
-    u'\u0e14': 'Thai_dodek',
-    u'\u0e15': 'Thai_totao',
-    u'\u0e16': 'Thai_thothung',
-    u'\u0e17': 'Thai_thothahan',
-    u'\u0e18': 'Thai_thothong',
-    u'\u0e19': 'Thai_nonu',
-    u'\u0e1a': 'Thai_bobaimai',
-    u'\u0e1b': 'Thai_popla',
-    u'\u0e1c': 'Thai_phophung',
-    u'\u0e1d': 'Thai_fofa',
-    u'\u0e1e': 'Thai_phophan',
-    u'\u0e1f': 'Thai_fofan',
-    u'\u0e20': 'Thai_phosamphao',
-    u'\u0e21': 'Thai_moma',
-    u'\u0e22': 'Thai_yoyak',
-    u'\u0e23': 'Thai_rorua',
-    u'\u0e24': 'Thai_ru',
-    u'\u0e25': 'Thai_loling',
-    u'\u0e26': 'Thai_lu',
-    u'\u0e27': 'Thai_wowaen',
-    u'\u0e28': 'Thai_sosala',
-    u'\u0e29': 'Thai_sorusi',
-    u'\u0e2a': 'Thai_sosua',
-    u'\u0e2b': 'Thai_hohip',
-    u'\u0e2c': 'Thai_lochula',
-    u'\u0e2d': 'Thai_oang',
-    u'\u0e2e': 'Thai_honokhuk',
-    u'\u0e2f': 'Thai_paiyannoi',
-    u'\u0e30': 'Thai_saraa',
-    u'\u0e31': 'Thai_maihanakat',
-    u'\u0e32': 'Thai_saraaa',
-    u'\u0e33': 'Thai_saraam',
-    u'\u0e34': 'Thai_sarai',
-    u'\u0e35': 'Thai_saraii',
-    u'\u0e36': 'Thai_saraue',
-    u'\u0e37': 'Thai_sarauee',
-    u'\u0e38': 'Thai_sarau',
-    u'\u0e39': 'Thai_sarauu',
-    u'\u0e3a': 'Thai_phinthu',
-    u'\u0e3f': 'Thai_baht',
-    u'\u0e40': 'Thai_sarae',
-    u'\u0e41': 'Thai_saraae',
-    u'\u0e42': 'Thai_sarao',
-    u'\u0e43': 'Thai_saraaimaimuan',
-    u'\u0e44': 'Thai_saraaimaimalai',
-    u'\u0e45': 'Thai_lakkhangyao',
-    u'\u0e46': 'Thai_maiyamok',
-    u'\u0e47': 'Thai_maitaikhu',
-    u'\u0e48': 'Thai_maiek',
-    u'\u0e49': 'Thai_maitho',
-    u'\u0e4a': 'Thai_maitri',
-    u'\u0e4b': 'Thai_maichattawa',
-    u'\u0e4c': 'Thai_thanthakhat',
-    u'\u0e4d': 'Thai_nikhahit',
-    u'\u0e50': 'Thai_leksun',
-    u'\u0e51': 'Thai_leknung',
-    u'\u0e52': 'Thai_leksong',
-    u'\u0e53': 'Thai_leksam',
-    u'\u0e54': 'Thai_leksi',
-    u'\u0e55': 'Thai_lekha',
-    u'\u0e56': 'Thai_lekhok',
-    u'\u0e57': 'Thai_lekchet',
-    u'\u0e58': 'Thai_lekpaet',
-    u'\u0e59': 'Thai_lekkao',
-    u'\u0152': 'OE',
-    u'\u0153': 'oe',
-    u'\u0178': 'Ydiaeresis',
-    u'\u20ac': 'EuroSign',
-    u'\u0491': 'Ukrainian_ghe_with_upturn',
-    u'\u0490': 'Ukrainian_GHE_WITH_UPTURN'}
+This file is generated by ``reference_materials/xlib-keysyms-to-python.py``
+from ``xlib-keysyms.txt`` and the keysym groups of *Xlib*; do not edit it.
+
+The tables are stored as strings, which are only unpacked into sorted lists
+and arrays when they are first used, and are then shared.
+"""
+
+from array import array
+from bisect import bisect_left
+import sys
+
+
+#: The characters and keysym names, sorted and separated by newlines
+_KEYS = (
+    ' \n!\n"\n#\n$\n%\n&\n\'\n(\n)\n*\n+\n,\n-\n.\n/\n0\n1\n2\n3\n3270_AltC'
+    'ursor\n3270_Attn\n3270_BackTab\n3270_ChangeScreen\n3270_Copy\n3270_Cur'
+    'sorBlink\n3270_CursorSelect\n3270_DeleteWord\n3270_Duplicate\n3270_Ent'
+    'er\n3270_EraseEOF\n3270_EraseInput\n3270_ExSelect\n3270_FieldMark\n327'
+    '0_Ident\n3270_Jump\n3270_KeyClick\n3270_Left2\n3270_PA1\n3270_PA2\n327'
+    '0_PA3\n3270_Play\n3270_PrintScreen\n3270_Quit\n3270_Record\n3270_Reset'
+    '\n3270_Right2\n3270_Rule\n3270_Setup\n3270_Test\n4\n5\n6\n7\n8\n9\n:\n'
+    ';\n<\n=\n>\n?\n@\nA\nAE\nAacute\nAbelowdot\nAbreve\nAbreveacute\nAbrev'
+    'ebelowdot\nAbrevegrave\nAbrevehook\nAbrevetilde\nAccessX_Enable\nAcces'
+    'sX_Feedback_Enable\nAcircumflex\nAcircumflexacute\nAcircumflexbelowdot'
+    '\nAcircumflexgrave\nAcircumflexhook\nAcircumflextilde\nAdiaeresis\nAgr'
+    'ave\nAhook\nAlt_L\nAlt_R\nAmacron\nAogonek\nArabic_0\nArabic_1\nArabic'
+    '_2\nArabic_3\nArabic_4\nArabic_5\nArabic_6\nArabic_7\nArabic_8\nArabic'
+    '_9\nArabic_ain\nArabic_alef\nArabic_alefmaksura\nArabic_beh\nArabic_co'
+    'mma\nArabic_dad\nArabic_dal\nArabic_damma\nArabic_dammatan\nArabic_dda'
+    'l\nArabic_fatha\nArabic_fathatan\nArabic_feh\nArabic_fullstop\nArabic_'
+    'gaf\nArabic_ghain\nArabic_ha\nArabic_hah\nArabic_hamza\nArabic_hamza_a'
+    'bove\nArabic_hamza_below\nArabic_hamzaonalef\nArabic_hamzaonwaw\nArabi'
+    'c_hamzaonyeh\nArabic_hamzaunderalef\nArabic_heh\nArabic_heh_doachashme'
+    'e\nArabic_heh_goal\nArabic_jeem\nArabic_jeh\nArabic_kaf\nArabic_kasra'
+    '\nArabic_kasratan\nArabic_keheh\nArabic_khah\nArabic_lam\nArabic_madda'
+    '_above\nArabic_maddaonalef\nArabic_meem\nArabic_noon\nArabic_noon_ghun'
+    'na\nArabic_peh\nArabic_percent\nArabic_qaf\nArabic_question_mark\nArab'
+    'ic_ra\nArabic_rreh\nArabic_sad\nArabic_seen\nArabic_semicolon\nArabic_'
+    'shadda\nArabic_sheen\nArabic_sukun\nArabic_superscript_alef\nArabic_sw'
+    'itch\nArabic_tah\nArabic_tatweel\nArabic_tcheh\nArabic_teh\nArabic_teh'
+    'marbuta\nArabic_thal\nArabic_theh\nArabic_tteh\nArabic_veh\nArabic_waw'
+    '\nArabic_yeh\nArabic_yeh_baree\nArabic_zah\nArabic_zain\nAring\nArmeni'
+    'an_AT\nArmenian_AYB\nArmenian_BEN\nArmenian_CHA\nArmenian_DA\nArmenian'
+    '_DZA\nArmenian_E\nArmenian_FE\nArmenian_GHAT\nArmenian_GIM\nArmenian_H'
+    'I\nArmenian_HO\nArmenian_INI\nArmenian_JE\nArmenian_KE\nArmenian_KEN\n'
+    'Armenian_KHE\nArmenian_LYUN\nArmenian_MEN\nArmenian_NU\nArmenian_O\nAr'
+    'menian_PE\nArmenian_PYUR\nArmenian_RA\nArmenian_RE\nArmenian_SE\nArmen'
+    'ian_SHA\nArmenian_TCHE\nArmenian_TO\nArmenian_TSA\nArmenian_TSO\nArmen'
+    'ian_TYUN\nArmenian_VEV\nArmenian_VO\nArmenian_VYUN\nArmenian_YECH\nArm'
+    'enian_ZA\nArmenian_ZHE\nArmenian_amanak\nArmenian_apostrophe\nArmenian'
+    '_at\nArmenian_ayb\nArmenian_ben\nArmenian_but\nArmenian_cha\nArmenian_'
+    'comma\nArmenian_da\nArmenian_dza\nArmenian_e\nArmenian_ellipsis\nArmen'
+    'ian_em_dash\nArmenian_en_dash\nArmenian_eternity\nArmenian_fe\nArmenia'
+    'n_ghat\nArmenian_gim\nArmenian_guillemotleft\nArmenian_guillemotright'
+    '\nArmenian_hi\nArmenian_ho\nArmenian_ini\nArmenian_je\nArmenian_ke\nAr'
+    'menian_ken\nArmenian_khe\nArmenian_ligature_ew\nArmenian_lyun\nArmenia'
+    'n_men\nArmenian_mijaket\nArmenian_nu\nArmenian_o\nArmenian_parenleft\n'
+    'Armenian_parenright\nArmenian_paruyk\nArmenian_pe\nArmenian_pyur\nArme'
+    'nian_ra\nArmenian_re\nArmenian_se\nArmenian_section_sign\nArmenian_sha'
+    '\nArmenian_shesht\nArmenian_tche\nArmenian_to\nArmenian_tsa\nArmenian_'
+    'tso\nArmenian_tyun\nArmenian_verjaket\nArmenian_vev\nArmenian_vo\nArme'
+    'nian_vyun\nArmenian_yech\nArmenian_yentamna\nArmenian_za\nArmenian_zhe'
+    '\nAtilde\nAudibleBell_Enable\nB\nBabovedot\nBackSpace\nBegin\nBounceKe'
+    'ys_Enable\nBreak\nByelorussian_SHORTU\nByelorussian_shortu\nC\nCaboved'
+    'ot\nCacute\nCancel\nCaps_Lock\nCcaron\nCcedilla\nCcedillaabovedot\nCci'
+    'rcumflex\nClear\nCodeinput\nColonSign\nControl_L\nControl_R\nCruzeiroS'
+    'ign\nCyrillic_A\nCyrillic_BE\nCyrillic_CHE\nCyrillic_CHE_descender\nCy'
+    'rillic_CHE_vertstroke\nCyrillic_DE\nCyrillic_DZHE\nCyrillic_E\nCyrilli'
+    'c_EF\nCyrillic_EL\nCyrillic_EM\nCyrillic_EN\nCyrillic_EN_descender\nCy'
+    'rillic_ER\nCyrillic_ES\nCyrillic_GHE\nCyrillic_GHE_bar\nCyrillic_HA\nC'
+    'yrillic_HARDSIGN\nCyrillic_HA_descender\nCyrillic_I\nCyrillic_IE\nCyri'
+    'llic_IO\nCyrillic_I_macron\nCyrillic_JE\nCyrillic_KA\nCyrillic_KA_desc'
+    'ender\nCyrillic_KA_vertstroke\nCyrillic_LJE\nCyrillic_NJE\nCyrillic_O'
+    '\nCyrillic_O_bar\nCyrillic_PE\nCyrillic_SCHWA\nCyrillic_SHA\nCyrillic_'
+    'SHCHA\nCyrillic_SHHA\nCyrillic_SHORTI\nCyrillic_SOFTSIGN\nCyrillic_TE'
+    '\nCyrillic_TSE\nCyrillic_U\nCyrillic_U_macron\nCyrillic_U_straight\nCy'
+    'rillic_U_straight_bar\nCyrillic_VE\nCyrillic_YA\nCyrillic_YERU\nCyrill'
+    'ic_YU\nCyrillic_ZE\nCyrillic_ZHE\nCyrillic_ZHE_descender\nCyrillic_a\n'
+    'Cyrillic_be\nCyrillic_che\nCyrillic_che_descender\nCyrillic_che_vertst'
+    'roke\nCyrillic_de\nCyrillic_dzhe\nCyrillic_e\nCyrillic_ef\nCyrillic_el'
+    '\nCyrillic_em\nCyrillic_en\nCyrillic_en_descender\nCyrillic_er\nCyrill'
+    'ic_es\nCyrillic_ghe\nCyrillic_ghe_bar\nCyrillic_ha\nCyrillic_ha_descen'
+    'der\nCyrillic_hardsign\nCyrillic_i\nCyrillic_i_macron\nCyrillic_ie\nCy'
+    'rillic_io\nCyrillic_je\nCyrillic_ka\nCyrillic_ka_descender\nCyrillic_k'
+    'a_vertstroke\nCyrillic_lje\nCyrillic_nje\nCyrillic_o\nCyrillic_o_bar\n'
+    'Cyrillic_pe\nCyrillic_schwa\nCyrillic_sha\nCyrillic_shcha\nCyrillic_sh'
+    'ha\nCyrillic_shorti\nCyrillic_softsign\nCyrillic_te\nCyrillic_tse\nCyr'
+    'illic_u\nCyrillic_u_macron\nCyrillic_u_straight\nCyrillic_u_straight_b'
+    'ar\nCyrillic_ve\nCyrillic_ya\nCyrillic_yeru\nCyrillic_yu\nCyrillic_ze'
+    '\nCyrillic_zhe\nCyrillic_zhe_descender\nD\nDabovedot\nDcaron\nDelete\n'
+    'DongSign\nDown\nDstroke\nE\nENG\nETH\nEabovedot\nEacute\nEbelowdot\nEc'
+    'aron\nEcircumflex\nEcircumflexacute\nEcircumflexbelowdot\nEcircumflexg'
+    'rave\nEcircumflexhook\nEcircumflextilde\nEcuSign\nEdiaeresis\nEgrave\n'
+    'Ehook\nEisu_Shift\nEisu_toggle\nEmacron\nEnd\nEogonek\nEscape\nEth\nEt'
+    'ilde\nEuroSign\nExecute\nF\nF1\nF10\nF11\nF12\nF13\nF14\nF15\nF16\nF17'
+    '\nF18\nF19\nF2\nF20\nF21\nF22\nF23\nF24\nF25\nF26\nF27\nF28\nF29\nF3\n'
+    'F30\nF31\nF32\nF33\nF34\nF35\nF4\nF5\nF6\nF7\nF8\nF9\nFFrancSign\nFabo'
+    'vedot\nFarsi_0\nFarsi_1\nFarsi_2\nFarsi_3\nFarsi_4\nFarsi_5\nFarsi_6\n'
+    'Farsi_7\nFarsi_8\nFarsi_9\nFarsi_yeh\nFind\nFirst_Virtual_Screen\nG\nG'
+    'abovedot\nGbreve\nGcaron\nGcedilla\nGcircumflex\nGeorgian_an\nGeorgian'
+    '_ban\nGeorgian_can\nGeorgian_char\nGeorgian_chin\nGeorgian_cil\nGeorgi'
+    'an_don\nGeorgian_en\nGeorgian_fi\nGeorgian_gan\nGeorgian_ghan\nGeorgia'
+    'n_hae\nGeorgian_har\nGeorgian_he\nGeorgian_hie\nGeorgian_hoe\nGeorgian'
+    '_in\nGeorgian_jhan\nGeorgian_jil\nGeorgian_kan\nGeorgian_khar\nGeorgia'
+    'n_las\nGeorgian_man\nGeorgian_nar\nGeorgian_on\nGeorgian_par\nGeorgian'
+    '_phar\nGeorgian_qar\nGeorgian_rae\nGeorgian_san\nGeorgian_shin\nGeorgi'
+    'an_tan\nGeorgian_tar\nGeorgian_un\nGeorgian_vin\nGeorgian_we\nGeorgian'
+    '_xan\nGeorgian_zen\nGeorgian_zhar\nGreek_ALPHA\nGreek_ALPHAaccent\nGre'
+    'ek_BETA\nGreek_CHI\nGreek_DELTA\nGreek_EPSILON\nGreek_EPSILONaccent\nG'
+    'reek_ETA\nGreek_ETAaccent\nGreek_GAMMA\nGreek_IOTA\nGreek_IOTAaccent\n'
+    'Greek_IOTAdiaeresis\nGreek_KAPPA\nGreek_LAMBDA\nGreek_LAMDA\nGreek_MU'
+    '\nGreek_NU\nGreek_OMEGA\nGreek_OMEGAaccent\nGreek_OMICRON\nGreek_OMICR'
+    'ONaccent\nGreek_PHI\nGreek_PI\nGreek_PSI\nGreek_RHO\nGreek_SIGMA\nGree'
+    'k_TAU\nGreek_THETA\nGreek_UPSILON\nGreek_UPSILONaccent\nGreek_UPSILONd'
+    'ieresis\nGreek_XI\nGreek_ZETA\nGreek_accentdieresis\nGreek_alpha\nGree'
+    'k_alphaaccent\nGreek_beta\nGreek_chi\nGreek_delta\nGreek_epsilon\nGree'
+    'k_epsilonaccent\nGreek_eta\nGreek_etaaccent\nGreek_finalsmallsigma\nGr'
+    'eek_gamma\nGreek_horizbar\nGreek_iota\nGreek_iotaaccent\nGreek_iotaacc'
+    'entdieresis\nGreek_iotadieresis\nGreek_kappa\nGreek_lambda\nGreek_lamd'
+    'a\nGreek_mu\nGreek_nu\nGreek_omega\nGreek_omegaaccent\nGreek_omicron\n'
+    'Greek_omicronaccent\nGreek_phi\nGreek_pi\nGreek_psi\nGreek_rho\nGreek_'
+    'sigma\nGreek_switch\nGreek_tau\nGreek_theta\nGreek_upsilon\nGreek_upsi'
+    'lonaccent\nGreek_upsilonaccentdieresis\nGreek_upsilondieresis\nGreek_x'
+    'i\nGreek_zeta\nGtilde\nH\nHangul\nHangul_A\nHangul_AE\nHangul_AraeA\nH'
+    'angul_AraeAE\nHangul_Banja\nHangul_Cieuc\nHangul_Codeinput\nHangul_Dik'
+    'eud\nHangul_E\nHangul_EO\nHangul_EU\nHangul_End\nHangul_Hanja\nHangul_'
+    'Hieuh\nHangul_I\nHangul_Ieung\nHangul_J_Cieuc\nHangul_J_Dikeud\nHangul'
+    '_J_Hieuh\nHangul_J_Ieung\nHangul_J_Jieuj\nHangul_J_Khieuq\nHangul_J_Ki'
+    'yeog\nHangul_J_KiyeogSios\nHangul_J_KkogjiDalrinIeung\nHangul_J_Mieum'
+    '\nHangul_J_Nieun\nHangul_J_NieunHieuh\nHangul_J_NieunJieuj\nHangul_J_P'
+    'anSios\nHangul_J_Phieuf\nHangul_J_Pieub\nHangul_J_PieubSios\nHangul_J_'
+    'Rieul\nHangul_J_RieulHieuh\nHangul_J_RieulKiyeog\nHangul_J_RieulMieum'
+    '\nHangul_J_RieulPhieuf\nHangul_J_RieulPieub\nHangul_J_RieulSios\nHangu'
+    'l_J_RieulTieut\nHangul_J_Sios\nHangul_J_SsangKiyeog\nHangul_J_SsangSio'
+    's\nHangul_J_Tieut\nHangul_J_YeorinHieuh\nHangul_Jamo\nHangul_Jeonja\nH'
+    'angul_Jieuj\nHangul_Khieuq\nHangul_Kiyeog\nHangul_KiyeogSios\nHangul_K'
+    'kogjiDalrinIeung\nHangul_Mieum\nHangul_MultipleCandidate\nHangul_Nieun'
+    '\nHangul_NieunHieuh\nHangul_NieunJieuj\nHangul_O\nHangul_OE\nHangul_Pa'
+    'nSios\nHangul_Phieuf\nHangul_Pieub\nHangul_PieubSios\nHangul_PostHanja'
+    '\nHangul_PreHanja\nHangul_PreviousCandidate\nHangul_Rieul\nHangul_Rieu'
+    'lHieuh\nHangul_RieulKiyeog\nHangul_RieulMieum\nHangul_RieulPhieuf\nHan'
+    'gul_RieulPieub\nHangul_RieulSios\nHangul_RieulTieut\nHangul_RieulYeori'
+    'nHieuh\nHangul_Romaja\nHangul_SingleCandidate\nHangul_Sios\nHangul_Spe'
+    'cial\nHangul_SsangDikeud\nHangul_SsangJieuj\nHangul_SsangKiyeog\nHangu'
+    'l_SsangPieub\nHangul_SsangSios\nHangul_Start\nHangul_SunkyeongeumMieum'
+    '\nHangul_SunkyeongeumPhieuf\nHangul_SunkyeongeumPieub\nHangul_Tieut\nH'
+    'angul_U\nHangul_WA\nHangul_WAE\nHangul_WE\nHangul_WEO\nHangul_WI\nHang'
+    'ul_YA\nHangul_YAE\nHangul_YE\nHangul_YEO\nHangul_YI\nHangul_YO\nHangul'
+    '_YU\nHangul_YeorinHieuh\nHangul_switch\nHankaku\nHcircumflex\nHebrew_s'
+    'witch\nHelp\nHenkan\nHenkan_Mode\nHiragana\nHiragana_Katakana\nHome\nH'
+    'stroke\nHyper_L\nHyper_R\nI\nIE\nISO_Center_Object\nISO_Continuous_Und'
+    'erline\nISO_Discontinuous_Underline\nISO_Emphasize\nISO_Enter\nISO_Fas'
+    't_Cursor_Down\nISO_Fast_Cursor_Left\nISO_Fast_Cursor_Right\nISO_Fast_C'
+    'ursor_Up\nISO_First_Group\nISO_First_Group_Lock\nISO_Group_Latch\nISO_'
+    'Group_Lock\nISO_Group_Shift\nISO_Last_Group\nISO_Last_Group_Lock\nISO_'
+    'Left_Tab\nISO_Level2_Latch\nISO_Level3_Latch\nISO_Level3_Lock\nISO_Lev'
+    'el3_Shift\nISO_Lock\nISO_Move_Line_Down\nISO_Move_Line_Up\nISO_Next_Gr'
+    'oup\nISO_Next_Group_Lock\nISO_Partial_Line_Down\nISO_Partial_Line_Up\n'
+    'ISO_Partial_Space_Left\nISO_Partial_Space_Right\nISO_Prev_Group\nISO_P'
+    'rev_Group_Lock\nISO_Release_Both_Margins\nISO_Release_Margin_Left\nISO'
+    '_Release_Margin_Right\nISO_Set_Margin_Left\nISO_Set_Margin_Right\nIabo'
+    'vedot\nIacute\nIbelowdot\nIbreve\nIcircumflex\nIdiaeresis\nIgrave\nIho'
+    'ok\nImacron\nInsert\nIogonek\nItilde\nJ\nJcircumflex\nK\nKP_0\nKP_1\nK'
+    'P_2\nKP_3\nKP_4\nKP_5\nKP_6\nKP_7\nKP_8\nKP_9\nKP_Add\nKP_Begin\nKP_De'
+    'cimal\nKP_Delete\nKP_Divide\nKP_Down\nKP_End\nKP_Enter\nKP_Equal\nKP_F'
+    '1\nKP_F2\nKP_F3\nKP_F4\nKP_Home\nKP_Insert\nKP_Left\nKP_Multiply\nKP_N'
+    'ext\nKP_Page_Down\nKP_Page_Up\nKP_Prior\nKP_Right\nKP_Separator\nKP_Sp'
+    'ace\nKP_Subtract\nKP_Tab\nKP_Up\nKana_Lock\nKana_Shift\nKanji\nKatakan'
+    'a\nKcedilla\nKorean_Won\nL\nL1\nL10\nL2\nL3\nL4\nL5\nL6\nL7\nL8\nL9\nL'
+    'acute\nLast_Virtual_Screen\nLbelowdot\nLcaron\nLcedilla\nLeft\nLinefee'
+    'd\nLiraSign\nLstroke\nLstrokebelowdot\nM\nMabovedot\nMacedonia_DSE\nMa'
+    'cedonia_GJE\nMacedonia_KJE\nMacedonia_dse\nMacedonia_gje\nMacedonia_kj'
+    'e\nMae_Koho\nMassyo\nMenu\nMeta_L\nMeta_R\nMillSign\nMode_switch\nMous'
+    'eKeys_Accel_Enable\nMouseKeys_Enable\nMuhenkan\nMulti_key\nMultipleCan'
+    'didate\nN\nNacute\nNairaSign\nNcaron\nNcedilla\nNewSheqelSign\nNext\nN'
+    'ext_Virtual_Screen\nNtilde\nNum_Lock\nO\nOE\nOacute\nObarred\nObelowdo'
+    't\nOcaron\nOcircumflex\nOcircumflexacute\nOcircumflexbelowdot\nOcircum'
+    'flexgrave\nOcircumflexhook\nOcircumflextilde\nOdiaeresis\nOdoubleacute'
+    '\nOgrave\nOhook\nOhorn\nOhornacute\nOhornbelowdot\nOhorngrave\nOhornho'
+    'ok\nOhorntilde\nOmacron\nOoblique\nOtilde\nOverlay1_Enable\nOverlay2_E'
+    'nable\nP\nPabovedot\nPage_Down\nPage_Up\nPause\nPesetaSign\nPointer_Ac'
+    'celerate\nPointer_Button1\nPointer_Button2\nPointer_Button3\nPointer_B'
+    'utton4\nPointer_Button5\nPointer_Button_Dflt\nPointer_DblClick1\nPoint'
+    'er_DblClick2\nPointer_DblClick3\nPointer_DblClick4\nPointer_DblClick5'
+    '\nPointer_DblClick_Dflt\nPointer_DfltBtnNext\nPointer_DfltBtnPrev\nPoi'
+    'nter_Down\nPointer_DownLeft\nPointer_DownRight\nPointer_Drag1\nPointer'
+    '_Drag2\nPointer_Drag3\nPointer_Drag4\nPointer_Drag5\nPointer_Drag_Dflt'
+    '\nPointer_EnableKeys\nPointer_Left\nPointer_Right\nPointer_Up\nPointer'
+    '_UpLeft\nPointer_UpRight\nPrev_Virtual_Screen\nPreviousCandidate\nPrin'
+    't\nPrior\nQ\nQabovedot\nR\nR1\nR10\nR11\nR12\nR13\nR14\nR15\nR2\nR3\nR'
+    '4\nR5\nR6\nR7\nR8\nR9\nRacute\nRcaron\nRcedilla\nRedo\nRepeatKeys_Enab'
+    'le\nReturn\nRight\nRomaji\nRupeeSign\nS\nSCHWA\nSabovedot\nSacute\nSca'
+    'ron\nScedilla\nScircumflex\nScroll_Lock\nSelect\nSerbian_DJE\nSerbian_'
+    'DZE\nSerbian_JE\nSerbian_LJE\nSerbian_NJE\nSerbian_TSHE\nSerbian_dje\n'
+    'Serbian_dze\nSerbian_je\nSerbian_lje\nSerbian_nje\nSerbian_tshe\nShift'
+    '_L\nShift_Lock\nShift_R\nSingleCandidate\nSlowKeys_Enable\nStickyKeys_'
+    'Enable\nSuper_L\nSuper_R\nSys_Req\nT\nTHORN\nTab\nTabovedot\nTcaron\nT'
+    'cedilla\nTerminate_Server\nThai_baht\nThai_bobaimai\nThai_chochan\nTha'
+    'i_chochang\nThai_choching\nThai_chochoe\nThai_dochada\nThai_dodek\nTha'
+    'i_fofa\nThai_fofan\nThai_hohip\nThai_honokhuk\nThai_khokhai\nThai_khok'
+    'hon\nThai_khokhuat\nThai_khokhwai\nThai_khorakhang\nThai_kokai\nThai_l'
+    'akkhangyao\nThai_lekchet\nThai_lekha\nThai_lekhok\nThai_lekkao\nThai_l'
+    'eknung\nThai_lekpaet\nThai_leksam\nThai_leksi\nThai_leksong\nThai_leks'
+    'un\nThai_lochula\nThai_loling\nThai_lu\nThai_maichattawa\nThai_maiek\n'
+    'Thai_maihanakat\nThai_maihanakat_maitho\nThai_maitaikhu\nThai_maitho\n'
+    'Thai_maitri\nThai_maiyamok\nThai_moma\nThai_ngongu\nThai_nikhahit\nTha'
+    'i_nonen\nThai_nonu\nThai_oang\nThai_paiyannoi\nThai_phinthu\nThai_phop'
+    'han\nThai_phophung\nThai_phosamphao\nThai_popla\nThai_rorua\nThai_ru\n'
+    'Thai_saraa\nThai_saraaa\nThai_saraae\nThai_saraaimaimalai\nThai_saraai'
+    'maimuan\nThai_saraam\nThai_sarae\nThai_sarai\nThai_saraii\nThai_sarao'
+    '\nThai_sarau\nThai_saraue\nThai_sarauee\nThai_sarauu\nThai_sorusi\nTha'
+    'i_sosala\nThai_soso\nThai_sosua\nThai_thanthakhat\nThai_thonangmontho'
+    '\nThai_thophuthao\nThai_thothahan\nThai_thothan\nThai_thothong\nThai_t'
+    'hothung\nThai_topatak\nThai_totao\nThai_wowaen\nThai_yoyak\nThai_yoyin'
+    'g\nThorn\nTouroku\nTslash\nU\nUO\nUacute\nUbelowdot\nUbreve\nUcircumfl'
+    'ex\nUdiaeresis\nUdoubleacute\nUgrave\nUhook\nUhorn\nUhornacute\nUhornb'
+    'elowdot\nUhorngrave\nUhornhook\nUhorntilde\nUkrainian_GHE_WITH_UPTURN'
+    '\nUkrainian_I\nUkrainian_IE\nUkrainian_YI\nUkrainian_ghe_with_upturn\n'
+    'Ukrainian_i\nUkrainian_ie\nUkrainian_yi\nUkranian_I\nUkranian_JE\nUkra'
+    'nian_YI\nUkranian_i\nUkranian_je\nUkranian_yi\nUmacron\nUndo\nUogonek'
+    '\nUp\nUring\nUtilde\nV\nVoidSymbol\nW\nWacute\nWcircumflex\nWdiaeresis'
+    '\nWgrave\nWonSign\nX\nXF86_AddFavorite\nXF86_ApplicationLeft\nXF86_App'
+    'licationRight\nXF86_AudioCycleTrack\nXF86_AudioForward\nXF86_AudioLowe'
+    'rVolume\nXF86_AudioMedia\nXF86_AudioMicMute\nXF86_AudioMute\nXF86_Audi'
+    'oNext\nXF86_AudioPause\nXF86_AudioPlay\nXF86_AudioPreset\nXF86_AudioPr'
+    'ev\nXF86_AudioRaiseVolume\nXF86_AudioRandomPlay\nXF86_AudioRecord\nXF8'
+    '6_AudioRepeat\nXF86_AudioRewind\nXF86_AudioStop\nXF86_Away\nXF86_Back'
+    '\nXF86_Battery\nXF86_Blue\nXF86_Bluetooth\nXF86_Book\nXF86_BrightnessA'
+    'djust\nXF86_CD\nXF86_Calculater\nXF86_Calculator\nXF86_Calendar\nXF86_'
+    'Clear\nXF86_ClearGrab\nXF86_Close\nXF86_Community\nXF86_ContrastAdjust'
+    '\nXF86_Copy\nXF86_Cut\nXF86_CycleAngle\nXF86_DOS\nXF86_Display\nXF86_D'
+    'ocuments\nXF86_Eject\nXF86_Excel\nXF86_Explorer\nXF86_Favorites\nXF86_'
+    'Finance\nXF86_Forward\nXF86_FrameBack\nXF86_FrameForward\nXF86_FullScr'
+    'een\nXF86_Game\nXF86_Go\nXF86_Green\nXF86_Hibernate\nXF86_History\nXF8'
+    '6_HomePage\nXF86_HotLinks\nXF86_KbdBrightnessDown\nXF86_KbdBrightnessU'
+    'p\nXF86_KbdLightOnOff\nXF86_Keyboard\nXF86_Launch0\nXF86_Launch1\nXF86'
+    '_Launch2\nXF86_Launch3\nXF86_Launch4\nXF86_Launch5\nXF86_Launch6\nXF86'
+    '_Launch7\nXF86_Launch8\nXF86_Launch9\nXF86_LaunchA\nXF86_LaunchB\nXF86'
+    '_LaunchC\nXF86_LaunchD\nXF86_LaunchE\nXF86_LaunchF\nXF86_LightBulb\nXF'
+    '86_LogGrabInfo\nXF86_LogOff\nXF86_LogWindowTree\nXF86_Mail\nXF86_MailF'
+    'orward\nXF86_Market\nXF86_Meeting\nXF86_Memo\nXF86_MenuKB\nXF86_MenuPB'
+    '\nXF86_Messenger\nXF86_ModeLock\nXF86_MonBrightnessCycle\nXF86_MonBrig'
+    'htnessDown\nXF86_MonBrightnessUp\nXF86_Music\nXF86_MyComputer\nXF86_My'
+    'Sites\nXF86_New\nXF86_News\nXF86_Next_VMode\nXF86_OfficeHome\nXF86_Ope'
+    'n\nXF86_OpenURL\nXF86_Option\nXF86_Paste\nXF86_Phone\nXF86_Pictures\nX'
+    'F86_PowerDown\nXF86_PowerOff\nXF86_Prev_VMode\nXF86_Q\nXF86_RFKill\nXF'
+    '86_Red\nXF86_Refresh\nXF86_Reload\nXF86_Reply\nXF86_RockerDown\nXF86_R'
+    'ockerEnter\nXF86_RockerUp\nXF86_RotateWindows\nXF86_RotationKB\nXF86_R'
+    'otationLockToggle\nXF86_RotationPB\nXF86_Save\nXF86_ScreenSaver\nXF86_'
+    'ScrollClick\nXF86_ScrollDown\nXF86_ScrollUp\nXF86_Search\nXF86_Select'
+    '\nXF86_Send\nXF86_Shop\nXF86_Sleep\nXF86_Spell\nXF86_SplitScreen\nXF86'
+    '_Standby\nXF86_Start\nXF86_Stop\nXF86_Subtitle\nXF86_Support\nXF86_Sus'
+    'pend\nXF86_Switch_VT_1\nXF86_Switch_VT_10\nXF86_Switch_VT_11\nXF86_Swi'
+    'tch_VT_12\nXF86_Switch_VT_2\nXF86_Switch_VT_3\nXF86_Switch_VT_4\nXF86_'
+    'Switch_VT_5\nXF86_Switch_VT_6\nXF86_Switch_VT_7\nXF86_Switch_VT_8\nXF8'
+    '6_Switch_VT_9\nXF86_TaskPane\nXF86_Terminal\nXF86_Time\nXF86_ToDoList'
+    '\nXF86_Tools\nXF86_TopMenu\nXF86_TouchpadOff\nXF86_TouchpadOn\nXF86_To'
+    'uchpadToggle\nXF86_Travel\nXF86_UWB\nXF86_Ungrab\nXF86_User1KB\nXF86_U'
+    'ser2KB\nXF86_UserPB\nXF86_VendorHome\nXF86_Video\nXF86_View\nXF86_WLAN'
+    '\nXF86_WWAN\nXF86_WWW\nXF86_WakeUp\nXF86_WebCam\nXF86_WheelButton\nXF8'
+    '6_Word\nXF86_XF86BackForward\nXF86_Xfer\nXF86_Yellow\nXF86_ZoomIn\nXF8'
+    '6_ZoomOut\nXF86_iTouch\nXabovedot\nY\nYacute\nYbelowdot\nYcircumflex\n'
+    'Ydiaeresis\nYgrave\nYhook\nYtilde\nZ\nZabovedot\nZacute\nZcaron\nZen_K'
+    'oho\nZenkaku\nZenkaku_Hankaku\nZstroke\n[\n\\\n]\n^\n_\n`\na\naacute\n'
+    'abelowdot\nabovedot\nabreve\nabreveacute\nabrevebelowdot\nabrevegrave'
+    '\nabrevehook\nabrevetilde\nacircumflex\nacircumflexacute\nacircumflexb'
+    'elowdot\nacircumflexgrave\nacircumflexhook\nacircumflextilde\nacute\na'
+    'diaeresis\nae\nagrave\nahook\namacron\nampersand\naogonek\napostrophe'
+    '\napproximate\naring\nasciicircum\nasciitilde\nasterisk\nat\natilde\nb'
+    '\nbabovedot\nbackslash\nballotcross\nbar\nblank\nbotintegral\nbotleftp'
+    'arens\nbotleftsqbracket\nbotleftsummation\nbotrightparens\nbotrightsqb'
+    'racket\nbotrightsummation\nbott\nbotvertsummationconnector\nbraceleft'
+    '\nbraceright\nbracketleft\nbracketright\nbreve\nbrokenbar\nc\ncabovedo'
+    't\ncacute\ncareof\ncaret\ncaron\nccaron\nccedilla\nccedillaabovedot\nc'
+    'circumflex\ncedilla\ncent\ncheckerboard\ncheckmark\ncircle\nclub\ncolo'
+    'n\ncombining_acute\ncombining_belowdot\ncombining_grave\ncombining_hoo'
+    'k\ncombining_tilde\ncomma\ncopyright\ncr\ncrossinglines\ncurrency\ncur'
+    'sor\nd\ndabovedot\ndagger\ndcaron\ndead_abovedot\ndead_abovering\ndead'
+    '_acute\ndead_belowdot\ndead_breve\ndead_caron\ndead_cedilla\ndead_circ'
+    'umflex\ndead_diaeresis\ndead_doubleacute\ndead_grave\ndead_hook\ndead_'
+    'horn\ndead_iota\ndead_macron\ndead_ogonek\ndead_semivoiced_sound\ndead'
+    '_tilde\ndead_voiced_sound\ndecimalpoint\ndegree\ndiaeresis\ndiamond\nd'
+    'igitspace\ndivision\ndollar\ndoubbaselinedot\ndoubleacute\ndoubledagge'
+    'r\ndoublelowquotemark\ndownarrow\ndowncaret\ndownshoe\ndownstile\ndown'
+    'tack\ndstroke\ne\neabovedot\neacute\nebelowdot\necaron\necircumflex\ne'
+    'circumflexacute\necircumflexbelowdot\necircumflexgrave\necircumflexhoo'
+    'k\necircumflextilde\nediaeresis\negrave\nehook\nellipsis\nem3space\nem'
+    '4space\nemacron\nemdash\nemfilledcircle\nemfilledrect\nemopencircle\ne'
+    'mopenrectangle\nemspace\nendash\nenfilledcircbullet\nenfilledsqbullet'
+    '\neng\nenopencircbullet\nenopensquarebullet\nenspace\neogonek\nequal\n'
+    'eth\netilde\nexclam\nexclamdown\nf\nfabovedot\nfemalesymbol\nff\nfigda'
+    'sh\nfilledlefttribullet\nfilledrectbullet\nfilledrighttribullet\nfille'
+    'dtribulletdown\nfilledtribulletup\nfiveeighths\nfivesixths\nfourfifths'
+    '\nfunction\ng\ngabovedot\ngbreve\ngcaron\ngcedilla\ngcircumflex\ngrave'
+    '\ngreater\ngreaterthanequal\ngtilde\nguillemotleft\nguillemotright\nh'
+    '\nhairspace\nhcircumflex\nheart\nhebrew_aleph\nhebrew_ayin\nhebrew_bet'
+    '\nhebrew_beth\nhebrew_chet\nhebrew_dalet\nhebrew_daleth\nhebrew_double'
+    'lowline\nhebrew_finalkaph\nhebrew_finalmem\nhebrew_finalnun\nhebrew_fi'
+    'nalpe\nhebrew_finalzade\nhebrew_finalzadi\nhebrew_gimel\nhebrew_gimmel'
+    '\nhebrew_he\nhebrew_het\nhebrew_kaph\nhebrew_kuf\nhebrew_lamed\nhebrew'
+    '_mem\nhebrew_nun\nhebrew_pe\nhebrew_qoph\nhebrew_resh\nhebrew_samech\n'
+    'hebrew_samekh\nhebrew_shin\nhebrew_taf\nhebrew_taw\nhebrew_tet\nhebrew'
+    '_teth\nhebrew_waw\nhebrew_yod\nhebrew_zade\nhebrew_zadi\nhebrew_zain\n'
+    'hebrew_zayin\nhexagram\nhorizconnector\nhorizlinescan1\nhorizlinescan3'
+    '\nhorizlinescan5\nhorizlinescan7\nhorizlinescan9\nhstroke\nht\nhyphen'
+    '\ni\niacute\nibelowdot\nibreve\nicircumflex\nidentical\nidiaeresis\nid'
+    'otless\nie\nifonlyif\nigrave\nihook\nimacron\nimplies\nincludedin\ninc'
+    'ludes\ninfinity\nintegral\nintersection\niogonek\nitilde\nj\njcircumfl'
+    'ex\njot\nk\nkana_A\nkana_CHI\nkana_E\nkana_FU\nkana_HA\nkana_HE\nkana_'
+    'HI\nkana_HO\nkana_HU\nkana_I\nkana_KA\nkana_KE\nkana_KI\nkana_KO\nkana'
+    '_KU\nkana_MA\nkana_ME\nkana_MI\nkana_MO\nkana_MU\nkana_N\nkana_NA\nkan'
+    'a_NE\nkana_NI\nkana_NO\nkana_NU\nkana_O\nkana_RA\nkana_RE\nkana_RI\nka'
+    'na_RO\nkana_RU\nkana_SA\nkana_SE\nkana_SHI\nkana_SO\nkana_SU\nkana_TA'
+    '\nkana_TE\nkana_TI\nkana_TO\nkana_TSU\nkana_TU\nkana_U\nkana_WA\nkana_'
+    'WO\nkana_YA\nkana_YO\nkana_YU\nkana_a\nkana_closingbracket\nkana_comma'
+    '\nkana_conjunctive\nkana_e\nkana_fullstop\nkana_i\nkana_middledot\nkan'
+    'a_o\nkana_openingbracket\nkana_switch\nkana_tsu\nkana_tu\nkana_u\nkana'
+    '_ya\nkana_yo\nkana_yu\nkappa\nkcedilla\nkra\nl\nlacute\nlatincross\nlb'
+    'elowdot\nlcaron\nlcedilla\nleftanglebracket\nleftarrow\nleftcaret\nlef'
+    'tdoublequotemark\nleftmiddlecurlybrace\nleftopentriangle\nleftpointer'
+    '\nleftradical\nleftshoe\nleftsinglequotemark\nleftt\nlefttack\nless\nl'
+    'essthanequal\nlf\nlogicaland\nlogicalor\nlowleftcorner\nlowrightcorner'
+    '\nlstroke\nlstrokebelowdot\nm\nmabovedot\nmacron\nmalesymbol\nmaltesec'
+    'ross\nmarker\nmasculine\nminus\nminutes\nmu\nmultiply\nmusicalflat\nmu'
+    'sicalsharp\nn\nnabla\nnacute\nncaron\nncedilla\nnl\nnobreakspace\nnote'
+    'qual\nnotsign\nntilde\nnumbersign\nnumerosign\no\noacute\nobarred\nobe'
+    'lowdot\nocaron\nocircumflex\nocircumflexacute\nocircumflexbelowdot\noc'
+    'ircumflexgrave\nocircumflexhook\nocircumflextilde\nodiaeresis\nodouble'
+    'acute\noe\nogonek\nograve\nohook\nohorn\nohornacute\nohornbelowdot\noh'
+    'orngrave\nohornhook\nohorntilde\nomacron\noneeighth\nonefifth\nonehalf'
+    '\nonequarter\nonesixth\nonesuperior\nonethird\nopenrectbullet\nopensta'
+    'r\nopentribulletdown\nopentribulletup\nordfeminine\noslash\notilde\nov'
+    'erbar\noverline\np\npabovedot\nparagraph\nparenleft\nparenright\nparti'
+    'alderivative\npercent\nperiod\nperiodcentered\nphonographcopyright\npl'
+    'us\nplusminus\nprescription\nprolongedsound\npunctspace\nq\nqabovedot'
+    '\nquad\nquestion\nquestiondown\nquotedbl\nquoteleft\nquoteright\nr\nra'
+    'cute\nradical\nrcaron\nrcedilla\nregistered\nrightanglebracket\nrighta'
+    'rrow\nrightcaret\nrightdoublequotemark\nrightmiddlecurlybrace\nrightmi'
+    'ddlesummation\nrightopentriangle\nrightpointer\nrightshoe\nrightsingle'
+    'quotemark\nrightt\nrighttack\ns\nsabovedot\nsacute\nscaron\nscedilla\n'
+    'schwa\nscircumflex\nscript_switch\nseconds\nsection\nsemicolon\nsemivo'
+    'icedsound\nseveneighths\nsignaturemark\nsignifblank\nsimilarequal\nsin'
+    'glelowquotemark\nslash\nsoliddiamond\nspace\nssharp\nsterling\nt\ntabo'
+    'vedot\ntcaron\ntcedilla\ntelephone\ntelephonerecorder\ntherefore\nthin'
+    'space\nthorn\nthreeeighths\nthreefifths\nthreequarters\nthreesuperior'
+    '\ntopintegral\ntopleftparens\ntopleftradical\ntopleftsqbracket\ntoplef'
+    'tsummation\ntoprightparens\ntoprightsqbracket\ntoprightsummation\ntopt'
+    '\ntopvertsummationconnector\ntrademark\ntrademarkincircle\ntslash\ntwo'
+    'fifths\ntwosuperior\ntwothirds\nu\nuacute\nubelowdot\nubreve\nucircumf'
+    'lex\nudiaeresis\nudoubleacute\nugrave\nuhook\nuhorn\nuhornacute\nuhorn'
+    'belowdot\nuhorngrave\nuhornhook\nuhorntilde\numacron\nunderbar\nunders'
+    'core\nunion\nuo\nuogonek\nuparrow\nupcaret\nupleftcorner\nuprightcorne'
+    'r\nupshoe\nupstile\nuptack\nuring\nutilde\nv\nvariation\nvertbar\nvert'
+    'connector\nvoicedsound\nvt\nw\nwacute\nwcircumflex\nwdiaeresis\nwgrave'
+    '\nx\nxabovedot\ny\nyacute\nybelowdot\nycircumflex\nydiaeresis\nyen\nyg'
+    'rave\nyhook\nytilde\nz\nzabovedot\nzacute\nzcaron\nzstroke\n{\n|\n}\n~'
+    '\n\xa0\n\xa1\n\xa2\n\xa3\n\xa4\n\xa5\n\xa6\n\xa7\n\xa8\n\xa9\n\xaa\n'
+    '\xab\n\xac\n\xad\n\xae\n\xaf\n\xb0\n\xb1\n\xb2\n\xb3\n\xb4\n\xb5\n\xb6'
+    '\n\xb7\n\xb8\n\xb9\n\xba\n\xbb\n\xbc\n\xbd\n\xbe\n\xbf\n\xc0\n\xc1\n'
+    '\xc2\n\xc3\n\xc4\n\xc5\n\xc6\n\xc7\n\xc8\n\xc9\n\xca\n\xcb\n\xcc\n\xcd'
+    '\n\xce\n\xcf\n\xd0\n\xd1\n\xd2\n\xd3\n\xd4\n\xd5\n\xd6\n\xd7\n\xd8\n'
+    '\xd9\n\xda\n\xdb\n\xdc\n\xdd\n\xde\n\xdf\n\xe0\n\xe1\n\xe2\n\xe3\n\xe4'
+    '\n\xe5\n\xe6\n\xe7\n\xe8\n\xe9\n\xea\n\xeb\n\xec\n\xed\n\xee\n\xef\n'
+    '\xf0\n\xf1\n\xf2\n\xf3\n\xf4\n\xf5\n\xf6\n\xf7\n\xf8\n\xf9\n\xfa\n\xfb'
+    '\n\xfc\n\xfd\n\xfe\n\xff\n\u0100\n\u0101\n\u0102\n\u0103\n\u0104\n'
+    '\u0105\n\u0106\n\u0107\n\u0108\n\u0109\n\u010a\n\u010b\n\u010c\n\u010d'
+    '\n\u010e\n\u010f\n\u0110\n\u0111\n\u0112\n\u0113\n\u0116\n\u0117\n'
+    '\u0118\n\u0119\n\u011a\n\u011b\n\u011c\n\u011d\n\u011e\n\u011f\n\u0120'
+    '\n\u0121\n\u0122\n\u0123\n\u0124\n\u0125\n\u0126\n\u0127\n\u0128\n'
+    '\u0129\n\u012a\n\u012b\n\u012e\n\u012f\n\u0130\n\u0131\n\u0134\n\u0135'
+    '\n\u0136\n\u0137\n\u0138\n\u0139\n\u013a\n\u013b\n\u013c\n\u013d\n'
+    '\u013e\n\u0141\n\u0142\n\u0143\n\u0144\n\u0145\n\u0146\n\u0147\n\u0148'
+    '\n\u014a\n\u014b\n\u014c\n\u014d\n\u0150\n\u0151\n\u0152\n\u0153\n'
+    '\u0154\n\u0155\n\u0156\n\u0157\n\u0158\n\u0159\n\u015a\n\u015b\n\u015c'
+    '\n\u015d\n\u015e\n\u015f\n\u0160\n\u0161\n\u0162\n\u0163\n\u0164\n'
+    '\u0165\n\u0166\n\u0167\n\u0168\n\u0169\n\u016a\n\u016b\n\u016c\n\u016d'
+    '\n\u016e\n\u016f\n\u0170\n\u0171\n\u0172\n\u0173\n\u0178\n\u0179\n'
+    '\u017a\n\u017b\n\u017c\n\u017d\n\u017e\n\u0192\n\u02c7\n\u02d8\n\u02d9'
+    '\n\u02db\n\u02dd\n\u0385\n\u0386\n\u0388\n\u0389\n\u038a\n\u038c\n'
+    '\u038e\n\u038f\n\u0390\n\u0391\n\u0392\n\u0393\n\u0394\n\u0395\n\u0396'
+    '\n\u0397\n\u0398\n\u0399\n\u039a\n\u039b\n\u039c\n\u039d\n\u039e\n'
+    '\u039f\n\u03a0\n\u03a1\n\u03a3\n\u03a4\n\u03a5\n\u03a6\n\u03a7\n\u03a8'
+    '\n\u03a9\n\u03aa\n\u03ab\n\u03ac\n\u03ad\n\u03ae\n\u03af\n\u03b0\n'
+    '\u03b1\n\u03b2\n\u03b3\n\u03b4\n\u03b5\n\u03b6\n\u03b7\n\u03b8\n\u03b9'
+    '\n\u03ba\n\u03bb\n\u03bc\n\u03bd\n\u03be\n\u03bf\n\u03c0\n\u03c1\n'
+    '\u03c2\n\u03c3\n\u03c4\n\u03c5\n\u03c6\n\u03c7\n\u03c8\n\u03c9\n\u03ca'
+    '\n\u03cb\n\u03cc\n\u03cd\n\u03ce\n\u0401\n\u0402\n\u0403\n\u0404\n'
+    '\u0405\n\u0406\n\u0407\n\u0408\n\u0409\n\u040a\n\u040b\n\u040c\n\u040e'
+    '\n\u040f\n\u0410\n\u0411\n\u0412\n\u0413\n\u0414\n\u0415\n\u0416\n'
+    '\u0417\n\u0418\n\u0419\n\u041a\n\u041b\n\u041c\n\u041d\n\u041e\n\u041f'
+    '\n\u0420\n\u0421\n\u0422\n\u0423\n\u0424\n\u0425\n\u0426\n\u0427\n'
+    '\u0428\n\u0429\n\u042a\n\u042b\n\u042c\n\u042d\n\u042e\n\u042f\n\u0430'
+    '\n\u0431\n\u0432\n\u0433\n\u0434\n\u0435\n\u0436\n\u0437\n\u0438\n'
+    '\u0439\n\u043a\n\u043b\n\u043c\n\u043d\n\u043e\n\u043f\n\u0440\n\u0441'
+    '\n\u0442\n\u0443\n\u0444\n\u0445\n\u0446\n\u0447\n\u0448\n\u0449\n'
+    '\u044a\n\u044b\n\u044c\n\u044d\n\u044e\n\u044f\n\u0451\n\u0452\n\u0453'
+    '\n\u0454\n\u0455\n\u0456\n\u0457\n\u0458\n\u0459\n\u045a\n\u045b\n'
+    '\u045c\n\u045e\n\u045f\n\u0490\n\u0491\n\u05d0\n\u05d1\n\u05d2\n\u05d3'
+    '\n\u05d4\n\u05d5\n\u05d6\n\u05d7\n\u05d8\n\u05d9\n\u05da\n\u05db\n'
+    '\u05dc\n\u05dd\n\u05de\n\u05df\n\u05e0\n\u05e1\n\u05e2\n\u05e3\n\u05e4'
+    '\n\u05e5\n\u05e6\n\u05e7\n\u05e8\n\u05e9\n\u05ea\n\u060c\n\u061b\n'
+    '\u061f\n\u0621\n\u0622\n\u0623\n\u0624\n\u0625\n\u0626\n\u0627\n\u0628'
+    '\n\u0629\n\u062a\n\u062b\n\u062c\n\u062d\n\u062e\n\u062f\n\u0630\n'
+    '\u0631\n\u0632\n\u0633\n\u0634\n\u0635\n\u0636\n\u0637\n\u0638\n\u0639'
+    '\n\u063a\n\u0640\n\u0641\n\u0642\n\u0643\n\u0644\n\u0645\n\u0646\n'
+    '\u0647\n\u0648\n\u0649\n\u064a\n\u064b\n\u064c\n\u064d\n\u064e\n\u064f'
+    '\n\u0650\n\u0651\n\u0652\n\u0e01\n\u0e02\n\u0e03\n\u0e04\n\u0e05\n'
+    '\u0e06\n\u0e07\n\u0e08\n\u0e09\n\u0e0a\n\u0e0b\n\u0e0c\n\u0e0d\n\u0e0e'
+    '\n\u0e0f\n\u0e10\n\u0e11\n\u0e12\n\u0e13\n\u0e14\n\u0e15\n\u0e16\n'
+    '\u0e17\n\u0e18\n\u0e19\n\u0e1a\n\u0e1b\n\u0e1c\n\u0e1d\n\u0e1e\n\u0e1f'
+    '\n\u0e20\n\u0e21\n\u0e22\n\u0e23\n\u0e24\n\u0e25\n\u0e26\n\u0e27\n'
+    '\u0e28\n\u0e29\n\u0e2a\n\u0e2b\n\u0e2c\n\u0e2d\n\u0e2e\n\u0e2f\n\u0e30'
+    '\n\u0e31\n\u0e32\n\u0e33\n\u0e34\n\u0e35\n\u0e36\n\u0e37\n\u0e38\n'
+    '\u0e39\n\u0e3a\n\u0e3f\n\u0e40\n\u0e41\n\u0e42\n\u0e43\n\u0e44\n\u0e45'
+    '\n\u0e46\n\u0e47\n\u0e48\n\u0e49\n\u0e4a\n\u0e4b\n\u0e4c\n\u0e4d\n'
+    '\u0e50\n\u0e51\n\u0e52\n\u0e53\n\u0e54\n\u0e55\n\u0e56\n\u0e57\n\u0e58'
+    '\n\u0e59\n\u2002\n\u2003\n\u2004\n\u2005\n\u2007\n\u2008\n\u2009\n'
+    '\u200a\n\u2012\n\u2013\n\u2014\n\u2015\n\u2017\n\u2018\n\u2019\n\u201a'
+    '\n\u201c\n\u201d\n\u201e\n\u2020\n\u2021\n\u2025\n\u2026\n\u2032\n'
+    '\u2033\n\u2038\n\u203e\n\u20ac\n\u2105\n\u2116\n\u2117\n\u211e\n\u2122'
+    '\n\u2153\n\u2154\n\u2155\n\u2156\n\u2157\n\u2158\n\u2159\n\u215a\n'
+    '\u215b\n\u215c\n\u215d\n\u215e\n\u2190\n\u2191\n\u2192\n\u2193\n\u21d2'
+    '\n\u21d4\n\u2202\n\u2207\n\u2218\n\u221a\n\u221d\n\u221e\n\u2227\n'
+    '\u2228\n\u2229\n\u222a\n\u222b\n\u2234\n\u223c\n\u2243\n\u2260\n\u2261'
+    '\n\u2264\n\u2265\n\u2282\n\u2283\n\u22a2\n\u22a3\n\u22a4\n\u22a5\n'
+    '\u2308\n\u230a\n\u2315\n\u2320\n\u2321\n\u2395\n\u239b\n\u239d\n\u239e'
+    '\n\u23a0\n\u23a1\n\u23a3\n\u23a4\n\u23a6\n\u23a8\n\u23ac\n\u23b7\n'
+    '\u23ba\n\u23bb\n\u23bc\n\u23bd\n\u2409\n\u240a\n\u240b\n\u240c\n\u240d'
+    '\n\u2424\n\u2500\n\u2502\n\u250c\n\u2510\n\u2514\n\u2518\n\u251c\n'
+    '\u2524\n\u252c\n\u2534\n\u253c\n\u2592\n\u25c6\n\u25cb\n\u260e\n\u2640'
+    '\n\u2642\n\u2663\n\u2665\n\u2666\n\u266d\n\u266f\n\u2713\n\u2717\n'
+    '\u271d\n\u2720\n\u3001\n\u3002\n\u300c\n\u300d\n\u309b\n\u309c\n\u30a1'
+    '\n\u30a2\n\u30a3\n\u30a4\n\u30a5\n\u30a6\n\u30a7\n\u30a8\n\u30a9\n'
+    '\u30aa\n\u30ab\n\u30ad\n\u30af\n\u30b1\n\u30b3\n\u30b5\n\u30b7\n\u30b9'
+    '\n\u30bb\n\u30bd\n\u30bf\n\u30c1\n\u30c3\n\u30c4\n\u30c6\n\u30c8\n'
+    '\u30ca\n\u30cb\n\u30cc\n\u30cd\n\u30ce\n\u30cf\n\u30d2\n\u30d5\n\u30d8'
+    '\n\u30db\n\u30de\n\u30df\n\u30e0\n\u30e1\n\u30e2\n\u30e3\n\u30e4\n'
+    '\u30e5\n\u30e6\n\u30e7\n\u30e8\n\u30e9\n\u30ea\n\u30eb\n\u30ec\n\u30ed'
+    '\n\u30ef\n\u30f2\n\u30f3\n\u30fb\n\u30fc')
+
+#: The keysyms of the keys, as 32 bit big endian hexadecimal numbers
+_KEYSYMS = (
+    '0000002000000021000000220000002300000024000000250000002600000027000000'
+    '28000000290000002a0000002b0000002c0000002d0000002e0000002f000000300000'
+    '003100000032000000330000fd100000fd0e0000fd050000fd190000fd150000fd0f00'
+    '00fd1c0000fd1a0000fd010000fd1e0000fd060000fd070000fd1b0000fd020000fd13'
+    '0000fd120000fd110000fd040000fd0a0000fd0b0000fd0c0000fd160000fd1d0000fd'
+    '090000fd180000fd080000fd030000fd140000fd170000fd0d00000034000000350000'
+    '00360000003700000038000000390000003a0000003b0000003c0000003d0000003e00'
+    '00003f0000004000000041000000c6000000c100001ea0000001c300001eae00001eb6'
+    '00001eb000001eb200001eb40000fe700000fe71000000c200001ea400001eac00001e'
+    'a600001ea800001eaa000000c4000000c000001ea20000ffe90000ffea000003c00000'
+    '01a1000005b0000005b1000005b2000005b3000005b4000005b5000005b6000005b700'
+    '0005b8000005b9000005d9000005c7000005e9000005c8000005ac000005d6000005cf'
+    '000005ef000005ec000005aa000005ee000005eb000005e1000005ae000005f9000005'
+    'da000005e7000005cd000005c1000005f4000005f5000005c3000005c4000005c60000'
+    '05c5000005e7000005fb000005fe000005cc000005f6000005e3000005f0000005ed00'
+    '0005f8000005ce000005e4000005f3000005c2000005e5000005e6000005fa000005a8'
+    '000005a5000005e2000005bf000005d1000005ab000005d5000005d3000005bb000005'
+    'f1000005d4000005f2000005a60000ff7e000005d7000005e0000005a9000005ca0000'
+    '05c9000005d0000005cb000005a7000005f7000005e8000005ea000005fd000005d800'
+    '0005d2000000c5000014c0000014b2000014b4000014e2000014b8000014d2000014be'
+    '000014fc000014d4000014b6000014da000014d0000014c6000014e6000014f8000014'
+    'ce000014ca000014c8000014d8000014dc000014fa000014e4000014f6000014e80000'
+    '14f0000014ea000014de000014d6000014c2000014cc000014f2000014ee000014ec00'
+    '0014e0000014f4000014ba000014bc000014c4000014af000014fe000014c1000014b3'
+    '000014b5000014aa000014e3000014ab000014b9000014d3000014bf000014ae000014'
+    'a8000014ac000014a1000014fd000014d5000014b7000014a7000014a6000014db0000'
+    '14d1000014c7000014e7000014f9000014cf000014cb000014a2000014c9000014d900'
+    '0014a9000014dd000014fb000014a5000014a4000014b1000014e5000014f7000014e9'
+    '000014f1000014eb000014ff000014df000014b0000014d7000014c3000014cd000014'
+    'f3000014ef000014a3000014ed000014e1000014f5000014bb000014ad000014bd0000'
+    '14c5000000c30000fe7a00000042000012a10000ff080000ff580000fe740000ff6b00'
+    '0006be000006ae00000043000002c5000001c60000ff690000ffe5000001c8000000c7'
+    '000016a2000002c60000ff0b0000ff37000020a10000ffe30000ffe4000020a2000006'
+    'e1000006e2000006fe0000068800000689000006e4000006bf000006fc000006e60000'
+    '06ec000006ed000006ee00000684000006f2000006f3000006e700000680000006e800'
+    '0006ff00000687000006e9000006e5000006b30000068d000006b8000006eb00000682'
+    '00000683000006b9000006ba000006ef0000068e000006f00000068c000006fb000006'
+    'fd0000068a000006ea000006f8000006f4000006e3000006f50000068f000006850000'
+    '0686000006f7000006f1000006f9000006e0000006fa000006f600000681000006c100'
+    '0006c2000006de0000069800000699000006c4000006af000006dc000006c6000006cc'
+    '000006cd000006ce00000694000006d2000006d3000006c700000690000006c8000006'
+    '97000006df000006c90000069d000006c5000006a3000006a8000006cb000006920000'
+    '0693000006a9000006aa000006cf0000069e000006d00000069c000006db000006dd00'
+    '00069a000006ca000006d8000006d4000006c3000006d50000069f0000069500000696'
+    '000006d7000006d1000006d9000006c0000006da000006d60000069100000044000012'
+    'a6000001cf0000ffff000020ab0000ff54000001d000000045000003bd000000d00000'
+    '03cc000000c900001eb8000001cc000000ca00001ebe00001ec600001ec000001ec200'
+    '001ec4000020a0000000cb000000c800001eba0000ff2f0000ff30000003aa0000ff57'
+    '000001ca0000ff1b000000d000001ebc000020ac0000ff62000000460000ffbe0000ff'
+    'c70000ffc80000ffc90000ffca0000ffcb0000ffcc0000ffcd0000ffce0000ffcf0000'
+    'ffd00000ffbf0000ffd10000ffd20000ffd30000ffd40000ffd50000ffd60000ffd700'
+    '00ffd80000ffd90000ffda0000ffc00000ffdb0000ffdc0000ffdd0000ffde0000ffdf'
+    '0000ffe00000ffc10000ffc20000ffc30000ffc40000ffc50000ffc6000020a3000012'
+    'b000000590000005910000059200000593000005940000059500000596000005970000'
+    '059800000599000005fc0000ff680000fed000000047000002d5000002ab000016aa00'
+    '0003ab000002d8000015d0000015d1000015ea000015ed000015e9000015ec000015d3'
+    '000015d4000015f6000015d2000015e6000015f0000015f4000015f1000015f2000015'
+    'f5000015d8000015ef000015eb000015d9000015e5000015da000015db000015dc0000'
+    '15dd000015de000015e4000015e7000015e0000015e1000015e8000015d7000015e200'
+    '0015e3000015d5000015f3000015ee000015d6000015df000007c1000007a1000007c2'
+    '000007d7000007c4000007c5000007a2000007c7000007a3000007c3000007c9000007'
+    'a4000007a5000007ca000007cb000007cb000007cc000007cd000007d9000007ab0000'
+    '07cf000007a7000007d6000007d0000007d8000007d1000007d2000007d4000007c800'
+    '0007d5000007a8000007a9000007ce000007c6000007ae000007e1000007b1000007e2'
+    '000007f7000007e4000007e5000007b2000007e7000007b3000007f3000007e3000007'
+    'af000007e9000007b4000007b6000007b5000007ea000007eb000007eb000007ec0000'
+    '07ed000007f9000007bb000007ef000007b7000007f6000007f0000007f8000007f100'
+    '0007f20000ff7e000007f4000007e8000007f5000007b8000007ba000007b9000007ee'
+    '000007e6000016d3000000480000ff3100000ebf00000ec000000ef600000ef70000ff'
+    '3900000eba0000ff3700000ea700000ec400000ec300000ed10000ff330000ff340000'
+    '0ebe00000ed300000eb700000eea00000eda00000eee00000ee800000ee900000eeb00'
+    '000ed400000ed600000ef900000ee300000ed700000ed900000ed800000ef800000eed'
+    '00000ee400000ee500000edb00000ee200000edc00000edd00000ee100000ede00000e'
+    'df00000ee000000ee600000ed500000ee700000eec00000efa0000ff350000ff380000'
+    '0eb800000ebb00000ea100000ea300000ef300000eb10000ff3d00000ea400000ea600'
+    '000ea500000ec700000eca00000ef200000ebd00000eb200000eb40000ff3b0000ff3a'
+    '0000ff3e00000ea900000eb000000eaa00000eab00000eaf00000eac00000ead00000e'
+    'ae00000eef0000ff360000ff3c00000eb50000ff3f00000ea800000eb900000ea20000'
+    '0eb300000eb60000ff3200000ef000000ef400000ef100000ebc00000ecc00000ec800'
+    '000ec900000ece00000ecd00000ecf00000ec100000ec200000ec600000ec500000ed2'
+    '00000ecb00000ed000000ef50000ff7e0000ff29000002a60000ff7e0000ff6a0000ff'
+    '230000ff230000ff250000ff270000ff50000002a10000ffed0000ffee000000490000'
+    '16a70000fe330000fe300000fe310000fe320000fe340000fe2f0000fe2c0000fe2d00'
+    '00fe2e0000fe0c0000fe0d0000fe060000fe070000ff7e0000fe0e0000fe0f0000fe20'
+    '0000fe020000fe040000fe050000fe030000fe010000fe220000fe210000fe080000fe'
+    '090000fe240000fe230000fe250000fe260000fe0a0000fe0b0000fe2b0000fe290000'
+    'fe2a0000fe270000fe28000002a9000000cd00001eca000016a6000000ce000000cf00'
+    '0000cc00001ec8000003cf0000ff63000003c7000003a50000004a000002ac0000004b'
+    '0000ffb00000ffb10000ffb20000ffb30000ffb40000ffb50000ffb60000ffb70000ff'
+    'b80000ffb90000ffab0000ff9d0000ffae0000ff9f0000ffaf0000ff990000ff9c0000'
+    'ff8d0000ffbd0000ff910000ff920000ff930000ff940000ff950000ff9e0000ff9600'
+    '00ffaa0000ff9b0000ff9b0000ff9a0000ff9a0000ff980000ffac0000ff800000ffad'
+    '0000ff890000ff970000ff2d0000ff2e0000ff210000ff26000003d300000eff000000'
+    '4c0000ffc80000ffd10000ffc90000ffca0000ffcb0000ffcc0000ffcd0000ffce0000'
+    'ffcf0000ffd0000001c50000fed4000016d1000001a5000003a60000ff510000ff0a00'
+    '0020a4000001a3000016d20000004d000012b4000006b5000006b2000006bc000006a5'
+    '000006a2000006ac0000ff3e0000ff2c0000ff670000ffe70000ffe8000020a50000ff'
+    '7e0000fe770000fe760000ff220000ff200000ff3d0000004e000001d1000020a60000'
+    '01d2000003d1000020aa0000ff560000fed2000000d10000ff7f0000004f000013bc00'
+    '0000d3000016af00001ecc000016b4000000d400001ed000001ed800001ed200001ed4'
+    '00001ed6000000d6000001d5000000d200001ece00001efa00001eda00001ee200001e'
+    'dc00001ede00001ee0000003d2000000d8000000d50000fe780000fe79000000500000'
+    '12b70000ff560000ff550000ff13000020a70000fefa0000fee90000feea0000feeb00'
+    '00feec0000feed0000fee80000feef0000fef00000fef10000fef20000fef30000feee'
+    '0000fefb0000fefc0000fee30000fee60000fee70000fef50000fef60000fef70000fe'
+    'f80000fefd0000fef40000fef90000fee00000fee10000fee20000fee40000fee50000'
+    'fed10000ff3e0000ff610000ff5500000051000016a5000000520000ffd20000ffdb00'
+    '00ffdc0000ffdd0000ffde0000ffdf0000ffe00000ffd30000ffd40000ffd50000ffd6'
+    '0000ffd70000ffd80000ffd90000ffda000001c0000001d8000003a30000ff660000fe'
+    '720000ff0d0000ff530000ff24000020a800000053000016c6000012bb000001a60000'
+    '01a9000001aa000002de0000ff140000ff60000006b1000006bf000006b8000006b900'
+    '0006ba000006bb000006a1000006af000006a8000006a9000006aa000006ab0000ffe1'
+    '0000ffe60000ffe20000ff3c0000fe730000fe750000ffeb0000ffec0000ff15000000'
+    '54000000de0000ff09000012d7000001ab000001de0000fed500000ddf00000dba0000'
+    '0da800000daa00000da900000dac00000dae00000db400000dbd00000dbf00000dcb00'
+    '000dce00000da200000da500000da300000da400000da600000da100000de500000df7'
+    '00000df500000df600000df900000df100000df800000df300000df400000df200000d'
+    'f000000dcc00000dc500000dc600000deb00000de800000dd100000dde00000de70000'
+    '0de900000dea00000de600000dc100000da700000ded00000db300000db900000dcd00'
+    '000dcf00000dda00000dbe00000dbc00000dc000000dbb00000dc300000dc400000dd0'
+    '00000dd200000de100000de400000de300000dd300000de000000dd400000dd500000d'
+    'e200000dd800000dd600000dd700000dd900000dc900000dc800000dab00000dca0000'
+    '0dec00000db100000db200000db700000db000000db800000db600000daf00000db500'
+    '000dc700000dc200000dad000000de0000ff2b000003ac00000055000016a8000000da'
+    '00001ee4000002dd000000db000000dc000001db000000d900001ee600001efc00001e'
+    'e800001ef000001eea00001eec00001eee000006bd000006b6000006b4000006b70000'
+    '06ad000006a6000006a4000006a7000006b6000006b4000006b7000006a6000006a400'
+    '0006a7000003de0000ff65000003d90000ff52000001d9000003dd0000005600ffffff'
+    '00000057000012aa000012d0000012bd000012a8000020a9000000581008ff391008ff'
+    '501008ff511008ff9b1008ff971008ff111008ff321008ffb21008ff121008ff171008'
+    'ff311008ff141008ffb61008ff161008ff131008ff991008ff1c1008ff981008ff3e10'
+    '08ff151008ff8d1008ff261008ff931008ffa61008ff941008ff521008ff3b1008ff53'
+    '1008ff541008ff1d1008ff201008ff551008fe211008ff561008ff3d1008ff221008ff'
+    '571008ff581008ff9c1008ff5a1008ff591008ff5b1008ff2c1008ff5c1008ff5d1008'
+    'ff301008ff3c1008ff271008ff9d1008ff9e1008ffb81008ff5e1008ff5f1008ffa410'
+    '08ffa81008ff371008ff181008ff3a1008ff061008ff051008ff041008ffb31008ff40'
+    '1008ff411008ff421008ff431008ff441008ff451008ff461008ff471008ff481008ff'
+    '491008ff4a1008ff4b1008ff4c1008ff4d1008ff4e1008ff4f1008ff351008fe251008'
+    'ff611008fe241008ff191008ff901008ff621008ff631008ff1e1008ff651008ff6610'
+    '08ff8e1008ff011008ff071008ff031008ff021008ff921008ff331008ff671008ff68'
+    '1008ff691008fe221008ff6a1008ff6b1008ff381008ff6c1008ff6d1008ff6e1008ff'
+    '911008ff211008ff2a1008fe231008ff701008ffb51008ffa31008ff291008ff731008'
+    'ff721008ff241008ff251008ff231008ff741008ff761008ffb71008ff751008ff7710'
+    '08ff2d1008ff7a1008ff791008ff781008ff1b1008ffa01008ff7b1008ff361008ff2f'
+    '1008ff7c1008ff7d1008ff101008ff1a1008ff281008ff9a1008ff7e1008ffa71008fe'
+    '011008fe0a1008fe0b1008fe0c1008fe021008fe031008fe041008fe051008fe061008'
+    'fe071008fe081008fe091008ff7f1008ff801008ff9f1008ff1f1008ff811008ffa210'
+    '08ffb11008ffb01008ffa91008ff821008ff961008fe201008ff851008ff861008ff84'
+    '1008ff341008ff871008ffa11008ff951008ffb41008ff2e1008ff2b1008ff8f1008ff'
+    '881008ff891008ff3f1008ff8a1008ffa51008ff8b1008ff8c1008ff60000016a30000'
+    '0059000000dd00001ef4000012de000013be000012ac00001ef600001ef80000005a00'
+    '0001af000001ac000001ae0000ff3d0000ff280000ff2a000016a90000005b0000005c'
+    '0000005d0000005e0000005f0000006000000061000000e100001ea1000001ff000001'
+    'e300001eaf00001eb700001eb100001eb300001eb5000000e200001ea500001ead0000'
+    '1ea700001ea900001eab000000b4000000e4000000e6000000e000001ea3000003e000'
+    '000026000001b100000027000008c8000000e50000005e0000007e0000002a00000040'
+    '000000e300000062000012a20000005c00000af40000007c000009df000008a5000008'
+    'ac000008a8000008b2000008ae000008aa000008b6000009f6000008b40000007b0000'
+    '007d0000005b0000005d000001a2000000a600000063000002e5000001e600000ab800'
+    '000afc000001b7000001e8000000e7000016b2000002e6000000b8000000a2000009e1'
+    '00000af300000bcf00000aec0000003a00001ef300001eff00001ef200001efe00001e'
+    '9f0000002c000000a9000009e4000009ee000000a400000aff00000064000012ab0000'
+    '0af1000001ef0000fe560000fe580000fe510000fe600000fe550000fe5a0000fe5b00'
+    '00fe520000fe570000fe590000fe500000fe610000fe620000fe5d0000fe540000fe5c'
+    '0000fe5f0000fe530000fe5e00000abd000000b0000000a800000aed00000aa5000000'
+    'f70000002400000aaf000001bd00000af200000afe000008fe00000ba800000bd60000'
+    '0bc400000bc2000001f000000065000003ec000000e900001eb9000001ec000000ea00'
+    '001ebf00001ec700001ec100001ec300001ec5000000eb000000e800001ebb00000aae'
+    '00000aa300000aa4000003ba00000aa900000ade00000adf00000ace00000acf00000a'
+    'a100000aaa00000ae600000ae7000003bf00000ae000000ae100000aa2000001ea0000'
+    '003d000000f000001ebd00000021000000a100000066000012b100000af8000009e300'
+    '000abb00000adc00000adb00000add00000ae900000ae800000ac500000ab700000ab5'
+    '000008f600000067000002f5000002bb000016ba000003bb000002f800000060000000'
+    '3e000008be000016e3000000ab000000bb0000006800000aa8000002b600000aee0000'
+    '0ce000000cf200000ce100000ce100000ce700000ce300000ce300000cdf00000cea00'
+    '000ced00000cef00000cf300000cf500000cf500000ce200000ce200000ce400000ce7'
+    '00000ceb00000cf700000cec00000cee00000cf000000cf400000cf700000cf800000c'
+    'f100000cf100000cf900000cfa00000cfa00000ce800000ce800000ce500000ce90000'
+    '0cf600000cf600000ce600000ce600000ada000008a3000009ef000009f0000009f100'
+    '0009f2000009f3000002b1000009e2000000ad00000069000000ed00001ecb000016b6'
+    '000000ee000008cf000000ef000002b9000016b7000008cd000000ec00001ec9000003'
+    'ef000008ce000008da000008db000008c2000008bf000008dc000003e7000003b50000'
+    '006a000002bc00000bca0000006b000004b1000004c1000004b4000004cc000004ca00'
+    '0004cd000004cb000004ce000004cc000004b2000004b6000004b9000004b7000004ba'
+    '000004b8000004cf000004d2000004d0000004d3000004d1000004dd000004c5000004'
+    'c8000004c6000004c9000004c7000004b5000004d7000004da000004d8000004db0000'
+    '04d9000004bb000004be000004bc000004bf000004bd000004c0000004c3000004c100'
+    '0004c4000004c2000004c2000004b3000004dc000004a6000004d4000004d6000004d5'
+    '000004a7000004a3000004a4000004a5000004aa000004a1000004a8000004a5000004'
+    'ab000004a20000ff7e000004af000004af000004a9000004ac000004ae000004ad0000'
+    '03a2000003f3000003a20000006c000001e500000ad9000016e1000001b5000003b600'
+    '000abc000008fb00000ba300000ad2000008af00000acc00000aea000008a100000bda'
+    '00000ad0000009f400000bdc0000003c000008bc000009e5000008de000008df000009'
+    'ed000009ea000001b3000016e20000006d000012b5000000af00000af700000af00000'
+    '0abf000000ba0000002d00000ad6000000b5000000d700000af600000af50000006e00'
+    '0008c5000001f1000001f2000003f1000009e8000000a0000008bd000000ac000000f1'
+    '00000023000006b00000006f000000f3000016bf00001ecd000016bd000000f400001e'
+    'd100001ed900001ed300001ed500001ed7000000f6000001f5000013bd000001b20000'
+    '00f200001ecf00001efb00001edb00001ee300001edd00001edf00001ee1000003f200'
+    '000ac300000ab2000000bd000000bc00000ab6000000b900000ab000000ae200000ae5'
+    '00000ae400000ae3000000aa000000f8000000f500000bc00000047e00000070000012'
+    'b9000000b60000002800000029000008ef000000250000002e000000b700000afb0000'
+    '002b000000b100000ad4000004b000000aa600000071000016b500000bcc0000003f00'
+    '0000bf00000022000000600000002700000072000001e0000008d6000001f8000003b3'
+    '000000ae00000abe000008fd00000ba600000ad3000008b0000008b700000acd00000a'
+    'eb00000bd800000ad1000009f500000bfc00000073000012bf000001b6000001b90000'
+    '01ba000016f6000002fe0000ff7e00000ad7000000a70000003b000004df00000ac600'
+    '000aca00000aac000008c900000afd0000002f000009e000000020000000df000000a3'
+    '00000074000012f7000001bb000001fe00000af900000afa000008c000000aa7000000'
+    'fe00000ac400000ab4000000be000000b3000008a4000008ab000008a2000008a70000'
+    '08b1000008ad000008a9000008b5000009f7000008b300000ac900000acb000003bc00'
+    '000ab3000000b200000ab100000075000000fa00001ee5000002fd000000fb000000fc'
+    '000001fb000000f900001ee700001efd00001ee900001ef100001eeb00001eed00001e'
+    'ef000003fe00000bc60000005f000008dd000016b8000003f9000008fc00000ba90000'
+    '09ec000009eb00000bc300000bd300000bce000001f9000003fd00000076000008c100'
+    '0009f8000008a6000004de000009e900000077000012ba000012f0000012be000012b8'
+    '00000078000016b300000079000000fd00001ef5000012fe000000ff000000a5000012'
+    'bc00001ef700001ef90000007a000001bf000001bc000001be000016b90000007b0000'
+    '007c0000007d0000007e000000a0000000a1000000a2000000a3000000a4000000a500'
+    '0000a6000000a7000000a8000000a9000000aa000000ab000000ac000000ad000000ae'
+    '000000af000000b0000000b1000000b2000000b3000000b4000000b5000000b6000000'
+    'b7000000b8000000b9000000ba000000bb000000bc000000bd000000be000000bf0000'
+    '00c0000000c1000000c2000000c3000000c4000000c5000000c6000000c7000000c800'
+    '0000c9000000ca000000cb000000cc000000cd000000ce000000cf000000d0000000d1'
+    '000000d2000000d3000000d4000000d5000000d6000000d7000000d8000000d9000000'
+    'da000000db000000dc000000dd000000de000000df000000e0000000e1000000e20000'
+    '00e3000000e4000000e5000000e6000000e7000000e8000000e9000000ea000000eb00'
+    '0000ec000000ed000000ee000000ef000000f0000000f1000000f2000000f3000000f4'
+    '000000f5000000f6000000f7000000f8000000f9000000fa000000fb000000fc000000'
+    'fd000000fe000000ff000003c0000003e0000001c3000001e3000001a1000001b10000'
+    '01c6000001e6000002c6000002e6000002c5000002e5000001c8000001e8000001cf00'
+    '0001ef000001d0000001f0000003aa000003ba000003cc000003ec000001ca000001ea'
+    '000001cc000001ec000002d8000002f8000002ab000002bb000002d5000002f5000003'
+    'ab000003bb000002a6000002b6000002a1000002b1000003a5000003b5000003cf0000'
+    '03ef000003c7000003e7000002a9000002b9000002ac000002bc000003d3000003f300'
+    '0003a2000001c5000001e5000003a6000003b6000001a5000001b5000001a3000001b3'
+    '000001d1000001f1000003d1000003f1000001d2000001f2000003bd000003bf000003'
+    'd2000003f2000001d5000001f5000013bc000013bd000001c0000001e0000003a30000'
+    '03b3000001d8000001f8000001a6000001b6000002de000002fe000001aa000001ba00'
+    '0001a9000001b9000001de000001fe000001ab000001bb000003ac000003bc000003dd'
+    '000003fd000003de000003fe000002dd000002fd000001d9000001f9000001db000001'
+    'fb000003d9000003f9000013be000001ac000001bc000001af000001bf000001ae0000'
+    '01be000008f6000001b7000001a2000001ff000001b2000001bd000007ae000007a100'
+    '0007a2000007a3000007a4000007a7000007a8000007ab000007b6000007c1000007c2'
+    '000007c3000007c4000007c5000007c6000007c7000007c8000007c9000007ca000007'
+    'cb000007cc000007cd000007ce000007cf000007d0000007d1000007d2000007d40000'
+    '07d5000007d6000007d7000007d8000007d9000007a5000007a9000007b1000007b200'
+    '0007b3000007b4000007ba000007e1000007e2000007e3000007e4000007e5000007e6'
+    '000007e7000007e8000007e9000007ea000007eb000007ec000007ed000007ee000007'
+    'ef000007f0000007f1000007f3000007f2000007f4000007f5000007f6000007f70000'
+    '07f8000007f9000007b5000007b9000007b7000007b8000007bb000006b3000006b100'
+    '0006b2000006b4000006b5000006b6000006b7000006b8000006b9000006ba000006bb'
+    '000006bc000006be000006bf000006e1000006e2000006f7000006e7000006e4000006'
+    'e5000006f6000006fa000006e9000006ea000006eb000006ec000006ed000006ee0000'
+    '06ef000006f0000006f2000006f3000006f4000006f5000006e6000006e8000006e300'
+    '0006fe000006fb000006fd000006ff000006f9000006f8000006fc000006e0000006f1'
+    '000006c1000006c2000006d7000006c7000006c4000006c5000006d6000006da000006'
+    'c9000006ca000006cb000006cc000006cd000006ce000006cf000006d0000006d20000'
+    '06d3000006d4000006d5000006c6000006c8000006c3000006de000006db000006dd00'
+    '0006df000006d9000006d8000006dc000006c0000006d1000006a3000006a1000006a2'
+    '000006a4000006a5000006a6000006a7000006a8000006a9000006aa000006ab000006'
+    'ac000006ae000006af000006bd000006ad00000ce000000ce100000ce200000ce30000'
+    '0ce400000ce500000ce600000ce700000ce800000ce900000cea00000ceb00000cec00'
+    '000ced00000cee00000cef00000cf000000cf100000cf200000cf300000cf400000cf5'
+    '00000cf600000cf700000cf800000cf900000cfa000005ac000005bb000005bf000005'
+    'c1000005c2000005c3000005c4000005c5000005c6000005c7000005c8000005c90000'
+    '05ca000005cb000005cc000005cd000005ce000005cf000005d0000005d1000005d200'
+    '0005d3000005d4000005d5000005d6000005d7000005d8000005d9000005da000005e0'
+    '000005e1000005e2000005e3000005e4000005e5000005e6000005e7000005e8000005'
+    'e9000005ea000005eb000005ec000005ed000005ee000005ef000005f0000005f10000'
+    '05f200000da100000da200000da300000da400000da500000da600000da700000da800'
+    '000da900000daa00000dab00000dac00000dad00000dae00000daf00000db000000db1'
+    '00000db200000db300000db400000db500000db600000db700000db800000db900000d'
+    'ba00000dbb00000dbc00000dbd00000dbe00000dbf00000dc000000dc100000dc20000'
+    '0dc300000dc400000dc500000dc600000dc700000dc800000dc900000dca00000dcb00'
+    '000dcc00000dcd00000dce00000dcf00000dd000000dd100000dd200000dd300000dd4'
+    '00000dd500000dd600000dd700000dd800000dd900000dda00000ddf00000de000000d'
+    'e100000de200000de300000de400000de500000de600000de700000de800000de90000'
+    '0dea00000deb00000dec00000ded00000df000000df100000df200000df300000df400'
+    '000df500000df600000df700000df800000df900000aa200000aa100000aa300000aa4'
+    '00000aa500000aa600000aa700000aa800000abb00000aaa00000aa9000007af00000c'
+    'df00000ad000000ad100000afd00000ad200000ad300000afe00000af100000af20000'
+    '0aaf00000aae00000ad600000ad700000afc0000047e000020ac00000ab8000006b000'
+    '000afb00000ad400000ac900000ab000000ab100000ab200000ab300000ab400000ab5'
+    '00000ab600000ab700000ac300000ac400000ac500000ac6000008fb000008fc000008'
+    'fd000008fe000008ce000008cd000008ef000008c500000bca000008d6000008c10000'
+    '08c2000008de000008df000008dc000008dd000008bf000008c0000008c8000008c900'
+    '0008bd000008cf000008bc000008be000008da000008db00000bdc00000bfc00000bce'
+    '00000bc200000bd300000bc400000afa000008a4000008a500000bcc000008ab000008'
+    'ac000008ad000008ae000008a7000008a8000008a9000008aa000008af000008b00000'
+    '08a1000009ef000009f0000009f2000009f3000009e2000009e5000009e9000009e300'
+    '0009e4000009e8000009f1000009f8000009ec000009eb000009ed000009ea000009f4'
+    '000009f5000009f7000009f6000009ee000009e1000009e000000bcf00000af900000a'
+    'f800000af700000aec00000aee00000aed00000af600000af500000af300000af40000'
+    '0ad900000af0000004a4000004a1000004a2000004a3000004de000004df000004a700'
+    '0004b1000004a8000004b2000004a9000004b3000004aa000004b4000004ab000004b5'
+    '000004b6000004b7000004b8000004b9000004ba000004bb000004bc000004bd000004'
+    'be000004bf000004c0000004c1000004af000004c2000004c3000004c4000004c50000'
+    '04c6000004c7000004c8000004c9000004ca000004cb000004cc000004cd000004ce00'
+    '0004cf000004d0000004d1000004d2000004d3000004ac000004d4000004ad000004d5'
+    '000004ae000004d6000004d7000004d8000004d9000004da000004db000004dc000004'
+    'a6000004dd000004a5000004b0')
+
+#: The keysyms predating Unicode that have a character, sorted, as 32 bit big
+#: endian hexadecimal numbers
+_LEGACY_KEYSYMS = (
+    '000001a1000001a2000001a3000001a5000001a6000001a9000001aa000001ab000001'
+    'ac000001ae000001af000001b1000001b2000001b3000001b5000001b6000001b70000'
+    '01b9000001ba000001bb000001bc000001bd000001be000001bf000001c0000001c300'
+    '0001c5000001c6000001c8000001ca000001cc000001cf000001d0000001d1000001d2'
+    '000001d5000001d8000001d9000001db000001de000001e0000001e3000001e5000001'
+    'e6000001e8000001ea000001ec000001ef000001f0000001f1000001f2000001f50000'
+    '01f8000001f9000001fb000001fe000001ff000002a1000002a6000002a9000002ab00'
+    '0002ac000002b1000002b6000002b9000002bb000002bc000002c5000002c6000002d5'
+    '000002d8000002dd000002de000002e5000002e6000002f5000002f8000002fd000002'
+    'fe000003a2000003a3000003a5000003a6000003aa000003ab000003ac000003b30000'
+    '03b5000003b6000003ba000003bb000003bc000003bd000003bf000003c0000003c700'
+    '0003cc000003cf000003d1000003d2000003d3000003d9000003dd000003de000003e0'
+    '000003e7000003ec000003ef000003f1000003f2000003f3000003f9000003fd000003'
+    'fe0000047e000004a1000004a2000004a3000004a4000004a5000004a6000004a70000'
+    '04a8000004a9000004aa000004ab000004ac000004ad000004ae000004af000004b000'
+    '0004b1000004b2000004b3000004b4000004b5000004b6000004b7000004b8000004b9'
+    '000004ba000004bb000004bc000004bd000004be000004bf000004c0000004c1000004'
+    'c2000004c3000004c4000004c5000004c6000004c7000004c8000004c9000004ca0000'
+    '04cb000004cc000004cd000004ce000004cf000004d0000004d1000004d2000004d300'
+    '0004d4000004d5000004d6000004d7000004d8000004d9000004da000004db000004dc'
+    '000004dd000004de000004df000005ac000005bb000005bf000005c1000005c2000005'
+    'c3000005c4000005c5000005c6000005c7000005c8000005c9000005ca000005cb0000'
+    '05cc000005cd000005ce000005cf000005d0000005d1000005d2000005d3000005d400'
+    '0005d5000005d6000005d7000005d8000005d9000005da000005e0000005e1000005e2'
+    '000005e3000005e4000005e5000005e6000005e7000005e8000005e9000005ea000005'
+    'eb000005ec000005ed000005ee000005ef000005f0000005f1000005f2000006a10000'
+    '06a2000006a3000006a4000006a5000006a6000006a7000006a8000006a9000006aa00'
+    '0006ab000006ac000006ad000006ae000006af000006b0000006b1000006b2000006b3'
+    '000006b4000006b5000006b6000006b7000006b8000006b9000006ba000006bb000006'
+    'bc000006bd000006be000006bf000006c0000006c1000006c2000006c3000006c40000'
+    '06c5000006c6000006c7000006c8000006c9000006ca000006cb000006cc000006cd00'
+    '0006ce000006cf000006d0000006d1000006d2000006d3000006d4000006d5000006d6'
+    '000006d7000006d8000006d9000006da000006db000006dc000006dd000006de000006'
+    'df000006e0000006e1000006e2000006e3000006e4000006e5000006e6000006e70000'
+    '06e8000006e9000006ea000006eb000006ec000006ed000006ee000006ef000006f000'
+    '0006f1000006f2000006f3000006f4000006f5000006f6000006f7000006f8000006f9'
+    '000006fa000006fb000006fc000006fd000006fe000006ff000007a1000007a2000007'
+    'a3000007a4000007a5000007a7000007a8000007a9000007ab000007ae000007af0000'
+    '07b1000007b2000007b3000007b4000007b5000007b6000007b7000007b8000007b900'
+    '0007ba000007bb000007c1000007c2000007c3000007c4000007c5000007c6000007c7'
+    '000007c8000007c9000007ca000007cb000007cc000007cd000007ce000007cf000007'
+    'd0000007d1000007d2000007d4000007d5000007d6000007d7000007d8000007d90000'
+    '07e1000007e2000007e3000007e4000007e5000007e6000007e7000007e8000007e900'
+    '0007ea000007eb000007ec000007ed000007ee000007ef000007f0000007f1000007f2'
+    '000007f3000007f4000007f5000007f6000007f7000007f8000007f9000008a1000008'
+    'a4000008a5000008a7000008a8000008a9000008aa000008ab000008ac000008ad0000'
+    '08ae000008af000008b0000008bc000008bd000008be000008bf000008c0000008c100'
+    '0008c2000008c5000008c8000008c9000008cd000008ce000008cf000008d6000008da'
+    '000008db000008dc000008dd000008de000008df000008ef000008f6000008fb000008'
+    'fc000008fd000008fe000009e0000009e1000009e2000009e3000009e4000009e50000'
+    '09e8000009e9000009ea000009eb000009ec000009ed000009ee000009ef000009f000'
+    '0009f1000009f2000009f3000009f4000009f5000009f6000009f7000009f800000aa1'
+    '00000aa200000aa300000aa400000aa500000aa600000aa700000aa800000aa900000a'
+    'aa00000aae00000aaf00000ab000000ab100000ab200000ab300000ab400000ab50000'
+    '0ab600000ab700000ab800000abb00000ac300000ac400000ac500000ac600000ac900'
+    '000ad000000ad100000ad200000ad300000ad400000ad600000ad700000ad900000aec'
+    '00000aed00000aee00000af000000af100000af200000af300000af400000af500000a'
+    'f600000af700000af800000af900000afa00000afb00000afc00000afd00000afe0000'
+    '0bc200000bc400000bca00000bcc00000bce00000bcf00000bd300000bdc00000bfc00'
+    '000cdf00000ce000000ce100000ce200000ce300000ce400000ce500000ce600000ce7'
+    '00000ce800000ce900000cea00000ceb00000cec00000ced00000cee00000cef00000c'
+    'f000000cf100000cf200000cf300000cf400000cf500000cf600000cf700000cf80000'
+    '0cf900000cfa00000da100000da200000da300000da400000da500000da600000da700'
+    '000da800000da900000daa00000dab00000dac00000dad00000dae00000daf00000db0'
+    '00000db100000db200000db300000db400000db500000db600000db700000db800000d'
+    'b900000dba00000dbb00000dbc00000dbd00000dbe00000dbf00000dc000000dc10000'
+    '0dc200000dc300000dc400000dc500000dc600000dc700000dc800000dc900000dca00'
+    '000dcb00000dcc00000dcd00000dce00000dcf00000dd000000dd100000dd200000dd3'
+    '00000dd400000dd500000dd600000dd700000dd800000dd900000dda00000ddf00000d'
+    'e000000de100000de200000de300000de400000de500000de600000de700000de80000'
+    '0de900000dea00000deb00000dec00000ded00000df000000df100000df200000df300'
+    '000df400000df500000df600000df700000df800000df9000013bc000013bd000013be'
+    '000020ac')
+
+#: The code points of the characters of the legacy keysyms, likewise
+_LEGACY_CODEPOINTS = (
+    '00000104000002d8000001410000013d0000015a000001600000015e00000164000001'
+    '790000017d0000017b00000105000002db000001420000013e0000015b000002c70000'
+    '01610000015f000001650000017a000002dd0000017e0000017c000001540000010200'
+    '000139000001060000010c000001180000011a0000010e000001100000014300000147'
+    '00000150000001580000016e000001700000016200000155000001030000013a000001'
+    '070000010d000001190000011b0000010f000001110000014400000148000001510000'
+    '01590000016f0000017100000163000002d90000012600000124000001300000011e00'
+    '0001340000012700000125000001310000011f000001350000010a0000010800000120'
+    '0000011c0000016c0000015c0000010b00000109000001210000011d0000016d000001'
+    '5d0000013800000156000001280000013b000001120000012200000166000001570000'
+    '01290000013c0000011300000123000001670000014a0000014b000001000000012e00'
+    '0001160000012a000001450000014c0000013600000172000001680000016a00000101'
+    '0000012f000001170000012b000001460000014d000001370000017300000169000001'
+    '6b0000203e000030020000300c0000300d00003001000030fb000030f2000030a10000'
+    '30a3000030a5000030a7000030a9000030e3000030e5000030e7000030c3000030fc00'
+    '0030a2000030a4000030a6000030a8000030aa000030ab000030ad000030af000030b1'
+    '000030b3000030b5000030b7000030b9000030bb000030bd000030bf000030c1000030'
+    'c4000030c6000030c8000030ca000030cb000030cc000030cd000030ce000030cf0000'
+    '30d2000030d5000030d8000030db000030de000030df000030e0000030e1000030e200'
+    '0030e4000030e6000030e8000030e9000030ea000030eb000030ec000030ed000030ef'
+    '000030f30000309b0000309c0000060c0000061b0000061f0000062100000622000006'
+    '230000062400000625000006260000062700000628000006290000062a0000062b0000'
+    '062c0000062d0000062e0000062f000006300000063100000632000006330000063400'
+    '000635000006360000063700000638000006390000063a000006400000064100000642'
+    '000006430000064400000645000006460000064700000648000006490000064a000006'
+    '4b0000064c0000064d0000064e0000064f000006500000065100000652000004520000'
+    '0453000004510000045400000455000004560000045700000458000004590000045a00'
+    '00045b0000045c000004910000045e0000045f00002116000004020000040300000401'
+    '0000040400000405000004060000040700000408000004090000040a0000040b000004'
+    '0c000004900000040e0000040f0000044e000004300000043100000446000004340000'
+    '043500000444000004330000044500000438000004390000043a0000043b0000043c00'
+    '00043d0000043e0000043f0000044f0000044000000441000004420000044300000436'
+    '000004320000044c0000044b00000437000004480000044d0000044900000447000004'
+    '4a0000042e000004100000041100000426000004140000041500000424000004130000'
+    '042500000418000004190000041a0000041b0000041c0000041d0000041e0000041f00'
+    '00042f0000042000000421000004220000042300000416000004120000042c0000042b'
+    '00000417000004280000042d00000429000004270000042a0000038600000388000003'
+    '890000038a000003aa0000038c0000038e000003ab0000038f00000385000020150000'
+    '03ac000003ad000003ae000003af000003ca00000390000003cc000003cd000003cb00'
+    '0003b0000003ce00000391000003920000039300000394000003950000039600000397'
+    '00000398000003990000039a0000039b0000039c0000039d0000039e0000039f000003'
+    'a0000003a1000003a3000003a4000003a5000003a6000003a7000003a8000003a90000'
+    '03b1000003b2000003b3000003b4000003b5000003b6000003b7000003b8000003b900'
+    '0003ba000003bb000003bc000003bd000003be000003bf000003c0000003c1000003c3'
+    '000003c2000003c4000003c5000003c6000003c7000003c8000003c9000023b7000023'
+    '2000002321000023a1000023a3000023a4000023a60000239b0000239d0000239e0000'
+    '23a0000023a8000023ac0000226400002260000022650000222b000022340000221d00'
+    '00221e000022070000223c00002243000021d4000021d2000022610000221a00002282'
+    '00002283000022290000222a0000222700002228000022020000019200002190000021'
+    '910000219200002193000025c600002592000024090000240c0000240d0000240a0000'
+    '24240000240b00002518000025100000250c000025140000253c000023ba000023bb00'
+    '002500000023bc000023bd0000251c00002524000025340000252c0000250200002003'
+    '0000200200002004000020050000200700002008000020090000200a00002014000020'
+    '1300002026000020250000215300002154000021550000215600002157000021580000'
+    '21590000215a00002105000020120000215b0000215c0000215d0000215e0000212200'
+    '002018000020190000201c0000201d0000211e00002032000020330000271d00002663'
+    '000026660000266500002720000020200000202100002713000027170000266f000026'
+    '6d00002642000026400000260e0000231500002117000020380000201a0000201e0000'
+    '22a50000230a0000221800002395000022a4000025cb00002308000022a2000022a300'
+    '002017000005d0000005d1000005d2000005d3000005d4000005d5000005d6000005d7'
+    '000005d8000005d9000005da000005db000005dc000005dd000005de000005df000005'
+    'e0000005e1000005e2000005e3000005e4000005e5000005e6000005e7000005e80000'
+    '05e9000005ea00000e0100000e0200000e0300000e0400000e0500000e0600000e0700'
+    '000e0800000e0900000e0a00000e0b00000e0c00000e0d00000e0e00000e0f00000e10'
+    '00000e1100000e1200000e1300000e1400000e1500000e1600000e1700000e1800000e'
+    '1900000e1a00000e1b00000e1c00000e1d00000e1e00000e1f00000e2000000e210000'
+    '0e2200000e2300000e2400000e2500000e2600000e2700000e2800000e2900000e2a00'
+    '000e2b00000e2c00000e2d00000e2e00000e2f00000e3000000e3100000e3200000e33'
+    '00000e3400000e3500000e3600000e3700000e3800000e3900000e3a00000e3f00000e'
+    '4000000e4100000e4200000e4300000e4400000e4500000e4600000e4700000e480000'
+    '0e4900000e4a00000e4b00000e4c00000e4d00000e5000000e5100000e5200000e5300'
+    '000e5400000e5500000e5600000e5700000e5800000e59000001520000015300000178'
+    '000020ac')
+
+_index = None
+_legacy = None
+
+
+def _unpack(numbers):
+    """Returns an array of the 32 bit big endian hexadecimal numbers."""
+    values = array('I', bytes.fromhex(numbers))
+    if sys.byteorder == 'little':
+        values.byteswap()
+    return values
+
+
+def index():
+    """Returns the sorted list of keys and the array of their keysyms.
+    """
+    global _index
+    if _index is None:
+        _index = (_KEYS.split('\n'), _unpack(_KEYSYMS))
+    return _index
+
+
+def lookup(key, default=0):
+    """Returns the keysym of a character or keysym name, or ``default`` if it
+    is unknown.
+    """
+    keys, keysyms = index()
+    i = bisect_left(keys, key)
+    if i < len(keys) and keys[i] == key:
+        return keysyms[i]
+    return default
+
+
+def keysym_to_character(keysym):
+    """Returns the character of a keysym, or ``None`` if it has none.
+
+    Latin-1 keysyms are their own code point, Unicode keysyms are the code
+    point plus ``0x01000000``, and the other legacy keysyms are looked up.
+    Keysyms of functions, such as ``BackSpace``, have no character.
+    """
+    if 0x20 <= keysym <= 0x7e or 0xa0 <= keysym <= 0xff:
+        return chr(keysym)
+    if 0x01000100 <= keysym <= 0x0110ffff:
+        return chr(keysym - 0x01000000)
+
+    global _legacy
+    if _legacy is None:
+        _legacy = (_unpack(_LEGACY_KEYSYMS), _unpack(_LEGACY_CODEPOINTS))
+    keysyms, codepoints = _legacy
+    i = bisect_left(keysyms, keysym)
+    if i < len(keysyms) and keysyms[i] == keysym:
+        return chr(codepoints[i])
+    return None
+
+
+def _characters():
+    """Returns a dict mapping every character in the index to the name of its
+    keysym.
+    """
+    keys, keysyms = index()
+    names = {}
+    for key, keysym in zip(keys, keysyms):
+        if len(key) > 1:
+            names.setdefault(keysym, key)
+    return {
+        key: key if key.isalnum() and key.isascii() else names[keysym]
+        for key, keysym in zip(keys, keysyms)
+        if len(key) == 1}
+
+
+def __getattr__(name):
+    """Builds :data:`KEYSYMS`, the former mapping from character to keysym
+    name, on first use.
+    """
+    if name == 'KEYSYMS':
+        global KEYSYMS
+        KEYSYMS = _characters()
+        return KEYSYMS
+    raise AttributeError(
+        'module {0!r} has no attribute {1!r}'.format(__name__, name))
@@ -21,14 +21,47 @@ As the base file, this provides a rough operational model along with the
 framework to be extended by each platform.
 """
 
+from contextlib import contextmanager
 from threading import Thread
 
+from .scheduler import Scheduler
+
 
 class ScrollSupportError(Exception):
     pass
 
 
 class PyMouseMeta(object):
+    #: The :class:`pymouse.scheduler.Scheduler` that paced the last call of
+    #: :meth:`click`; see its ``statistics()``
+    scheduler = None
+
+    #: The time spent busy-waiting at the end of every interval, in seconds
+    scheduler_spin = 0
+
+    @contextmanager
+    def batch(self):
+        """
+        A context manager within which the generated mouse events may be
+        queued and sent together when it exits. Platforms that do not support
+        this send every event immediately.
+        """
+
+        yield self
+
+    def close(self):
+        """
+        Releases the resources held by this object, such as the connection to
+        the display server. The object must not be used afterwards.
+        """
+
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
 
     def press(self, x, y, button=1):
         """
@@ -46,15 +79,20 @@ class PyMouseMeta(object):
 
         raise NotImplementedError
 
-    def click(self, x, y, button=1, n=1):
+    def click(self, x, y, button=1, n=1, interval=0):
         """
-        Click a mouse button n times on a given x, y.
+        Click a mouse button n times on a given x, y, starting a click every
+        interval seconds.
         Button is defined as 1 = left, 2 = right, 3 = middle.
         """
 
+        scheduler = Scheduler(interval, self.scheduler_spin)
         for i in range(n):
+            if i:
+                scheduler.wait()
             self.press(x, y, button)
             self.release(x, y, button)
+        self.scheduler = scheduler
 
     def scroll(self, vertical=None, horizontal=None, depth=None):
         """
@@ -87,6 +125,34 @@ class PyMouseMeta(object):
 
         raise NotImplementedError
 
+    def move_path(self, x, y, duration=0.5, rate=100, kind='minimum_jerk',
+                  controls=None):
+        """
+        Move the mouse to a given x and y along a smooth trajectory, taking
+        duration seconds and sending rate positions per second. See
+        pymouse.path for the kinds of trajectory; this requires NumPy.
+        """
+
+        from .path import path
+        points = path(self.position(), (x, y), duration, rate, kind, controls)
+        scheduler = Scheduler(1.0 / rate, self.scheduler_spin)
+        for px, py in points[1:].tolist():
+            scheduler.wait()
+            self.move(px, py)
+        self.scheduler = scheduler
+
+    def drag_path(self, x, y, duration=0.5, rate=100, kind='minimum_jerk',
+                  controls=None, button=1):
+        """
+        Drag the mouse to a given x and y along a smooth trajectory; see
+        move_path.
+        """
+
+        x0, y0 = self.position()
+        self.press(x0, y0, button)
+        self.move_path(x, y, duration, rate, kind, controls)
+        self.release(x, y, button)
+
     def position(self):
         """
         Get the current mouse position in pixels.
@@ -105,28 +171,61 @@ class PyMouseMeta(object):
 
 
 class PyMouseEventMeta(Thread):
-    def __init__(self, capture=False, capture_move=False):
+    #: The form of the events passed to on_batch; see the platform listener
+    batch_format = 'list'
+
+    def __init__(self, capture=False, capture_move=False, queue=None):
         Thread.__init__(self)
         self.daemon = True
         self.capture = capture
         self.capture_move = capture_move
         self.state = True
+        #The pymouse.event_queue.EventQueue receiving the events, if any
+        self.queue = queue
+        #Whether on_batch is overridden
+        self._batch_hook = type(self).on_batch is not PyMouseEventMeta.on_batch
 
     def stop(self):
         self.state = False
+        if self.queue is not None:
+            self.queue.close()
 
-    def click(self, x, y, button, press):
-        """Subclass this method with your click event handler"""
+    def close(self):
+        """Releases the resources held by the listener, once it has stopped."""
         pass
 
+    def click(self, x, y, button, press):
+        """
+        Subclass this method with your click event handler. By default, the
+        event is put in the queue of the listener, if it has one.
+        """
+        if self.queue is not None:
+            self.queue.put(('click', x, y, button, press))
+
     def move(self, x, y):
-        """Subclass this method with your move event handler"""
-        pass
+        """
+        Subclass this method with your move event handler. By default, the
+        event is put in the queue of the listener, if it has one.
+        """
+        if self.queue is not None:
+            self.queue.put(('move', x, y))
 
     def scroll(self, x, y, vertical, horizontal):
         """
         Subclass this method with your scroll event handler
             Vertical: + Up, - Down
             Horizontal: + Right, - Left
+        By default, the event is put in the queue of the listener, if it has
+        one.
+        """
+        if self.queue is not None:
+            self.queue.put(('scroll', x, y, vertical, horizontal))
+
+    def on_batch(self, events):
+        """
+        Subclass this method to handle the events received together from the
+        system in one call, instead of one call of click, move or scroll per
+        event; these are then not called. The events are platform specific
+        and given in the form set by batch_format.
         """
         pass
@@ -0,0 +1,191 @@
+#Copyright 2013 Paul Barton
+#
+#This program is free software: you can redistribute it and/or modify
+#it under the terms of the GNU General Public License as published by
+#the Free Software Foundation, either version 3 of the License, or
+#(at your option) any later version.
+#
+#This program is distributed in the hope that it will be useful,
+#but WITHOUT ANY WARRANTY; without even the implied warranty of
+#MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#GNU General Public License for more details.
+#
+#You should have received a copy of the GNU General Public License
+#along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+A bounded queue through which PyMouseEvent and PyKeyboardEvent listeners can
+hand their events to consumers, instead of calling the handler methods on
+the listening thread.
+
+Events are tuples named after the handler method that would otherwise be
+called, followed by its arguments::
+
+    ('click', x, y, button, press)
+    ('move', x, y)
+    ('scroll', x, y, vertical, horizontal)
+    ('tap', keycode, character, press)
+
+A listener given a queue pushes its events and keeps listening, while any
+number of consumers pull them::
+
+    events = EventQueue(overflow='coalesce_motion')
+    listener = PyMouseEvent(queue=events)
+    listener.start()
+    for event in events:
+        print(event)
+
+When the queue is full, ``overflow`` decides what happens to a new event:
+
+``'block'``
+    The listener waits until a consumer makes room. The *X* server buffers
+    the events meanwhile, and may eventually drop them.
+``'drop_oldest'``
+    The oldest queued event is dropped.
+``'drop_newest'``
+    The new event is dropped.
+``'coalesce_motion'``
+    Like ``'drop_oldest'``; besides, a ``'move'`` event following another one
+    replaces it, whether or not the queue is full, since only the latest
+    pointer position matters.
+
+:attr:`EventQueue.dropped` and :attr:`EventQueue.coalesced` count the events
+lost this way.
+"""
+
+from collections import deque
+import queue
+import threading
+
+
+#: The supported overflow policies
+OVERFLOW_POLICIES = ('block', 'drop_oldest', 'drop_newest', 'coalesce_motion')
+
+
+class EventQueueClosed(Exception):
+    """Raised when getting an event from an empty queue that was closed."""
+    pass
+
+
+class EventQueue(object):
+    """
+    A thread safe, bounded first-in first-out queue of listener events.
+
+    :param int maxsize: The maximum number of queued events.
+
+    :param str overflow: What to do when the queue is full; see the module
+        documentation.
+    """
+    def __init__(self, maxsize=1024, overflow='block'):
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError('Unknown overflow policy: {0}'.format(overflow))
+        if maxsize < 1:
+            raise ValueError('maxsize must be at least 1')
+        self.maxsize = maxsize
+        self.overflow = overflow
+
+        #: The number of events dropped because the queue was full
+        self.dropped = 0
+
+        #: The number of ``'move'`` events replaced by a later one
+        self.coalesced = 0
+
+        #: Whether :meth:`close` was called
+        self.closed = False
+
+        self._items = deque()
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+
+    def __len__(self):
+        return len(self._items)
+
+    def put(self, event):
+        """
+        Adds an event to the queue, applying the overflow policy if it is
+        full. Events put after the queue was closed are ignored.
+
+        :return: whether the event was queued
+        """
+        with self._lock:
+            if self.closed:
+                return False
+            items = self._items
+            if (self.overflow == 'coalesce_motion' and event[0] == 'move'
+                    and items and items[-1][0] == 'move'):
+                items[-1] = event
+                self.coalesced += 1
+                return True
+
+            if len(items) >= self.maxsize:
+                if self.overflow == 'block':
+                    while len(items) >= self.maxsize and not self.closed:
+                        self._not_full.wait()
+                    if self.closed:
+                        return False
+                elif self.overflow == 'drop_newest':
+                    self.dropped += 1
+                    return False
+                else:
+                    items.popleft()
+                    self.dropped += 1
+            items.append(event)
+            self._not_empty.notify()
+            return True
+
+    def get(self, timeout=None):
+        """
+        Removes and returns the oldest event, waiting for one if necessary.
+
+        :param float timeout: The maximum time to wait, in seconds; the
+            default is to wait indefinitely.
+
+        :raises queue.Empty: if no event arrived in time.
+
+        :raises EventQueueClosed: if the queue is empty and closed.
+        """
+        with self._lock:
+            if not self._not_empty.wait_for(
+                    lambda: self._items or self.closed, timeout):
+                raise queue.Empty()
+            if not self._items:
+                raise EventQueueClosed()
+            event = self._items.popleft()
+            self._not_full.notify()
+            return event
+
+    def drain(self, max_n=None):
+        """
+        Removes and returns a list of the oldest events, without waiting.
+
+        :param int max_n: The maximum number of events; the default is all.
+        """
+        with self._lock:
+            items = self._items
+            count = len(items) if max_n is None else min(max_n, len(items))
+            events = [items.popleft() for i in range(count)]
+            if events:
+                self._not_full.notify_all()
+            return events
+
+    def __iter__(self):
+        """Yields the events as they arrive, until the queue is closed and
+        empty.
+        """
+        while True:
+            try:
+                yield self.get()
+            except EventQueueClosed:
+                return
+
+    def close(self):
+        """
+        Closes the queue: later events are ignored, a listener waiting for
+        room stops waiting, and consumers stop once the remaining events have
+        been taken.
+        """
+        with self._lock:
+            self.closed = True
+            self._not_empty.notify_all()
+            self._not_full.notify_all()
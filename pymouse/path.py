@@ -0,0 +1,114 @@
+#Copyright 2013 Paul Barton
+#
+#This program is free software: you can redistribute it and/or modify
+#it under the terms of the GNU General Public License as published by
+#the Free Software Foundation, either version 3 of the License, or
+#(at your option) any later version.
+#
+#This program is distributed in the hope that it will be useful,
+#but WITHOUT ANY WARRANTY; without even the implied warranty of
+#MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#GNU General Public License for more details.
+#
+#You should have received a copy of the GNU General Public License
+#along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Generates the pointer trajectories used by :meth:`PyMouseMeta.move_path` and
+:meth:`PyMouseMeta.drag_path`. This module requires NumPy.
+
+A trajectory is sampled ``rate`` times per second over ``duration`` seconds,
+and is returned as an array of integer ``(x, y)`` points, sample ``i`` being
+due ``i / rate`` seconds after the start. The following kinds are supported:
+
+``'linear'``
+    A straight line at constant speed.
+``'minimum_jerk'``
+    A straight line, with the smooth speed profile of a human arm movement.
+``'bezier'``
+    A cubic Bezier curve through two control points, with the speed profile
+    of ``'minimum_jerk'``.
+
+Trajectories only depend on the distance moved, so they are cached relative
+to the start point and reused for repeated geometry.
+"""
+
+import functools
+
+import numpy
+
+
+#: The number of trajectories kept in the cache
+CACHE_SIZE = 64
+
+
+def _minimum_jerk(t):
+    """The position along a minimum jerk movement at the times ``t``."""
+    return t * t * t * (10 - t * (15 - 6 * t))
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def _offsets(dx, dy, duration, rate, kind, controls):
+    """Returns the read-only trajectory from ``(0, 0)`` to ``(dx, dy)``."""
+    count = max(int(round(duration * rate)), 1) + 1
+    t = numpy.linspace(0.0, 1.0, count)
+    end = numpy.array([dx, dy], dtype=float)
+
+    if kind == 'linear':
+        points = numpy.outer(t, end)
+    elif kind == 'minimum_jerk':
+        points = numpy.outer(_minimum_jerk(t), end)
+    elif kind == 'bezier':
+        if controls is None:
+            #Bow the curve to the side by a fifth of its length
+            normal = numpy.array([-dy, dx], dtype=float) * 0.2
+            controls = (end / 3 + normal, end * 2 / 3 + normal)
+        c1, c2 = (numpy.array(c, dtype=float) for c in controls)
+        s = _minimum_jerk(t)[:, numpy.newaxis]
+        r = 1 - s
+        points = 3 * r * r * s * c1 + 3 * r * s * s * c2 + s * s * s * end
+    else:
+        raise ValueError('Unknown kind of path: {0}'.format(kind))
+
+    points = numpy.rint(points).astype(numpy.int32)
+    points.flags.writeable = False
+    return points
+
+
+def path(start, end, duration=0.5, rate=100, kind='minimum_jerk',
+         controls=None):
+    """
+    Returns the trajectory from ``start`` to ``end`` as an array of shape
+    ``(n, 2)``.
+
+    :param start: The start point ``(x, y)``.
+
+    :param end: The end point ``(x, y)``.
+
+    :param float duration: The duration of the movement, in seconds.
+
+    :param float rate: The number of samples per second.
+
+    :param str kind: The kind of trajectory; see the module documentation.
+
+    :param controls: The two control points ``((x1, y1), (x2, y2))`` of a
+        ``'bezier'`` trajectory. By default, the curve bows to one side.
+    """
+    x0, y0 = start
+    x1, y1 = end
+    if controls is not None:
+        controls = tuple(
+            (int(cx) - x0, int(cy) - y0) for cx, cy in controls)
+    offsets = _offsets(int(x1) - x0, int(y1) - y0, float(duration),
+                       float(rate), kind, controls)
+    return offsets + numpy.array([x0, y0], dtype=numpy.int32)
+
+
+def delays(count, rate):
+    """
+    Returns the delays between ``count`` consecutive samples taken at
+    ``rate``, in whole milliseconds. The delays are rounded so that their sum
+    does not drift from the schedule.
+    """
+    due = numpy.rint(numpy.arange(count) * 1000.0 / rate).astype(numpy.int64)
+    return numpy.diff(due, prepend=0)
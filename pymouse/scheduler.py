@@ -0,0 +1,92 @@
+#Copyright 2013 Paul Barton
+#
+#This program is free software: you can redistribute it and/or modify
+#it under the terms of the GNU General Public License as published by
+#the Free Software Foundation, either version 3 of the License, or
+#(at your option) any later version.
+#
+#This program is distributed in the hope that it will be useful,
+#but WITHOUT ANY WARRANTY; without even the implied warranty of
+#MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#GNU General Public License for more details.
+#
+#You should have received a copy of the GNU General Public License
+#along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Paces repeated input events at a fixed rate.
+
+Sleeping for the interval between events makes every event late by the time
+taken to send the previous one, and that error adds up over a long string. The
+:class:`Scheduler` instead waits for absolute deadlines on the monotonic clock,
+so the rate stays what was asked for.
+"""
+
+import math
+import time
+
+
+class Scheduler(object):
+    """
+    Waits for the deadlines ``start + k * interval``, where ``start`` is the
+    time the scheduler was created and ``k`` counts the calls to :meth:`wait`.
+
+    If an event is late, the following ones are not delayed any further; they
+    are sent as soon as possible until the schedule has been caught up with.
+
+    :param float interval: The time between events, in seconds.
+
+    :param float spin: The last part of every wait, in seconds, is spent
+        polling the clock instead of sleeping. This gives sub-millisecond
+        precision at the cost of keeping a CPU busy.
+    """
+    def __init__(self, interval, spin=0):
+        self.interval = interval
+        self.spin = spin
+        self.start = time.monotonic()
+        self.count = 0
+        self._last = self.start
+        self._lateness_sum = 0.0
+        self._lateness_squares = 0.0
+        self._lateness_max = 0.0
+
+    def wait(self):
+        """Waits for the next deadline."""
+        self.count += 1
+        if not self.interval:
+            return
+        deadline = self.start + self.count * self.interval
+        remaining = deadline - time.monotonic()
+        if remaining > self.spin:
+            time.sleep(remaining - self.spin)
+        now = time.monotonic()
+        while now < deadline:
+            now = time.monotonic()
+
+        lateness = now - deadline
+        self._last = now
+        self._lateness_sum += lateness
+        self._lateness_squares += lateness * lateness
+        self._lateness_max = max(self._lateness_max, lateness)
+
+    def statistics(self):
+        """
+        Returns a dictionary describing how well the schedule was kept so far:
+
+        ``rate``
+            The achieved number of waits per second.
+        ``mean_lateness``, ``max_lateness``
+            How late the waits returned after their deadline, in seconds.
+        ``jitter``
+            The standard deviation of the lateness, in seconds.
+        """
+        count = self.count if self.interval else 0
+        elapsed = self._last - self.start
+        mean = self._lateness_sum / count if count else 0.0
+        variance = self._lateness_squares / count - mean * mean if count else 0
+        return {
+            'count': count,
+            'rate': count / elapsed if elapsed > 0 else 0.0,
+            'mean_lateness': mean,
+            'max_lateness': self._lateness_max,
+            'jitter': math.sqrt(max(variance, 0.0))}
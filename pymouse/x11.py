@@ -13,13 +13,22 @@
 #You should have received a copy of the GNU General Public License
 #along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+from concurrent.futures import Future
+from contextlib import contextmanager
+import os
+import queue
+import threading
+import time
+
 from Xlib.display import Display
 from Xlib import X
 from Xlib.ext.xtest import fake_input
 from Xlib.ext import record
-from Xlib.protocol import rq
 
 from .base import PyMouseMeta, PyMouseEventMeta, ScrollSupportError
+from .scheduler import Scheduler
+from .x11_record import (record_events, record_batch, event_batch,
+                         record_range, BUTTON_EVENTS, POINTER_EVENTS)
 
 
 class X11Error(Exception):
@@ -29,6 +38,294 @@ class X11Error(Exception):
     pass
 
 
+#: The shared display connections, keyed by thread and display name, as
+#: lists of ``[display, reference count]``
+_displays = {}
+_displays_lock = threading.Lock()
+
+
+def acquire_display(name=None):
+    """Returns the connection to the display ``name`` shared by the PyMouse
+    and PyKeyboard objects created with ``shared=True`` on the calling
+    thread, opening it if necessary.
+
+    Connections are only shared within a thread, since *Xlib* does not lock
+    them unless ``Xlib.threaded`` is imported; objects sharing a connection
+    must only be used from the thread that created them, or from an
+    :class:`Injector`.
+
+    Every call must be matched by a call to :func:`release_display`; the
+    connection is closed when it is no longer used. A connection that is
+    never released stays open until the process exits, even if all objects
+    using it are gone.
+
+    :param str name: The display name; the default is ``$DISPLAY``.
+
+    :return: the display
+    :rtype: Xlib.display.Display
+    """
+    key = (threading.get_ident(), name or os.environ.get('DISPLAY', ''))
+    with _displays_lock:
+        entry = _displays.get(key)
+        if entry is None:
+            entry = _displays[key] = [Display(name), 0]
+        entry[1] += 1
+        return entry[0]
+
+
+def release_display(display):
+    """Releases a connection returned by :func:`acquire_display`, and closes
+    it if this was the last user.
+
+    :param Xlib.display.Display display: The *X* display.
+
+    :return: whether ``display`` was a shared connection
+    """
+    with _displays_lock:
+        for key, entry in list(_displays.items()):
+            if entry[0] is display:
+                entry[1] -= 1
+                if entry[1] == 0:
+                    del _displays[key]
+                    _close(display)
+                return True
+        return False
+
+
+def open_display(name=None, shared=False):
+    """Returns a connection to the display ``name``: the one shared by the
+    objects of the calling thread if ``shared`` is true, see
+    :func:`acquire_display`, otherwise a new private one.
+
+    :param str name: The display name; the default is ``$DISPLAY``.
+
+    :return: the display, to be closed with :func:`close_display`
+    :rtype: Xlib.display.Display
+    """
+    if shared:
+        return acquire_display(name)
+    return Display(name)
+
+
+def close_display(display):
+    """Closes a connection returned by :func:`open_display`, or releases it
+    if it is shared.
+
+    :param Xlib.display.Display display: The *X* display.
+    """
+    if not release_display(display):
+        _close(display)
+
+
+#: The attributes keeping the state of pymouse and pykeyboard on a display: its
+#: :class:`ErrorGuard` and its :class:`pykeyboard.x11_keymap.Keymap`
+_DISPLAY_STATE = ('_error_guard', '_keymap')
+
+
+def _close(display):
+    """Closes ``display``, and drops the state kept on it."""
+    state = vars(display)
+    for name in _DISPLAY_STATE:
+        state.pop(name, None)
+    display.close()
+
+
+class _GuardState(threading.local):
+    """The nesting of the blocks of an :class:`ErrorGuard` in one thread."""
+    depth = 0
+
+
+class ErrorGuard(object):
+    """
+    Traps the *X* errors of a display. Use :func:`error_guard` to get the
+    guard of a display; it is created once and reused by every request, so
+    entering and exiting it costs little more than a few attribute accesses.
+
+    Used as a context manager, the guard is installed as the error handler of
+    the display while a block is open, and collects the errors caused by the
+    requests sent meanwhile in :attr:`errors`; other errors are passed on to
+    the previous handler. It syncs the display when its outermost block
+    exits, restores the previous error handler and reports the errors.
+    Nested blocks, such as those used within a :func:`display_batch`, neither
+    sync nor report. The nesting is tracked for every thread on its own; the
+    previous handler is restored once no thread has a block open.
+
+    If :attr:`deferred` is true, exiting a block only flushes the requests,
+    without waiting for the server. The guard then stays installed, and the
+    errors the requests cause are reported at the next explicit :meth:`flush`
+    or :meth:`barrier`; the previous handler is restored by the barrier.
+
+    Errors are reported by raising an :class:`X11Error`, or by passing the
+    list of errors to :attr:`callback` if it is set.
+
+    Note that :attr:`deferred` and :attr:`callback` apply to every object
+    using the display connection, which is only the case of several objects
+    if they were created with ``shared=True``; see :func:`acquire_display`.
+    """
+    __slots__ = ('display', 'errors', 'deferred', 'callback', '_local',
+                 '_lock', '_active', '_deferring', '_previous_handler',
+                 '_first_serial')
+
+    def __init__(self, display):
+        self.display = display
+        self.errors = []
+        self.deferred = False
+        self.callback = None
+        self._local = _GuardState()
+        #The number of threads with a block open, plus one while the errors
+        #of deferred requests are awaited
+        self._lock = threading.Lock()
+        self._active = 0
+        self._deferring = False
+        self._previous_handler = None
+        self._first_serial = 0
+
+    @property
+    def depth(self):
+        """The number of blocks of the guard entered by the calling thread."""
+        return self._local.depth
+
+    def _trap(self, error, request):
+        protocol = self.display.display
+        first = self._first_serial
+        if ((error.sequence_number - first) % 65536
+                > (protocol.request_serial - first) % 65536):
+            #The error of a request sent before the guard was installed
+            if self._previous_handler is not None:
+                self._previous_handler(error, request)
+            else:
+                protocol.default_error_handler(error)
+            return
+        self.errors.append((error, request))
+
+    def _install(self):
+        """Installs the guard as the error handler of the display."""
+        with self._lock:
+            if not self._active:
+                protocol = self.display.display
+                self._previous_handler = protocol.error_handler
+                self._first_serial = protocol.request_serial
+                self.display.set_error_handler(self._trap)
+            self._active += 1
+
+    def _uninstall(self, defer=False):
+        """Restores the previous error handler of the display, once no block
+        is open any more. If ``defer`` is true, the guard instead stays
+        installed until the next :meth:`barrier`.
+        """
+        with self._lock:
+            if defer and not self._deferring:
+                self._deferring = True
+                return
+            self._active -= 1
+            if not self._active:
+                self.display.set_error_handler(self._previous_handler)
+                self._previous_handler = None
+
+    def __enter__(self):
+        local = self._local
+        if not local.depth:
+            self._install()
+        local.depth += 1
+        return self.display
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        local = self._local
+        local.depth -= 1
+        if not local.depth:
+            self._finish(not self.deferred, exc_type is None)
+
+    def _finish(self, sync, report):
+        """Ends the outermost block, syncing the display or only flushing it,
+        and reports the errors unless ``report`` is false.
+        """
+        if not sync:
+            try:
+                self.display.flush()
+            finally:
+                self._uninstall(defer=True)
+            return
+
+        try:
+            self.display.sync()
+        finally:
+            self._uninstall()
+        if report:
+            self.check()
+        else:
+            #An exception is already on its way
+            del self.errors[:]
+
+    def check(self):
+        """Reports the errors read so far, and forgets them."""
+        if self.errors:
+            errors, self.errors = self.errors, []
+            if self.callback is not None:
+                self.callback(errors)
+            else:
+                raise X11Error(errors)
+
+    def flush(self):
+        """Sends all queued requests, and reports the errors read so far,
+        without waiting for the server to process the requests.
+        """
+        self.display.flush()
+        self.check()
+
+    def barrier(self):
+        """Waits for the server to process all requests sent so far, and
+        reports the errors they caused.
+        """
+        self.display.sync()
+        self._settle()
+        self.check()
+
+    def _settle(self):
+        """Restores the previous error handler if the guard stayed installed
+        for deferred requests; the server must have processed them.
+        """
+        with self._lock:
+            deferring, self._deferring = self._deferring, False
+        if deferring:
+            self._uninstall()
+
+    @contextmanager
+    def batch(self, sync=True):
+        """See :func:`display_batch`."""
+        local = self._local
+        if local.depth:
+            with self as display:
+                yield display
+            return
+
+        self._install()
+        local.depth += 1
+        try:
+            yield self.display
+        except:
+            local.depth -= 1
+            self._finish(sync and not self.deferred, False)
+            raise
+        local.depth -= 1
+        self._finish(sync and not self.deferred, sync)
+
+
+def error_guard(display):
+    """Returns the :class:`ErrorGuard` of ``display``, creating it if
+    necessary. The guard is kept by the display, and dropped when the display
+    is closed with :func:`close_display`.
+
+    :param Xlib.display.Display display: The *X* display.
+
+    :rtype: ErrorGuard
+    """
+    try:
+        return display._error_guard
+    except AttributeError:
+        guard = display._error_guard = ErrorGuard(display)
+        return guard
+
+
 def display_manager(display):
     """Traps *X* errors and raises an :class:``X11Error`` at the end if any
     error occurred.
@@ -36,28 +333,41 @@ def display_manager(display):
     This handler also ensures that the :class:`Xlib.display.Display` being
     managed is sync'd.
 
+    If a :func:`display_batch` is open for the display, the requests are only
+    queued; syncing and error checking are then left to the batch.
+
+    This returns the :class:`ErrorGuard` of the display; code sending many
+    requests should keep a reference to it rather than calling this every
+    time.
+
     :param Xlib.display.Display display: The *X* display.
 
-    :return: the display
-    :rtype: Xlib.display.Display
+    :return: the error guard, which returns the display when entered
+    :rtype: ErrorGuard
     """
-    from contextlib import contextmanager
+    return error_guard(display)
 
-    @contextmanager
-    def manager():
-        errors = []
 
-        def handler(*args):
-            errors.append(args)
+def display_batch(display, sync=True):
+    """Queues all requests sent to ``display`` in the managed block, and sends
+    them in one write at the end.
 
-        old_handler = display.set_error_handler(handler)
-        yield display
-        display.sync()
-        display.set_error_handler(old_handler)
-        if errors:
-            raise X11Error(errors)
+    Any :func:`display_manager` used in the block will not sync the display;
+    instead, the display is sync'd once when the outermost batch ends, and an
+    :class:`X11Error` is raised if any error occurred in the block. Batches may
+    be nested.
 
-    return manager()
+    :param Xlib.display.Display display: The *X* display.
+
+    :param bool sync: Whether to sync the display at the end. If this is
+        false, the requests are only flushed, and errors caused by them are
+        reported by the next :meth:`ErrorGuard.flush` or
+        :meth:`ErrorGuard.barrier` of the display.
+
+    :return: the display
+    :rtype: Xlib.display.Display
+    """
+    return error_guard(display).batch(sync)
 
 
 def translate_button_code(button):
@@ -81,61 +391,193 @@ def button_code_to_scroll_direction(button):
 
 
 class PyMouse(PyMouseMeta):
-    def __init__(self, display=None):
+    """
+    The PyMouse implementation for X11 systems (mostly linux).
+
+    If ``track_position`` is true, the pointer position is kept locally and
+    updated by the moves made through this instance, so that :meth:`position`
+    only queries the *X* server when the tracked position is older than
+    ``position_ttl`` seconds. Pointer motion made by others is picked up when
+    the tracked position goes stale, or earlier if reported through
+    :meth:`update_position`, which a :class:`PyMouseEvent` does for the mice
+    given to its :meth:`PyMouseEvent.report_position`.
+
+    Every PyMouse has its own connection to the *X* server, unless
+    ``shared`` is true; it then shares the connection of the other PyMouse
+    and PyKeyboard objects created with ``shared=True`` on the same thread.
+    See :func:`acquire_display`.
+    Every event is sync'd to check for errors unless sent in a :meth:`batch`;
+    setting ``mouse.guard.deferred`` instead defers the checks to the next
+    ``mouse.guard.barrier()``. The guard belongs to the connection, so this
+    also applies to the objects sharing it. See :class:`ErrorGuard`.
+    """
+    def __init__(self, display=None, track_position=False, position_ttl=0.5,
+                 shared=False):
         PyMouseMeta.__init__(self)
-        self.display = Display(display)
-        self.display2 = Display(display)
+        self.display = open_display(display, shared)
+        #: The error guard of the display; see :class:`ErrorGuard`
+        self.guard = error_guard(self.display)
+        self.track_position = track_position
+        self.position_ttl = position_ttl
+        self._tracked_position = None
+        self._tracked_time = 0
+
+    @contextmanager
+    def batch(self):
+        """Queues all mouse events generated within the managed block, and
+        sends them to the *X* server in one go.
+
+        See :func:`display_batch`.
+        """
+        with display_batch(self.display):
+            yield self
+
+    def close(self):
+        if self.display is not None:
+            close_display(self.display)
+            self.guard = None
+            self.display = None
 
     def press(self, x, y, button=1):
         self.move(x, y)
 
-        with display_manager(self.display) as d:
+        with self.guard as d:
             fake_input(d, X.ButtonPress, translate_button_code(button))
 
     def release(self, x, y, button=1):
         self.move(x, y)
 
-        with display_manager(self.display) as d:
+        with self.guard as d:
             fake_input(d, X.ButtonRelease, translate_button_code(button))
 
+    def click(self, x, y, button=1, n=1, interval=0):
+        button = translate_button_code(button)
+        if not interval:
+            with display_batch(self.display) as d:
+                self.move(x, y)
+                self._repeat_button(d, button, n)
+            return
+
+        scheduler = Scheduler(interval, self.scheduler_spin)
+        with display_batch(self.display) as d:
+            self.move(x, y)
+            for i in range(n):
+                if i:
+                    d.flush()
+                    scheduler.wait()
+                self._repeat_button(d, button, 1)
+        self.scheduler = scheduler
+
     def scroll(self, vertical=None, horizontal=None, depth=None):
         #Xlib supports only vertical and horizontal scrolling
         if depth is not None:
             raise ScrollSupportError('PyMouse cannot support depth-scrolling \
 in X11. This feature is only available on Mac.')
 
-        #Execute vertical then horizontal scrolling events
-        if vertical is not None:
-            vertical = int(vertical)
-            if vertical == 0:  # Do nothing with 0 distance
-                pass
-            elif vertical > 0:  # Scroll up if positive
-                self.click(*self.position(), button=4, n=vertical)
-            else:  # Scroll down if negative
-                self.click(*self.position(), button=5, n=abs(vertical))
-        if horizontal is not None:
-            horizontal = int(horizontal)
-            if horizontal == 0:  # Do nothing with 0 distance
-                pass
-            elif horizontal > 0:  # Scroll right if positive
-                self.click(*self.position(), button=7, n=horizontal)
-            else:  # Scroll left if negative
-                self.click(*self.position(), button=6, n=abs(horizontal))
+        #Execute vertical then horizontal scrolling events, all in one burst
+        with display_batch(self.display) as d:
+            if vertical is not None:
+                vertical = int(vertical)
+                if vertical == 0:  # Do nothing with 0 distance
+                    pass
+                elif vertical > 0:  # Scroll up if positive
+                    self._repeat_button(d, 4, vertical)
+                else:  # Scroll down if negative
+                    self._repeat_button(d, 5, abs(vertical))
+            if horizontal is not None:
+                horizontal = int(horizontal)
+                if horizontal == 0:  # Do nothing with 0 distance
+                    pass
+                elif horizontal > 0:  # Scroll right if positive
+                    self._repeat_button(d, 7, horizontal)
+                else:  # Scroll left if negative
+                    self._repeat_button(d, 6, abs(horizontal))
+
+    def _repeat_button(self, d, button, n):
+        """Queues ``n`` presses and releases of the *X* button ``button`` at
+        the current pointer position.
+        """
+        for i in range(n):
+            fake_input(d, X.ButtonPress, button)
+            fake_input(d, X.ButtonRelease, button)
 
     def move(self, x, y):
         if (x, y) != self.position():
-            with display_manager(self.display) as d:
+            with self.guard as d:
                 fake_input(d, X.MotionNotify, x=x, y=y)
+            self._track(x, y)
 
     def drag(self, x, y):
-        with display_manager(self.display) as d:
+        with self.guard as d:
             fake_input(d, X.ButtonPress, 1)
             fake_input(d, X.MotionNotify, x=x, y=y)
             fake_input(d, X.ButtonRelease, 1)
+        self._track(x, y)
+
+    def move_path(self, x, y, duration=0.5, rate=100, kind='minimum_jerk',
+                  controls=None):
+        """Moves the pointer along a trajectory, sending all positions at once
+        with *XTest* delays so that the server plays them back on schedule.
+        """
+        from .path import path
+        points = path(self.position(), (x, y), duration, rate, kind, controls)
+        with display_batch(self.display) as d:
+            self._stream_path(d, points, rate)
+        self._track(x, y)
+
+    def drag_path(self, x, y, duration=0.5, rate=100, kind='minimum_jerk',
+                  controls=None, button=1):
+        """Drags the pointer along a trajectory; see :meth:`move_path`."""
+        from .path import path
+        button = translate_button_code(button)
+        points = path(self.position(), (x, y), duration, rate, kind, controls)
+        with display_batch(self.display) as d:
+            fake_input(d, X.ButtonPress, button)
+            self._stream_path(d, points, rate)
+            fake_input(d, X.ButtonRelease, button)
+        self._track(x, y)
+
+    def _stream_path(self, d, points, rate):
+        """Queues motion to all but the first of ``points``, each delayed to
+        be due at the given rate.
+        """
+        from .path import delays
+        for (x, y), delay in zip(points[1:].tolist(),
+                                 delays(len(points), rate)[1:].tolist()):
+            fake_input(d, X.MotionNotify, time=delay, x=x, y=y)
 
     def position(self):
+        if self.track_position and self._tracked_position is not None:
+            if time.monotonic() - self._tracked_time < self.position_ttl:
+                return self._tracked_position
         coord = self.display.screen().root.query_pointer()._data
-        return coord["root_x"], coord["root_y"]
+        position = coord["root_x"], coord["root_y"]
+        if self.track_position:
+            self.update_position(*position)
+        return position
+
+    def update_position(self, x, y):
+        """Records that the pointer is known to be at ``x``, ``y``. This is
+        only used when tracking the position.
+        """
+        self._tracked_position = (x, y)
+        self._tracked_time = time.monotonic()
+
+    def invalidate_position(self):
+        """Forgets the tracked position, so that the next call to
+        :meth:`position` queries the *X* server.
+        """
+        self._tracked_position = None
+
+    def _track(self, x, y):
+        """Tracks a move made by this instance. The *X* server clamps the
+        pointer to the screen, so the tracked position is clamped likewise.
+        """
+        if self.track_position:
+            width, height = self.screen_size()
+            self.update_position(
+                min(max(x, 0), width - 1),
+                min(max(y, 0), height - 1))
 
     def screen_size(self):
         width = self.display.screen().width_in_pixels
@@ -144,75 +586,422 @@ in X11. This feature is only available on Mac.')
 
 
 class PyMouseEvent(PyMouseEventMeta):
-    def __init__(self, capture=False, capture_move=False, display=None):
+    """
+    The PyMouseEvent implementation for X11 systems (mostly linux). This
+    allows one to listen for mouse input.
+
+    If ``queue`` is a :class:`pymouse.event_queue.EventQueue`, the events are
+    put in it instead of being handled on the listening thread, unless the
+    handler methods are overridden.
+
+    Pointer motion may be coalesced, so that :meth:`move` is only called with
+    the latest of several positions, according to ``coalesce_motion``:
+
+    ``None``
+        Every motion is reported.
+    ``'reply'``
+        Only the last motion of every batch of events received from the
+        server is reported.
+    ``'interval'``
+        Motion is reported at most once every ``motion_interval`` seconds. The
+        last position of a movement is reported by a timer thread once the
+        interval has passed.
+    ``'distance'``
+        Motion is reported once the pointer has moved ``motion_distance``
+        pixels, horizontally or vertically, from the last reported position.
+
+    In every case, the latest position is reported before any click or
+    scroll, so that these are seen in order. :attr:`motion_collapsed` counts
+    the positions that were never reported.
+
+    If :meth:`on_batch` is overridden, it receives the events of every
+    batch received from the server, as a list of
+    :class:`pymouse.x11_record.RecordEvent` tuples or, if :attr:`batch_format`
+    is ``'numpy'``, as a NumPy array; see
+    :func:`pymouse.x11_record.record_batch`. Motion coalescing does not apply
+    then.
+
+    Pointer motion is only recorded if ``record_move`` is true. By default, it
+    is recorded if ``capture_move`` is set, if :meth:`move` or
+    :meth:`on_batch` is overridden, if the events go to a queue, or if the
+    position is reported to a :class:`PyMouse` with :meth:`report_position`;
+    otherwise the server does not even send it.
+    See :meth:`configure_record`.
+    """
+    def __init__(self, capture=False, capture_move=False, display=None,
+                 queue=None, coalesce_motion=None, motion_interval=0.01,
+                 motion_distance=5, record_move=None):
         PyMouseEventMeta.__init__(self,
                                   capture=capture,
-                                  capture_move=capture_move)
+                                  capture_move=capture_move,
+                                  queue=queue)
+        if coalesce_motion not in (None, 'reply', 'interval', 'distance'):
+            raise ValueError(
+                'Unknown motion coalescing: {0}'.format(coalesce_motion))
+        self.coalesce_motion = coalesce_motion
+        self.motion_interval = motion_interval
+        self.motion_distance = motion_distance
+        #: The number of motion events that were not reported
+        self.motion_collapsed = 0
+        self._motion_lock = threading.RLock()
+        self._pending_motion = None
+        self._motion_timer = None
+        self._reported_motion = None
+
+        #The control connection is private, since it is used both by the
+        #recording thread and by the thread stopping the listener; recording
+        #blocks the connection it is enabled on, so it needs another one
         self.display = Display(display)
-        self.display2 = Display(display)
-        self.ctx = self.display2.record_create_context(
-            0,
-            [record.AllClients],
-            [{
-                    'core_requests': (0, 0),
-                    'core_replies': (0, 0),
-                    'ext_requests': (0, 0, 0, 0),
-                    'ext_replies': (0, 0, 0, 0),
-                    'delivered_events': (0, 0),
-                    'device_events': (X.ButtonPressMask, X.ButtonReleaseMask),
-                    'errors': (0, 0),
-                    'client_started': False,
-                    'client_died': False,
-            }])
+        self.record_move = record_move
+        #The record connection and context are created when listening starts,
+        #unless a PyInputEvent records for this listener
+        self._display_name = display
+        self.display2 = None
+        self.ctx = None
+        self._device_events = None
+        #The PyInputEvent recording for this listener, if any
+        self._input = None
+        #The PyMouse objects given to report_position
+        self._position_mice = []
 
     def run(self):
         try:
-            if self.capture and self.capture_move:
-                capturing = X.ButtonPressMask | X.ButtonReleaseMask | X.PointerMotionMask
-            elif self.capture:
-                capturing = X.ButtonPressMask | X.ButtonReleaseMask
-            elif self.capture_move:
-                capturing = X.PointerMotionMask
-            else:
-                capturing = False
+            self._prepare()
+            self.display2.record_enable_context(self.ctx, self.handler)
+            self.display2.record_free_context(self.ctx)
+            self.ctx = None
+        except KeyboardInterrupt:
+            self.stop()
 
-            if capturing:
+    def configure_record(self):
+        """
+        Makes the record context receive the events the listener is currently
+        interested in, creating it if necessary. This is done when the
+        listener starts; call it after changing ``record_move``,
+        ``capture_move`` or ``queue`` while it runs.
+        """
+        device_events = self._wanted_events()
+        if self.ctx is None:
+            if self.display2 is None:
+                self.display2 = Display(self._display_name)
+            self.ctx = self.display2.record_create_context(
+                0, [record.AllClients], [record_range(device_events)])
+        elif device_events != self._device_events:
+            with display_manager(self.display) as d:
+                d.record_unregister_clients(self.ctx, [record.AllClients])
+                d.record_register_clients(
+                    self.ctx, 0, [record.AllClients],
+                    [record_range(device_events)])
+        self._device_events = device_events
+
+    def _wanted_events(self):
+        """Returns the range of device events to record."""
+        record_move = self.record_move
+        if record_move is None:
+            record_move = (self.capture_move or self.queue is not None
+                           or type(self).move is not PyMouseEventMeta.move
+                           or self._batch_hook or self._position_mice)
+        return POINTER_EVENTS if record_move else BUTTON_EVENTS
+
+    def events(self):
+        """
+        Returns an asynchronous iterator over the events of this listener, to
+        be used instead of :meth:`start` by *asyncio* programs::
+
+            async for event in listener.events():
+                print(event)
+
+        The events are the tuples described in :mod:`pymouse.event_queue`; the
+        iteration ends when the listener is stopped. Breaking out of the loop
+        stops the listener only once the iterator is closed; see
+        :func:`pymouse.x11_async.listen`.
+        """
+        from .x11_async import listen
+        return listen(self)
+
+    def _prepare(self):
+        """Sets the recorded events up, and grabs the pointer if capturing was
+        asked for.
+        """
+        self.configure_record()
+        self._grab()
+
+    def _grab(self):
+        """Grabs the pointer if capturing was asked for."""
+        if self.capture and self.capture_move:
+            capturing = X.ButtonPressMask | X.ButtonReleaseMask | X.PointerMotionMask
+        elif self.capture:
+            capturing = X.ButtonPressMask | X.ButtonReleaseMask
+        elif self.capture_move:
+            capturing = X.PointerMotionMask
+        else:
+            capturing = False
+
+        if capturing:
+            if self.display2 is not None:
                 self.display2.screen().root.grab_pointer(True,
                                                          capturing,
                                                          X.GrabModeAsync,
                                                          X.GrabModeAsync,
                                                          0, 0, X.CurrentTime)
-                self.display.screen().root.grab_pointer(True,
-                                                         capturing,
-                                                         X.GrabModeAsync,
-                                                         X.GrabModeAsync,
-                                                         0, 0, X.CurrentTime)
-
-            self.display2.record_enable_context(self.ctx, self.handler)
-            self.display2.record_free_context(self.ctx)
-        except KeyboardInterrupt:
-            self.stop()
+            self.display.screen().root.grab_pointer(True,
+                                                     capturing,
+                                                     X.GrabModeAsync,
+                                                     X.GrabModeAsync,
+                                                     0, 0, X.CurrentTime)
 
     def stop(self):
-        self.state = False
+        PyMouseEventMeta.stop(self)
+        if self._input is not None and self._input.state:
+            self._input.stop()
+        with self._motion_lock:
+            if self._motion_timer is not None:
+                self._motion_timer.cancel()
+                self._motion_timer = None
         with display_manager(self.display) as d:
             d.ungrab_pointer(X.CurrentTime)
-            d.record_disable_context(self.ctx)
-        with display_manager(self.display2) as d:
-            d.ungrab_pointer(X.CurrentTime)
-            d.record_disable_context(self.ctx)
+            if self.ctx is not None:
+                d.record_disable_context(self.ctx)
+        if self.display2 is not None:
+            with display_manager(self.display2) as d:
+                d.ungrab_pointer(X.CurrentTime)
+                if self.ctx is not None:
+                    d.record_disable_context(self.ctx)
+
+    def close(self):
+        """Releases the connections to the *X* server. The listener must have
+        been stopped, or never started.
+        """
+        if self.display is not None:
+            #Under a PyInputEvent, the connection is the keyboard listener's
+            if self._input is None:
+                close_display(self.display)
+            if self.display2 is not None:
+                close_display(self.display2)
+            self.display = self.display2 = None
 
     def handler(self, reply):
-        data = reply.data
-        while len(data):
-            event, data = rq.EventField(None).parse_binary_value(data, self.display.display, None, None)
-
-            if event.detail in [4, 5, 6, 7]:
-                if event.type == X.ButtonPress:
-                    self.scroll(event.root_x, event.root_y, *button_code_to_scroll_direction(event.detail))
-            elif event.type == X.ButtonPress:
-                self.click(event.root_x, event.root_y, translate_button_code(event.detail), True)
-            elif event.type == X.ButtonRelease:
-                self.click(event.root_x, event.root_y, translate_button_code(event.detail), False)
+        if self._batch_hook and not self._position_mice:
+            events = record_batch(reply, self.display, self.batch_format)
+            if len(events):
+                self.on_batch(events)
+        else:
+            self.handle_events(record_events(reply, self.display))
+
+    def report_position(self, mouse):
+        """
+        Reports the pointer position of every batch of recorded events to the
+        tracked position of the :class:`PyMouse` ``mouse``, so that it picks
+        up the motion made by others without querying the server; see
+        :meth:`PyMouse.update_position`. Pointer motion is then recorded.
+
+        Call this before the listener starts, or call :meth:`configure_record`
+        afterwards.
+        """
+        self._position_mice.append(mouse)
+
+    def handle_events(self, events):
+        """Handles a batch of recorded pointer events; see
+        :func:`pymouse.x11_record.record_events`.
+        """
+        if self._position_mice:
+            events = list(events)
+            self._report_position(events)
+        if self._batch_hook:
+            events = event_batch(events, self.batch_format)
+            if len(events):
+                self.on_batch(events)
+            return
+        if self.coalesce_motion is None:
+            for event in events:
+                self._dispatch(event)
+            return
+
+        with self._motion_lock:
+            for event in events:
+                if event.type == X.MotionNotify:
+                    self._coalesce(event)
+                else:
+                    self._flush_motion()
+                    self._dispatch(event)
+            if self.coalesce_motion == 'reply':
+                self._flush_motion()
+
+    def _report_position(self, events):
+        """Reports the last pointer position of ``events`` to the mice given
+        to :meth:`report_position`.
+        """
+        for event in reversed(events):
+            if X.ButtonPress <= event.type <= X.MotionNotify:
+                for mouse in self._position_mice:
+                    mouse.update_position(event.root_x, event.root_y)
+                return
+
+    def _dispatch(self, event):
+        """Calls the handler method of a recorded event."""
+        if event.detail in [4, 5, 6, 7]:
+            if event.type == X.ButtonPress:
+                self.scroll(event.root_x, event.root_y, *button_code_to_scroll_direction(event.detail))
+        elif event.type == X.ButtonPress:
+            self.click(event.root_x, event.root_y, translate_button_code(event.detail), True)
+        elif event.type == X.ButtonRelease:
+            self.click(event.root_x, event.root_y, translate_button_code(event.detail), False)
+        else:
+            self.move(event.root_x, event.root_y)
+
+    def _coalesce(self, event):
+        """Makes a motion event the pending one, and reports it if the
+        coalescing mode allows it already.
+        """
+        if self._pending_motion is not None:
+            self.motion_collapsed += 1
+        self._pending_motion = (event.root_x, event.root_y, event.time)
+
+        mode = self.coalesce_motion
+        reported = self._reported_motion
+        if mode == 'distance':
+            if (reported is None
+                    or abs(event.root_x - reported[0]) >= self.motion_distance
+                    or abs(event.root_y - reported[1]) >= self.motion_distance):
+                self._flush_motion()
+        elif mode == 'interval':
+            #Server times are in milliseconds, and wrap around
+            elapsed = (event.time - reported[2]) & 0xffffffff if reported else None
+            if elapsed is None or elapsed >= self.motion_interval * 1000:
+                self._flush_motion()
+            elif self._motion_timer is None:
+                self._motion_timer = threading.Timer(
+                    self.motion_interval, self._motion_timeout)
+                self._motion_timer.daemon = True
+                self._motion_timer.start()
+
+    def _flush_motion(self):
+        """Reports the pending motion, if any."""
+        if self._motion_timer is not None:
+            self._motion_timer.cancel()
+            self._motion_timer = None
+        pending = self._pending_motion
+        if pending is not None:
+            self._pending_motion = None
+            self._reported_motion = pending
+            self.move(pending[0], pending[1])
+
+    def _motion_timeout(self):
+        with self._motion_lock:
+            self._motion_timer = None
+            self._flush_motion()
+
+
+class Injector(threading.Thread):
+    """
+    Sends input events to a display from a dedicated thread, so that many
+    threads may safely drive one connection.
+
+    Calls made through a :meth:`proxy` are queued and return a
+    :class:`concurrent.futures.Future` at once. The injector thread takes all
+    queued calls, at most ``max_batch`` at a time, runs them in one
+    :func:`display_batch` and then resolves their futures. If an *X* error
+    occurs, all futures of that batch get the :class:`X11Error`::
+
+        injector = Injector()
+        injector.start()
+        mouse = injector.proxy(PyMouse(shared=True))
+        mouse.click(10, 10).result()
+
+    The proxied objects should be created with ``shared=True``, on the thread
+    creating the injector and for the same display, so that they share its
+    connection; they must then only be used through the injector.
+    """
+    def __init__(self, display=None, max_batch=256):
+        threading.Thread.__init__(self)
+        self.daemon = True
+        self.display = acquire_display(display)
+        self.max_batch = max_batch
+        self._queue = queue.Queue()
+
+    def submit(self, function, *args, **kwargs):
+        """Queues a call of ``function`` on the injector thread.
+
+        :return: the future result of the call
+        :rtype: concurrent.futures.Future
+        """
+        future = Future()
+        self._queue.put((future, function, args, kwargs))
+        return future
+
+    def proxy(self, target):
+        """Returns an object whose methods queue calls to the methods of
+        ``target`` on the injector thread, and return their futures.
+        """
+        return _InjectorProxy(self, target)
+
+    def run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            items = [item]
+            while len(items) < self.max_batch:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    self._queue.put(None)
+                    break
+                items.append(item)
+            self._execute(items)
+
+    def _execute(self, items):
+        """Runs the calls of one batch and resolves their futures."""
+        outcomes = []
+        try:
+            with display_batch(self.display):
+                for future, function, args, kwargs in items:
+                    if not future.set_running_or_notify_cancel():
+                        continue
+                    try:
+                        outcomes.append((future, function(*args, **kwargs),
+                                         None))
+                    except Exception as e:
+                        outcomes.append((future, None, e))
+        except Exception as e:
+            for future, result, error in outcomes:
+                future.set_exception(error or e)
+            return
+
+        for future, result, error in outcomes:
+            if error is None:
+                future.set_result(result)
             else:
-                self.move(event.root_x, event.root_y)
+                future.set_exception(error)
+
+    def stop(self):
+        """Stops the injector thread once the calls queued so far are done."""
+        self._queue.put(None)
+
+    def close(self):
+        """Stops the injector thread, waits for it and releases the display.
+        """
+        if self.display is not None:
+            self.stop()
+            if self.is_alive():
+                self.join()
+            release_display(self.display)
+            self.display = None
+
+
+class _InjectorProxy(object):
+    """A proxy returned by :meth:`Injector.proxy`."""
+    def __init__(self, injector, target):
+        self._injector = injector
+        self._target = target
+
+    def __getattr__(self, name):
+        attribute = getattr(self._target, name)
+        if not callable(attribute):
+            return attribute
+
+        def submit(*args, **kwargs):
+            return self._injector.submit(attribute, *args, **kwargs)
+        return submit
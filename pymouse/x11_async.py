@@ -0,0 +1,234 @@
+#Copyright 2013 Paul Barton
+#
+#This program is free software: you can redistribute it and/or modify
+#it under the terms of the GNU General Public License as published by
+#the Free Software Foundation, either version 3 of the License, or
+#(at your option) any later version.
+#
+#This program is distributed in the hope that it will be useful,
+#but WITHOUT ANY WARRANTY; without even the implied warranty of
+#MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#GNU General Public License for more details.
+#
+#You should have received a copy of the GNU General Public License
+#along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+An *asyncio* front-end for PyMouse on X11.
+
+The events are queued and flushed like in a :func:`pymouse.x11.display_batch`,
+and the reply confirming that the *X* server has processed them is awaited
+through the readiness of the display socket, so the event loop is never
+blocked waiting for the server.
+
+The X11 listeners are driven the same way by :func:`listen`, so one event loop
+can listen to any number of displays without a thread for each.
+"""
+
+import asyncio
+from collections import deque
+import weakref
+
+from Xlib.ext import record
+from Xlib.protocol import request
+
+from .x11 import PyMouse, X11Error, display_batch, error_guard
+
+
+#: The locks serialising the calls to :func:`sync`, keyed by display
+_sync_locks = weakref.WeakKeyDictionary()
+
+
+def _readable(loop, fd):
+    """Returns a future that is done when ``fd`` becomes readable."""
+    future = loop.create_future()
+
+    def ready():
+        if not future.done():
+            future.set_result(None)
+
+    loop.add_reader(fd, ready)
+    future.add_done_callback(lambda f: loop.remove_reader(fd))
+    return future
+
+
+async def sleep_until(deadline):
+    """Sleeps until the event loop time ``deadline``. Pacing events against
+    deadlines keeps the time spent sending them from adding up.
+    """
+    loop = asyncio.get_running_loop()
+    await asyncio.sleep(max(deadline - loop.time(), 0))
+
+
+async def sync(display):
+    """Flushes the request queue of ``display`` and waits until the server
+    has processed all requests, without blocking the event loop.
+
+    The errors reported meanwhile are passed on by the
+    :class:`pymouse.x11.ErrorGuard` of the display, usually by raising an
+    :class:`pymouse.x11.X11Error`.
+
+    :param Xlib.display.Display display: The *X* display.
+    """
+    try:
+        lock = _sync_locks[display]
+    except KeyError:
+        lock = _sync_locks[display] = asyncio.Lock()
+
+    async with lock:
+        loop = asyncio.get_running_loop()
+        guard = error_guard(display)
+        reply = request.GetInputFocus(display=display.display, defer=True)
+        display.flush()
+        while reply._data is None and reply._error is None:
+            await _readable(loop, display.fileno())
+            #Reads whatever has arrived without blocking
+            display.pending_events()
+        guard._settle()
+        guard.check()
+
+
+async def record_replies(display, context):
+    """
+    Enables the record context ``context`` on ``display``, and yields the
+    replies as they arrive, without blocking the event loop, until the context
+    is disabled.
+
+    :param Xlib.display.Display display: The dedicated record connection.
+
+    :param int context: The record context.
+    """
+    loop = asyncio.get_running_loop()
+    replies = deque()
+    enable = record.EnableContext(
+        callback=replies.append,
+        display=display.display,
+        defer=True,
+        opcode=display.display.get_extension_major(record.extname),
+        context=context)
+    display.flush()
+    while True:
+        while replies:
+            yield replies.popleft()
+        if enable._error is not None:
+            raise X11Error([(enable._error, None)])
+        if enable._data is not None:
+            #The end of data was reported
+            return
+        await _readable(loop, display.fileno())
+        display.pending_events()
+
+
+class _EventList(deque):
+    """Collects the events of a listener in place of its queue."""
+    put = deque.append
+
+    def close(self):
+        pass
+
+
+async def listen(listener):
+    """
+    Yields the events of an X11 :class:`pymouse.x11.PyMouseEvent` or
+    :class:`pykeyboard.x11.PyKeyboardEvent`, as returned by its ``events()``
+    method, until it is stopped.
+
+    The record replies are decoded by the handler of the listener on the
+    event loop, and the events put in its queue by its default handler
+    methods are yielded; see :mod:`pymouse.event_queue`. The listener must
+    not be started as a thread as well. Its own queue, if any, is set aside
+    meanwhile, and restored once the iteration ends.
+
+    A consumer leaving the iteration early stops the listener only once the
+    generator is closed, which *asyncio* otherwise leaves to the garbage
+    collector; close it explicitly, for instance with
+    :func:`contextlib.aclosing`::
+
+        async with aclosing(listener.events()) as events:
+            async for event in events:
+                if event[0] == 'click':
+                    break
+    """
+    events = _EventList()
+    queue, listener.queue = listener.queue, events
+    listener.state = True
+    finished = False
+    try:
+        listener._prepare()
+        async for reply in record_replies(listener.display2, listener.ctx):
+            listener.handler(reply)
+            while events:
+                yield events.popleft()
+        finished = True
+    finally:
+        if not finished and listener.state:
+            #The consumer gave up early
+            listener.stop()
+        if listener.ctx is not None:
+            listener.display2.record_free_context(listener.ctx)
+            listener.ctx = None
+        listener.queue = queue
+
+
+class AsyncPyMouse(object):
+    """
+    A PyMouse whose methods generating events are coroutines.
+
+    The pointer position is tracked by default, so that moving the pointer
+    does not have to query the server; see :class:`pymouse.x11.PyMouse`.
+    """
+    def __init__(self, display=None, track_position=True, position_ttl=0.5):
+        self.mouse = PyMouse(display, track_position=track_position,
+                             position_ttl=position_ttl)
+        self.display = self.mouse.display
+
+    async def _run(self, function, *args, **kwargs):
+        """Queues the events generated by a call of ``function``, and waits
+        for the server to process them.
+        """
+        with display_batch(self.display, sync=False):
+            result = function(*args, **kwargs)
+        await sync(self.display)
+        return result
+
+    async def press(self, x, y, button=1):
+        await self._run(self.mouse.press, x, y, button)
+
+    async def release(self, x, y, button=1):
+        await self._run(self.mouse.release, x, y, button)
+
+    async def click(self, x, y, button=1, n=1, interval=0):
+        if not interval:
+            await self._run(self.mouse.click, x, y, button, n)
+            return
+        start = asyncio.get_running_loop().time()
+        for i in range(n):
+            await sleep_until(start + i * interval)
+            await self._run(self.mouse.click, x, y, button)
+
+    async def scroll(self, vertical=None, horizontal=None, depth=None):
+        await self._run(self.mouse.scroll, vertical, horizontal, depth)
+
+    async def move(self, x, y):
+        await self._run(self.mouse.move, x, y)
+
+    async def drag(self, x, y):
+        await self._run(self.mouse.drag, x, y)
+
+    def position(self):
+        """Returns the pointer position; this queries the server only when
+        the tracked position is stale.
+        """
+        return self.mouse.position()
+
+    def screen_size(self):
+        return self.mouse.screen_size()
+
+    def close(self):
+        self.mouse.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
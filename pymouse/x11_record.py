@@ -0,0 +1,176 @@
+#Copyright 2013 Paul Barton
+#
+#This program is free software: you can redistribute it and/or modify
+#it under the terms of the GNU General Public License as published by
+#the Free Software Foundation, either version 3 of the License, or
+#(at your option) any later version.
+#
+#This program is distributed in the hope that it will be useful,
+#but WITHOUT ANY WARRANTY; without even the implied warranty of
+#MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#GNU General Public License for more details.
+#
+#You should have received a copy of the GNU General Public License
+#along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Decodes the events recorded by the *XRecord* extension for PyMouseEvent and
+PyKeyboardEvent.
+
+A recorded reply holds many 32 byte wire events back to back. *Xlib* decodes
+them one by one into full event objects, copying the rest of the buffer every
+time. The device events used by the listeners all share one layout, so they
+are unpacked here straight from a :class:`memoryview` of the reply into
+:class:`RecordEvent` tuples, which have the attributes of the corresponding
+*Xlib* events. Any other event is still decoded by *Xlib*.
+
+The record ranges asking for these events are built by :func:`record_range`.
+Listeners handling whole replies at once may also get them as a NumPy array
+through :func:`record_batch`.
+"""
+
+from collections import namedtuple
+import functools
+import struct
+
+from Xlib import X
+from Xlib.protocol import rq
+
+
+#: A recorded KeyPress, KeyRelease, ButtonPress, ButtonRelease or
+#: MotionNotify event
+RecordEvent = namedtuple('RecordEvent', (
+    'type', 'detail', 'sequence_number', 'time', 'root', 'window', 'child',
+    'root_x', 'root_y', 'event_x', 'event_y', 'state', 'same_screen'))
+
+#: The wire layout of the events decoded into :class:`RecordEvent`; the
+#: display connection uses the native byte order
+EVENT_LAYOUT = struct.Struct('=BBHIIIIhhhhHBx')
+
+#: The size of a core event
+EVENT_SIZE = 32
+
+#: The event types decoded into :class:`RecordEvent`
+DEVICE_EVENTS = range(X.KeyPress, X.MotionNotify + 1)
+
+_event_field = rq.EventField(None)
+
+
+def record_events(reply, display):
+    """
+    Yields the events of the recorded ``reply``.
+
+    Device events are returned as :class:`RecordEvent` tuples, any other event
+    as an *Xlib* event object.
+
+    :param reply: The reply passed to a record context callback.
+
+    :param Xlib.display.Display display: The display the reply was read from.
+    """
+    data = reply.data
+    view = memoryview(data)
+    size = len(view)
+    if size and not size % EVENT_SIZE:
+        types = data[::EVENT_SIZE]
+        if min(types) >= X.KeyPress and max(types) <= X.MotionNotify:
+            #The usual case: only device events
+            return map(RecordEvent._make, EVENT_LAYOUT.iter_unpack(view))
+    return _mixed_events(view, display)
+
+
+def _mixed_events(view, display):
+    """Yields the events of a reply holding other than device events."""
+    unpack_from = EVENT_LAYOUT.unpack_from
+    make = RecordEvent._make
+    offset = 0
+    size = len(view)
+    while offset < size:
+        if view[offset] in DEVICE_EVENTS and offset + EVENT_SIZE <= size:
+            yield make(unpack_from(view, offset))
+            offset += EVENT_SIZE
+        else:
+            event, rest = _event_field.parse_binary_value(
+                view[offset:].tobytes(), display.display, None, None)
+            yield event
+            offset = size - len(rest)
+
+
+@functools.lru_cache(maxsize=None)
+def event_dtype():
+    """Returns the NumPy structured dtype of the device events."""
+    import numpy
+    return numpy.dtype([
+        ('type', 'u1'), ('detail', 'u1'), ('sequence_number', 'u2'),
+        ('time', 'u4'), ('root', 'u4'), ('window', 'u4'), ('child', 'u4'),
+        ('root_x', 'i2'), ('root_y', 'i2'), ('event_x', 'i2'),
+        ('event_y', 'i2'), ('state', 'u2'), ('same_screen', 'u1'),
+        ('pad', 'u1')])
+
+
+def record_batch(reply, display, format='list'):
+    """
+    Returns the device events of the recorded ``reply`` at once.
+
+    :param str format: ``'list'`` for a list of the events yielded by
+        :func:`record_events`, or ``'numpy'`` for a NumPy structured array of
+        :func:`event_dtype`. The array is a read-only view of the reply, and
+        only holds its device events; this requires NumPy.
+    """
+    data = reply.data
+    if format != 'numpy' or len(data) % EVENT_SIZE:
+        return event_batch(record_events(reply, display), format)
+
+    import numpy
+    events = numpy.frombuffer(data, dtype=event_dtype())
+    types = events['type']
+    device = (types >= X.KeyPress) & (types <= X.MotionNotify)
+    if not device.all():
+        events = events[device]
+    return events
+
+
+def event_batch(events, format='list'):
+    """
+    Returns the events yielded by :func:`record_events` in the form returned
+    by :func:`record_batch`.
+    """
+    if format == 'list':
+        return list(events)
+    if format != 'numpy':
+        raise ValueError('Unknown batch format: {0}'.format(format))
+
+    import numpy
+    return numpy.array([event + (0,) for event in events
+                        if isinstance(event, RecordEvent)],
+                       dtype=event_dtype())
+
+
+#: The device events recorded by listeners interested in buttons only
+BUTTON_EVENTS = (X.ButtonPress, X.ButtonRelease)
+
+#: The device events recorded by listeners interested in buttons and motion
+POINTER_EVENTS = (X.ButtonPress, X.MotionNotify)
+
+#: The device events recorded by keyboard listeners
+KEY_EVENTS = (X.KeyPress, X.KeyRelease)
+
+
+def record_range(device_events):
+    """
+    Returns a record range of the device events whose types lie in the
+    inclusive range ``device_events``, such as :data:`BUTTON_EVENTS`.
+
+    Note that the *XRecord* range is made of event type codes, not of event
+    masks.
+    """
+    return {
+        'core_requests': (0, 0),
+        'core_replies': (0, 0),
+        'ext_requests': (0, 0, 0, 0),
+        'ext_replies': (0, 0, 0, 0),
+        'delivered_events': (0, 0),
+        'device_events': device_events,
+        'errors': (0, 0),
+        'client_started': False,
+        'client_died': False,
+    }
@@ -15,12 +15,15 @@
 # You should have received a copy of the GNU General Public License along with
 # this program. If not, see <http://www.gnu.org/licenses/>.
 """
-Converts the file xlib-keysyms.txt to a Python mapping from character to
-symbol name.
+Converts the file xlib-keysyms.txt and the keysym groups of *Xlib* to a
+compact Python index from character and symbol name to keysym.
 """
 
+import importlib
 import os
 
+import Xlib.keysymdef
+
 #: The path to the input file
 INPUT_PATH = os.path.join(
     os.path.dirname(__file__),
@@ -33,6 +36,132 @@ OUTPUT_PATH = os.path.join(
     'pykeyboard',
     'x11_keysyms.py')
 
+#: The generated module; the literals of the tables are inserted
+TEMPLATE = '''# coding: utf-8
+# Copyright 2015 Moses Palmér
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+"""
+An index from characters and keysym names to keysyms, and the table of the
+characters of the keysyms predating Unicode.
+
+This file is generated by ``reference_materials/xlib-keysyms-to-python.py``
+from ``xlib-keysyms.txt`` and the keysym groups of *Xlib*; do not edit it.
+
+The tables are stored as strings, which are only unpacked into sorted lists
+and arrays when they are first used, and are then shared.
+"""
+
+from array import array
+from bisect import bisect_left
+import sys
+
+
+#: The characters and keysym names, sorted and separated by newlines
+%s
+
+#: The keysyms of the keys, as 32 bit big endian hexadecimal numbers
+%s
+
+#: The keysyms predating Unicode that have a character, sorted, as 32 bit big
+#: endian hexadecimal numbers
+%s
+
+#: The code points of the characters of the legacy keysyms, likewise
+%s
+
+_index = None
+_legacy = None
+
+
+def _unpack(numbers):
+    """Returns an array of the 32 bit big endian hexadecimal numbers."""
+    values = array('I', bytes.fromhex(numbers))
+    if sys.byteorder == 'little':
+        values.byteswap()
+    return values
+
+
+def index():
+    """Returns the sorted list of keys and the array of their keysyms.
+    """
+    global _index
+    if _index is None:
+        _index = (_KEYS.split('\\n'), _unpack(_KEYSYMS))
+    return _index
+
+
+def lookup(key, default=0):
+    """Returns the keysym of a character or keysym name, or ``default`` if it
+    is unknown.
+    """
+    keys, keysyms = index()
+    i = bisect_left(keys, key)
+    if i < len(keys) and keys[i] == key:
+        return keysyms[i]
+    return default
+
+
+def keysym_to_character(keysym):
+    """Returns the character of a keysym, or ``None`` if it has none.
+
+    Latin-1 keysyms are their own code point, Unicode keysyms are the code
+    point plus ``0x01000000``, and the other legacy keysyms are looked up.
+    Keysyms of functions, such as ``BackSpace``, have no character.
+    """
+    if 0x20 <= keysym <= 0x7e or 0xa0 <= keysym <= 0xff:
+        return chr(keysym)
+    if 0x01000100 <= keysym <= 0x0110ffff:
+        return chr(keysym - 0x01000000)
+
+    global _legacy
+    if _legacy is None:
+        _legacy = (_unpack(_LEGACY_KEYSYMS), _unpack(_LEGACY_CODEPOINTS))
+    keysyms, codepoints = _legacy
+    i = bisect_left(keysyms, keysym)
+    if i < len(keysyms) and keysyms[i] == keysym:
+        return chr(codepoints[i])
+    return None
+
+
+def _characters():
+    """Returns a dict mapping every character in the index to the name of its
+    keysym.
+    """
+    keys, keysyms = index()
+    names = {}
+    for key, keysym in zip(keys, keysyms):
+        if len(key) > 1:
+            names.setdefault(keysym, key)
+    return {
+        key: key if key.isalnum() and key.isascii() else names[keysym]
+        for key, keysym in zip(keys, keysyms)
+        if len(key) == 1}
+
+
+def __getattr__(name):
+    """Builds :data:`KEYSYMS`, the former mapping from character to keysym
+    name, on first use.
+    """
+    if name == 'KEYSYMS':
+        global KEYSYMS
+        KEYSYMS = _characters()
+        return KEYSYMS
+    raise AttributeError(
+        'module {0!r} has no attribute {1!r}'.format(__name__, name))
+'''
+
 
 def lines():
     """Yields all lines in the input file.
@@ -71,41 +200,75 @@ def keysym_definitions():
         yield (int(keysym_number, 16), codepoint[1:], status, name)
 
 
-def keysyms_from_strings():
-    """Yields the tuple ``(character, symbol name)`` for all keysyms.
+def keysyms_from_names():
+    """Yields the tuple ``(symbol name, keysym)`` for all keysyms named in the
+    input file and in the keysym groups of *Xlib*.
     """
+    for number, _, _, name in keysym_definitions():
+        yield (name, number)
+
+    for group in Xlib.keysymdef.__all__:
+        module = importlib.import_module('Xlib.keysymdef.' + group)
+        for name, number in vars(module).items():
+            if name.startswith('XK_'):
+                yield (name[3:], number)
+
+
+def keysym_index():
+    """Returns the sorted list of tuples ``(key, keysym)``, where the key is
+    either a character or a symbol name.
+
+    A key mapped to several keysyms keeps the first one.
+    """
+    index = {}
     for number, codepoint, status, name in keysym_definitions():
-        # Ignore keysyms that do not map to unicode characters
-        if all(c == '0' for c in codepoint):
-            continue
+        # Only map the characters of well established keysyms
+        if status == '.' and not all(c == '0' for c in codepoint):
+            index.setdefault(chr(int(codepoint, 16)), number)
+    for name, number in keysyms_from_names():
+        index.setdefault(name, number)
+    return sorted(index.items())
 
-        # Ignore keysyms that are not well established
-        if status != '.':
-            continue
 
-        yield (codepoint, name)
+def legacy_keysyms():
+    """Returns the sorted list of tuples ``(keysym, code point)`` for the well
+    established keysyms that are neither Latin-1 nor Unicode keysyms.
+
+    A keysym mapped to several characters keeps the first one.
+    """
+    legacy = {}
+    for number, codepoint, status, name in keysym_definitions():
+        if status == '.' and 0xff < number < 0x01000000:
+            legacy.setdefault(number, int(codepoint, 16))
+    return sorted(legacy.items())
+
+
+def literal(name, value, width=70):
+    """Returns the source of the assignment of the long string ``value`` to
+    ``name``, split over several lines.
+    """
+    parts = []
+    part = ''
+    for c in value:
+        escaped = ascii(c)[1:-1].replace('\'', '\\\'')
+        if len(part) + len(escaped) > width:
+            parts.append(part)
+            part = ''
+        part += escaped
+    parts.append(part)
+    return '%s = (\n%s)' % (
+        name, '\n'.join('    \'%s\'' % part for part in parts))
 
 
 if __name__ == '__main__':
+    index = keysym_index()
+    legacy = legacy_keysyms()
     with open(OUTPUT_PATH, 'w') as f:
-        f.write('''# coding: utf-8
-# Copyright 2015 Moses Palmér
-#
-# This program is free software: you can redistribute it and/or modify it
-# under the terms of the GNU General Public License as published by the Free
-# Software Foundation, either version 3 of the License, or (at your option)
-# any later version.
-#
-# This program is distributed in the hope that it will be useful, but WITHOUT
-# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
-# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
-# details.
-#
-# You should have received a copy of the GNU General Public License along with
-# this program. If not, see <http://www.gnu.org/licenses/>.
-
-KEYSYMS = {
-%s}
-''' % ',\n'.join(
-            '    u\'\\u%s\': \'%s\'' % (codepoint, name)
-            for codepoint, name in keysyms_from_strings()))
+        f.write(TEMPLATE % (
+            literal('_KEYS', '\n'.join(key for key, _ in index)),
+            literal('_KEYSYMS', ''.join(
+                '%08x' % keysym for _, keysym in index)),
+            literal('_LEGACY_KEYSYMS', ''.join(
+                '%08x' % keysym for keysym, _ in legacy)),
+            literal('_LEGACY_CODEPOINTS', ''.join(
+                '%08x' % codepoint for _, codepoint in legacy))))
@@ -0,0 +1,163 @@
+from collections import deque, namedtuple
+from nose.tools import eq_, ok_
+from pymouse.x11 import PyMouseEvent, X11Error, display_batch
+from pymouse.x11_async import sync
+from pymouse.x11_record import EVENT_LAYOUT
+from unittest import TestCase, mock
+from Xlib import X
+import asyncio
+import socket
+
+
+StubError = namedtuple('StubError', ('name', 'sequence_number'))
+StubReply = namedtuple('StubReply', ('category', 'data'))
+
+
+class StubProtocolDisplay(object):
+    def __init__(self):
+        self.error_handler = None
+        self.request_serial = 1
+        self.requests = []
+
+    def send_request(self, request, wait_for_response):
+        self.requests.append(request)
+
+    def get_extension_major(self, name):
+        return 128
+
+
+class StubDisplay(object):
+    """Stands in for an Xlib display. The responses of the server are
+    functions queued with :meth:`respond`, called once the socket of the
+    display has become readable and the display reads it.
+    """
+    def __init__(self, name=None):
+        self.display = StubProtocolDisplay()
+        self.socket, self.server = socket.socketpair()
+        self.socket.setblocking(False)
+        self.responses = deque()
+        self.calls = []
+        self.contexts = []
+
+    def respond(self, function):
+        self.responses.append(function)
+        self.server.send(b'.')
+
+    def reply(self, data=None, error=None):
+        """Responds to the last request sent."""
+        def respond():
+            request = self.display.requests[-1]
+            if error is not None:
+                self.display.error_handler(
+                    StubError(error, self.display.request_serial), None)
+            request._data = data
+        self.respond(respond)
+
+    def fileno(self):
+        return self.socket.fileno()
+
+    def pending_events(self):
+        try:
+            count = len(self.socket.recv(4096))
+        except BlockingIOError:
+            count = 0
+        for i in range(count):
+            self.responses.popleft()()
+        return 0
+
+    def set_error_handler(self, handler):
+        self.display.error_handler = handler
+
+    def flush(self):
+        pass
+
+    def sync(self):
+        pass
+
+    def close(self):
+        self.socket.close()
+        self.server.close()
+
+    def ungrab_pointer(self, time):
+        pass
+
+    def record_create_context(self, *args):
+        self.contexts.append(7)
+        return 7
+
+    def record_disable_context(self, context):
+        self.calls.append(('record_disable_context', context))
+
+    def record_free_context(self, context):
+        self.contexts.remove(context)
+
+
+def motion(x, y):
+    return EVENT_LAYOUT.pack(X.MotionNotify, 0, 0, 0, 1, 1, 0, x, y, x, y, 0,
+                             1)
+
+
+class StubQueue(object):
+    def close(self):
+        pass
+
+
+class Test(TestCase):
+    def setUp(self):
+        with mock.patch('pymouse.x11.Display', StubDisplay):
+            self.listener = PyMouseEvent(queue=StubQueue())
+        self.queue = self.listener.queue
+        self.display = self.listener.display
+        self.record = self.listener.display2 = StubDisplay()
+
+    def tearDown(self):
+        self.listener.close()
+
+    def record_replies(self, *replies):
+        """Has the record connection receive ``replies``."""
+        def respond(data):
+            def callback():
+                self.record.display.requests[-1]._callback(
+                    StubReply(0, data))
+            return callback
+        for data in replies:
+            self.record.respond(respond(data))
+
+    def test_sync(self):
+        async def main():
+            self.display.reply(data={})
+            await sync(self.display)
+        asyncio.run(main())
+
+    def test_sync_error(self):
+        async def main():
+            with display_batch(self.display, sync=False):
+                pass
+            self.display.reply(data={}, error='error')
+            await sync(self.display)
+        self.assertRaises(X11Error, asyncio.run, main())
+        eq_(None, self.display.display.error_handler)
+
+    def test_listen(self):
+        async def main():
+            self.record_replies(motion(1, 2), motion(3, 4))
+            self.record.reply(data=StubReply(5, b''))
+            return [event async for event in self.listener.events()]
+        eq_([('move', 1, 2), ('move', 3, 4)], asyncio.run(main()))
+        ok_(self.listener.queue is self.queue)
+        eq_(None, self.listener.ctx)
+        eq_([], self.record.contexts)
+
+    def test_aclose(self):
+        async def main():
+            self.record_replies(motion(1, 2), motion(3, 4))
+            events = self.listener.events()
+            event = await events.__anext__()
+            await events.aclose()
+            return event
+        eq_(('move', 1, 2), asyncio.run(main()))
+        ok_(not self.listener.state)
+        eq_([('record_disable_context', 7)], self.display.calls)
+        ok_(self.listener.queue is self.queue)
+        eq_(None, self.listener.ctx)
+        eq_([], self.record.contexts)
@@ -0,0 +1,167 @@
+from collections import namedtuple
+from nose.tools import eq_, ok_
+from pymouse.x11 import ErrorGuard, X11Error, close_display, error_guard
+from unittest import TestCase
+import gc
+import threading
+import weakref
+
+
+StubError = namedtuple('StubError', ('name', 'sequence_number'))
+
+
+class StubDisplay(object):
+    """Stands in for an Xlib display; the errors of the requests sent are
+    reported when the display is sync'd.
+    """
+    def __init__(self):
+        #Xlib keeps the error handler in the protocol display
+        self.display = self
+        self.error_handler = None
+        self.request_serial = 1
+        self.closed = False
+        self.syncs = 0
+        self.flushes = 0
+        self.requests = []
+
+    def set_error_handler(self, handler):
+        self.error_handler = handler
+
+    def request(self, error=None):
+        if error is not None:
+            error = StubError(error, self.request_serial)
+        self.request_serial = (self.request_serial + 1) % 65536
+        self.requests.append(error)
+
+    def sync(self):
+        self.syncs += 1
+        self._process()
+
+    def flush(self):
+        self.flushes += 1
+
+    def default_error_handler(self, error):
+        raise AssertionError('Unhandled error {0}'.format(error))
+
+    def close(self):
+        self.closed = True
+
+    def _process(self):
+        requests, self.requests = self.requests, []
+        for error in requests:
+            if error is not None:
+                self.error_handler(error, None)
+
+
+class Test(TestCase):
+    def setUp(self):
+        self.display = StubDisplay()
+        self.guard = ErrorGuard(self.display)
+
+    def test_nesting(self):
+        with self.guard as d:
+            with self.guard:
+                d.request()
+            eq_(0, self.display.syncs)
+        eq_(1, self.display.syncs)
+
+        with self.guard.batch():
+            with self.guard:
+                self.display.request()
+            with self.guard.batch():
+                self.display.request()
+            eq_(1, self.display.syncs)
+        eq_(2, self.display.syncs)
+        eq_(0, self.guard.depth)
+
+    def test_errors(self):
+        def fail():
+            with self.guard as d:
+                d.request('error')
+        self.assertRaises(X11Error, fail)
+        eq_([], self.guard.errors)
+
+    def test_deferred(self):
+        self.guard.deferred = True
+        with self.guard as d:
+            d.request('error')
+        eq_((0, 1), (self.display.syncs, self.display.flushes))
+        with self.guard as d:
+            d.request()
+        #The guard stays installed until the errors have been read
+        eq_(self.guard._trap, self.display.error_handler)
+        self.assertRaises(X11Error, self.guard.barrier)
+        eq_(None, self.display.error_handler)
+        self.guard.barrier()
+
+    def test_error_handler(self):
+        previous = []
+        self.display.set_error_handler(lambda *args: previous.append(args))
+        handler = self.display.error_handler
+        with self.guard as d:
+            with self.guard:
+                eq_(self.guard._trap, d.error_handler)
+        eq_(handler, self.display.error_handler)
+
+        #Errors of requests sent outside of the guard are not its own
+        self.display.request('unguarded')
+        with self.guard:
+            pass
+        eq_([(StubError('unguarded', 1), None)], previous)
+        eq_([], self.guard.errors)
+
+    def test_lifetime(self):
+        display = StubDisplay()
+        guard = error_guard(display)
+        ok_(error_guard(display) is guard)
+        with guard:
+            pass
+        close_display(display)
+        ok_(display.closed)
+        ok_(error_guard(display) is not guard)
+
+        reference = weakref.ref(display)
+        del display, guard
+        gc.collect()
+        ok_(reference() is None)
+
+    def test_callback(self):
+        reported = []
+        self.guard.callback = reported.append
+        with self.guard as d:
+            d.request('error')
+        eq_([[(StubError('error', 1), None)]], reported)
+
+    def test_exception(self):
+        def fail(manager):
+            with manager as d:
+                d.request('error')
+                raise ValueError()
+        self.assertRaises(ValueError, fail, self.guard)
+        self.assertRaises(ValueError, fail, self.guard.batch())
+        eq_(0, self.guard.depth)
+        eq_([], self.guard.errors)
+        with self.guard:
+            pass
+
+    def test_threads(self):
+        entered = threading.Event()
+        done = threading.Event()
+
+        def other():
+            with self.guard:
+                entered.set()
+                done.wait()
+
+        thread = threading.Thread(target=other)
+        with self.guard.batch():
+            thread.start()
+            entered.wait()
+        done.set()
+        thread.join()
+        eq_(0, self.guard.depth)
+        syncs = self.display.syncs
+        with self.guard:
+            pass
+        eq_(syncs + 1, self.display.syncs)
+        ok_(not self.guard.errors)
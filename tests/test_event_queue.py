@@ -0,0 +1,62 @@
+from nose.tools import eq_, ok_
+from pymouse.event_queue import EventQueue, EventQueueClosed
+from unittest import TestCase
+import queue
+import threading
+import time
+
+
+class Test(TestCase):
+    def test_order(self):
+        events = EventQueue()
+        for i in range(5):
+            events.put(('click', i, 0, 1, True))
+        eq_(('click', 0, 0, 1, True), events.get())
+        eq_([1, 2], [e[1] for e in events.drain(2)])
+        eq_([3, 4], [e[1] for e in events.drain()])
+        self.assertRaises(queue.Empty, events.get, 0.01)
+
+    def test_drop_oldest(self):
+        events = EventQueue(3, 'drop_oldest')
+        for i in range(5):
+            events.put(('move', i, i))
+        eq_([2, 3, 4], [e[1] for e in events.drain()])
+        eq_(2, events.dropped)
+
+    def test_drop_newest(self):
+        events = EventQueue(3, 'drop_newest')
+        for i in range(5):
+            events.put(('move', i, i))
+        eq_([0, 1, 2], [e[1] for e in events.drain()])
+        eq_(2, events.dropped)
+
+    def test_coalesce_motion(self):
+        events = EventQueue(3, 'coalesce_motion')
+        events.put(('move', 1, 1))
+        events.put(('move', 2, 2))
+        events.put(('click', 2, 2, 1, True))
+        events.put(('move', 3, 3))
+        events.put(('move', 4, 4))
+        eq_([('move', 2, 2), ('click', 2, 2, 1, True), ('move', 4, 4)],
+            events.drain())
+        eq_(2, events.coalesced)
+        eq_(0, events.dropped)
+
+    def test_block(self):
+        events = EventQueue(1, 'block')
+        events.put(('move', 0, 0))
+        producer = threading.Thread(target=events.put, args=(('move', 1, 1),))
+        producer.start()
+        time.sleep(0.05)
+        ok_(producer.is_alive())
+        eq_(('move', 0, 0), events.get())
+        producer.join(1.0)
+        eq_(('move', 1, 1), events.get())
+
+    def test_close(self):
+        events = EventQueue()
+        events.put(('tap', 38, 'a', True))
+        events.close()
+        ok_(not events.put(('tap', 38, 'a', False)))
+        eq_([('tap', 38, 'a', True)], list(events))
+        self.assertRaises(EventQueueClosed, events.get)
@@ -0,0 +1,107 @@
+from collections import namedtuple
+from nose.tools import eq_, ok_
+from pymouse.x11 import Injector, X11Error
+from unittest import TestCase, mock
+import threading
+
+
+StubError = namedtuple('StubError', ('name', 'sequence_number'))
+
+
+class StubDisplay(object):
+    """Stands in for an Xlib display; errors are reported when it is
+    sync'd.
+    """
+    def __init__(self, name=None):
+        self.display = self
+        self.error_handler = None
+        self.request_serial = 1
+        self.syncs = 0
+        self.closed = False
+        self.pending = []
+
+    def set_error_handler(self, handler):
+        self.error_handler = handler
+
+    def sync(self):
+        self.syncs += 1
+        pending, self.pending = self.pending, []
+        for error in pending:
+            self.error_handler(StubError(error, 1), None)
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+class Target(object):
+    """An object whose methods are called through an injector proxy."""
+    size = 3
+
+    def __init__(self):
+        self.calls = []
+
+    def add(self, a, b):
+        self.calls.append(('add', a, b))
+        return a + b
+
+    def fail(self):
+        raise ValueError('fail')
+
+
+class Test(TestCase):
+    def setUp(self):
+        with mock.patch('pymouse.x11.Display', StubDisplay):
+            self.injector = Injector()
+        self.display = self.injector.display
+        self.injector.start()
+
+    def tearDown(self):
+        self.injector.close()
+
+    def test_order(self):
+        calls = []
+        futures = [self.injector.submit(calls.append, i) for i in range(100)]
+        for future in futures:
+            eq_(None, future.result(1))
+        eq_(list(range(100)), calls)
+
+    def test_batch(self):
+        blocked = threading.Event()
+        self.injector.submit(blocked.wait)
+        futures = [self.injector.submit(len, 'a' * i) for i in range(10)]
+        syncs = self.display.syncs
+        blocked.set()
+        eq_(list(range(10)), [future.result(1) for future in futures])
+        #The calls queued meanwhile were run in one batch
+        ok_(self.display.syncs <= syncs + 2)
+
+    def test_proxy(self):
+        target = Target()
+        proxy = self.injector.proxy(target)
+        eq_(3, proxy.size)
+        eq_(5, proxy.add(2, 3).result(1))
+        self.assertRaises(ValueError, proxy.fail().result, 1)
+        eq_(7, proxy.add(3, 4).result(1))
+        eq_([('add', 2, 3), ('add', 3, 4)], target.calls)
+
+    def test_x_error(self):
+        blocked = threading.Event()
+        self.injector.submit(blocked.wait)
+        first = self.injector.submit(self.display.pending.append, 'error')
+        second = self.injector.submit(len, 'ab')
+        blocked.set()
+        self.assertRaises(X11Error, first.result, 1)
+        self.assertRaises(X11Error, second.result, 1)
+        eq_(2, self.injector.submit(len, 'ab').result(1))
+
+    def test_close(self):
+        calls = []
+        future = self.injector.submit(calls.append, 1)
+        self.injector.close()
+        ok_(not self.injector.is_alive())
+        ok_(future.done())
+        eq_([1], calls)
+        ok_(self.display.closed)
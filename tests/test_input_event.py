@@ -0,0 +1,111 @@
+from nose.tools import eq_, ok_
+from pykeyboard.x11 import PyInputEvent, PyKeyboardEvent
+from pymouse.x11 import PyMouseEvent
+from pymouse.x11_record import EVENT_LAYOUT
+from test_keyboard_event import StubDisplay
+from unittest import TestCase, mock
+from Xlib import X
+
+
+class CountingDisplay(StubDisplay):
+    """A stub display keeping track of the connections opened."""
+    opened = []
+
+    def __init__(self, name=None):
+        StubDisplay.__init__(self, name)
+        self.opened.append(self)
+        self.requests = []
+
+    def ungrab_pointer(self, time):
+        self.requests.append('ungrab_pointer')
+
+    def ungrab_keyboard(self, time):
+        self.requests.append('ungrab_keyboard')
+
+    def record_disable_context(self, context):
+        self.requests.append(('record_disable_context', context))
+
+
+class FakeReply(object):
+    def __init__(self, events):
+        self.data = b''.join(EVENT_LAYOUT.pack(
+            type, detail, 0, 0, 1, 1, 0, x, y, x, y, 0, 1)
+            for type, detail, x, y in events)
+
+
+class Mouse(PyMouseEvent):
+    def click(self, x, y, button, press):
+        self.calls.append(('click', x, y, button, press))
+
+    def move(self, x, y):
+        self.calls.append(('move', x, y))
+
+
+class Keyboard(PyKeyboardEvent):
+    def tap(self, keycode, character, press):
+        self.calls.append(('tap', keycode, character, press))
+
+
+class Test(TestCase):
+    def setUp(self):
+        CountingDisplay.opened = []
+        with mock.patch('pymouse.x11.Display', CountingDisplay), \
+                mock.patch('pykeyboard.x11.Display', CountingDisplay):
+            self.mouse = Mouse()
+            self.keyboard = Keyboard()
+            self.input = PyInputEvent(self.mouse, self.keyboard)
+        self.calls = self.mouse.calls = self.keyboard.calls = []
+
+    def test_connections(self):
+        opened = CountingDisplay.opened
+        eq_(3, len(opened))
+        ok_(self.mouse.display is self.keyboard.display)
+        ok_(self.input.display is self.keyboard.display)
+        eq_([self.mouse.display, self.input.display2],
+            [display for display in opened if not display.closed])
+
+        self.input.close()
+        self.mouse.close()
+        ok_(not self.keyboard.display.closed)
+        self.keyboard.close()
+        ok_(all(display.closed for display in opened))
+
+    def test_routing(self):
+        self.input.handler(FakeReply([
+            (X.KeyPress, 8, 0, 0),
+            (X.KeyRelease, 8, 0, 0),
+            (X.MotionNotify, 0, 1, 2),
+            (X.ButtonPress, 1, 1, 2),
+            (X.KeyPress, 14, 0, 0),
+            (X.ButtonRelease, 1, 3, 4),
+            (X.KeyRelease, 14, 0, 0)]))
+        eq_([('tap', 8, 'a', True),
+             ('tap', 8, 'a', False),
+             ('move', 1, 2),
+             ('click', 1, 2, 1, True),
+             ('tap', 14, '1', True),
+             ('click', 3, 4, 1, False),
+             ('tap', 14, '1', False)], self.calls)
+        ok_(self.input.state)
+
+    def test_stop(self):
+        #As when recording
+        self.input.ctx = 1
+        self.mouse.stop()
+        ok_(not (self.input.state or self.mouse.state or self.keyboard.state))
+        requests = self.keyboard.display.requests
+        eq_(1, requests.count(('record_disable_context', 1)))
+        ok_('ungrab_pointer' in requests)
+        ok_('ungrab_keyboard' in requests)
+
+        #Stopping the listeners again does not stop the recording again
+        self.keyboard.stop()
+        eq_(1, requests.count(('record_disable_context', 1)))
+
+    def test_escape(self):
+        self.keyboard.escape = lambda event: event.detail == 14
+        self.input.handler(FakeReply([
+            (X.KeyPress, 8, 0, 0),
+            (X.KeyPress, 14, 0, 0)]))
+        eq_([('tap', 8, 'a', True)], self.calls)
+        ok_(not (self.input.state or self.mouse.state))
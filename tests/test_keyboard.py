@@ -0,0 +1,111 @@
+from nose.tools import eq_, ok_
+from pykeyboard.base import PyKeyboardMeta
+from pykeyboard.x11 import PyKeyboard
+from test_keyboard_event import StubDisplay, StubMappingNotify
+from unittest import TestCase, mock
+from Xlib import X
+
+
+class Test(TestCase):
+    def setUp(self):
+        with mock.patch('pymouse.x11.Display', StubDisplay):
+            self.keyboard = PyKeyboard()
+        self.display = self.keyboard.display
+        self.sent = []
+        self.scheduled = []
+        patcher = mock.patch('pykeyboard.x11.fake_input', self.fake_input)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def fake_input(self, display, event, detail, time=0):
+        self.sent.append((event, detail))
+        if display is not self.display:
+            self.scheduled.append((display, event, detail, time))
+
+    def change_mapping(self, keycode, keysyms):
+        self.display._keymap_codes[keycode] = keysyms
+        self.display.display.event_queue.append(
+            StubMappingNotify(X.MappingKeyboard, keycode, 1))
+
+    def test_plan(self):
+        for string in ('a', 'A', 'aA!a1A!!a', '!1', ''):
+            del self.sent[:]
+            PyKeyboardMeta.type_string(self.keyboard, string)
+            eq_(self.sent, [(op >> 8, op & 0xff)
+                            for op in self.keyboard.compile_string(string)])
+
+        del self.sent[:]
+        self.keyboard.type_string('aA!')
+        eq_([(X.KeyPress, 8), (X.KeyRelease, 8),
+             (X.KeyPress, 10), (X.KeyPress, 8), (X.KeyRelease, 8),
+             (X.KeyPress, 14), (X.KeyRelease, 14), (X.KeyRelease, 10)],
+            self.sent)
+
+    def test_cache(self):
+        keyboard = self.keyboard
+        keyboard.plan_cache_size = 2
+        plan = keyboard.compile_string('a')
+        ok_(keyboard.compile_string('a') is plan)
+        keyboard.compile_string('1')
+        keyboard.compile_string('a')
+        keyboard.compile_string('!')
+        #The least recently used plan was evicted
+        eq_(['a', '!'], [key[0] for key in keyboard._plans])
+        ok_(keyboard.compile_string('a') is plan)
+
+    def test_mapping_change(self):
+        plan = self.keyboard.compile_string('a')
+        eq_([X.KeyPress << 8 | 8, X.KeyRelease << 8 | 8], list(plan))
+        self.change_mapping(8, ())
+        self.change_mapping(14, (0x61, 0x41))
+        eq_([X.KeyPress << 8 | 14, X.KeyRelease << 8 | 14],
+            list(self.keyboard.compile_string('a')))
+        eq_(1, len(self.keyboard._plans))
+
+    def test_schedule(self):
+        with mock.patch('pykeyboard.x11.Display', StubDisplay):
+            guard = self.keyboard.schedule_guard
+            ok_(self.keyboard.schedule_guard is guard)
+        display = guard.display
+        ok_(display is not self.display)
+
+        self.keyboard.schedule_string('aA', interval=0.05)
+        eq_([(display, X.KeyPress, 8, 50), (display, X.KeyRelease, 8, 0),
+             (display, X.KeyPress, 10, 0), (display, X.KeyPress, 8, 50),
+             (display, X.KeyRelease, 8, 0), (display, X.KeyRelease, 10, 0)],
+            self.scheduled)
+        self.keyboard.schedule_string('a')
+        ok_(self.keyboard.schedule_guard is guard)
+
+        self.keyboard.close()
+        ok_(display.closed)
+        ok_(self.display.closed)
+
+    def test_special_keys(self):
+        keyboard = self.keyboard
+        lookups = []
+        lookup = keyboard.keymap.keycode
+
+        def spy(character):
+            lookups.append(character)
+            return lookup(character)
+
+        keyboard.keymap.keycode = spy
+        eq_([], lookups)
+        eq_(10, keyboard.shift_key)
+        eq_(['Shift_L'], lookups)
+        keypad = keyboard.keypad_keys
+        eq_(9, keypad['End'])
+        eq_(9, keypad[1])
+        count = len(lookups)
+        ok_(keyboard.keypad_keys is keypad)
+        eq_(count, len(lookups))
+
+        #The keys are looked up again once the keyboard mapping changed
+        self.change_mapping(9, ())
+        self.change_mapping(13, (0xff9c, 0xffb1))
+        eq_(13, keyboard.keypad_keys['End'])
+        ok_(keyboard.keypad_keys is not keypad)
+        self.change_mapping(10, ())
+        self.change_mapping(12, (0xffe1,))
+        eq_(12, keyboard.shift_key)
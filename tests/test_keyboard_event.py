@@ -0,0 +1,246 @@
+from nose import SkipTest
+from nose.tools import eq_, ok_
+from pykeyboard.x11 import PyKeyboardEvent
+from pykeyboard.x11_keysyms import keysym_to_character
+from pymouse.x11_record import EVENT_LAYOUT
+from unittest import TestCase, mock
+from Xlib import X
+import threading
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class StubInfo(object):
+    min_keycode = 8
+    max_keycode = 14
+
+
+class StubProtocolDisplay(object):
+    def __init__(self):
+        self.info = StubInfo()
+        self.event_queue = []
+        self.event_queue_write_lock = threading.Lock()
+        self.error_handler = None
+        self.request_serial = 1
+
+
+class StubDisplay(object):
+    """Stands in for an Xlib display with a small keyboard mapping."""
+    def __init__(self, name=None):
+        self.display = StubProtocolDisplay()
+        self._keymap_codes = [()] * 8 + [
+            (0x61, 0x41, 0xe6, 0xc6),  # a A ae AE
+            (0xff9c, 0xffb1),  # KP_End KP_1
+            (0xffe1,),  # Shift_L
+            (0xffe5,),  # Caps_Lock
+            (0xff7f,),  # Num_Lock
+            (0xff7e,),  # Mode_switch
+            (0x31, 0x21)]  # 1 exclam
+        self.modifier_mapping = [[10], [11], [], [], [12], [13], [], []]
+        self.closed = False
+
+    def keycode_to_keysym(self, keycode, index):
+        try:
+            return self._keymap_codes[keycode][index]
+        except IndexError:
+            return X.NoSymbol
+
+    def keysym_to_keycode(self, keysym):
+        for index in range(4):
+            for keycode, syms in enumerate(self._keymap_codes):
+                if index < len(syms) and syms[index] == keysym:
+                    return keycode
+        return 0
+
+    def get_modifier_mapping(self):
+        return self.modifier_mapping
+
+    def pending_events(self):
+        return len(self.display.event_queue)
+
+    def refresh_keyboard_mapping(self, event):
+        pass
+
+    def set_error_handler(self, handler):
+        self.display.error_handler = handler
+
+    def sync(self):
+        pass
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def ungrab_keyboard(self, time):
+        pass
+
+
+class StubMappingNotify(object):
+    type = X.MappingNotify
+
+    def __init__(self, request, first_keycode=0, count=0):
+        self.request = request
+        self.first_keycode = first_keycode
+        self.count = count
+
+
+class FakeReply(object):
+    def __init__(self, events):
+        self.data = b''.join(EVENT_LAYOUT.pack(
+            type, keycode, 0, 0, 1, 1, 0, 0, 0, 0, 0, state, 1)
+            for type, keycode, state in events)
+
+
+class BatchListener(PyKeyboardEvent):
+    """Collects the batches of key events, and the characters of their key
+    presses.
+    """
+    def on_batch(self, events):
+        if self.batch_format == 'numpy':
+            events = events.tolist()
+        for event in events:
+            self.batches.append((event[1], self.lookup_char_from_keycode(
+                event[1])))
+
+
+def reference_keysym(listener, keycode):
+    """The keysym chosen by lookup_char_from_keycode from the modifiers of
+    the last event, as it was before the character table, with the case of
+    the keysyms found by their Unicode characters.
+    """
+    modifiers = listener.modifiers
+    display = listener.display
+    keysym_index = 0
+    if modifiers['Num_Lock'] and keycode in listener.keypad_keycodes:
+        if modifiers['Shift'] or modifiers['Shift_Lock']:
+            keysym_index = 0
+        else:
+            keysym_index = 1
+    elif not modifiers['Shift'] and modifiers['Caps_Lock']:
+        char = keysym_to_character(display.keycode_to_keysym(keycode, 0))
+        if char is not None and char.islower():
+            keysym_index = 1
+    elif modifiers['Shift'] and modifiers['Caps_Lock']:
+        keysym_index = 1
+        char = keysym_to_character(display.keycode_to_keysym(keycode, 1))
+        if char is not None and char.isupper():
+            keysym_index = 0
+    elif modifiers['Shift'] or modifiers['Shift_Lock']:
+        keysym_index = 1
+    if modifiers['Mode_switch']:
+        keysym_index += 2
+    return display.keycode_to_keysym(keycode, keysym_index)
+
+
+class Test(TestCase):
+    def setUp(self):
+        with mock.patch('pykeyboard.x11.Display', StubDisplay):
+            self.listener = PyKeyboardEvent()
+        self.display = self.listener.display
+
+    def char(self, keycode, state):
+        self.listener.modifier_state = state
+        self.listener.modifiers = self.listener._modifier_views[state]
+        return self.listener.lookup_char_from_keycode(keycode)
+
+    def test_modifiers(self):
+        eq_('Caps_Lock', self.listener.lock_meaning)
+        bits = self.listener.modifier_bits
+        eq_(X.Mod2Mask, bits['Num_Lock'])
+        eq_(X.Mod3Mask, bits['Mode_switch'])
+
+    def test_characters(self):
+        shift, lock = X.ShiftMask, X.LockMask
+        num_lock, mode_switch = X.Mod2Mask, X.Mod3Mask
+        eq_('a', self.char(8, 0))
+        eq_('A', self.char(8, shift))
+        eq_('A', self.char(8, lock))
+        eq_('a', self.char(8, shift | lock))
+        eq_(u'æ', self.char(8, mode_switch))
+        eq_(u'Æ', self.char(8, mode_switch | shift))
+        eq_(u'Æ', self.char(8, mode_switch | lock))
+        eq_(u'æ', self.char(8, mode_switch | shift | lock))
+        eq_('1', self.char(14, lock))
+        eq_('!', self.char(14, shift | lock))
+        eq_('KP_End', self.char(9, 0))
+        eq_('KP_1', self.char(9, num_lock))
+        eq_('KP_End', self.char(9, num_lock | shift))
+
+    def test_reference(self):
+        listener = self.listener
+        for state in range(256):
+            for keycode in range(8, 15):
+                char = self.char(keycode, state)
+                eq_(listener._keysym_char(reference_keysym(listener, keycode)),
+                    char)
+
+    def test_keyboard_mapping_change(self):
+        resolved = []
+        resolve = self.listener._resolve_keysym
+
+        def spy(keycode, combo):
+            resolved.append(keycode)
+            return resolve(keycode, combo)
+
+        self.listener._resolve_keysym = spy
+        self.display._keymap_codes[14] = (0x32, 0x40)
+        self.display.display.event_queue.append(
+            StubMappingNotify(X.MappingKeyboard, 14, 1))
+        self.listener.handle_events([])
+        eq_({14}, set(resolved))
+        eq_('2', self.char(14, 0))
+        eq_('@', self.char(14, X.ShiftMask))
+
+    def test_modifier_mapping_change(self):
+        #Mode_switch moves from Mod3 to Mod5
+        self.display.modifier_mapping[5] = []
+        self.display.modifier_mapping[7] = [13]
+        self.display.display.event_queue.append(
+            StubMappingNotify(X.MappingModifier))
+        self.listener.handle_events([])
+        eq_(X.Mod5Mask, self.listener.modifier_bits['Mode_switch'])
+        eq_(u'æ', self.char(8, X.Mod5Mask))
+        ok_(not self.display.display.event_queue)
+
+    def batch_listener(self, batch_format):
+        with mock.patch('pykeyboard.x11.Display', StubDisplay):
+            listener = BatchListener()
+        listener.batch_format = batch_format
+        listener.batches = []
+        return listener
+
+    def test_batch(self):
+        listener = self.batch_listener('list')
+        listener.escape = lambda event: event.detail == 9
+        listener.handler(FakeReply([(X.KeyPress, 8, 0), (X.KeyRelease, 8, 0)]))
+        eq_([(8, 'a'), (8, 'a')], listener.batches)
+        ok_(listener.state)
+
+        #Mapping changes are applied before the batch is handed over
+        listener.display._keymap_codes[8] = (0x62, 0x42)
+        listener.display.display.event_queue.append(
+            StubMappingNotify(X.MappingKeyboard, 8, 1))
+        listener.handler(FakeReply([(X.KeyPress, 8, 0), (X.KeyPress, 9, 0)]))
+        eq_([(8, 'b'), (9, 'KP_End')], listener.batches[2:])
+        ok_(not listener.state)
+
+    def test_batch_numpy(self):
+        if numpy is None:
+            raise SkipTest('NumPy is not installed')
+        listener = self.batch_listener('numpy')
+        listener.handler(FakeReply([(X.KeyPress, 8, 0)]))
+        eq_([(8, 'a')], listener.batches)
+        ok_(listener.state)
+
+        #The Escape key is mapped, then pressed
+        listener.display._keymap_codes[9] = (0xff1b,)
+        listener.display.display.event_queue.append(
+            StubMappingNotify(X.MappingKeyboard, 9, 1))
+        listener.handler(FakeReply([(X.KeyPress, 9, 0)]))
+        eq_((9, 'Escape'), listener.batches[-1])
+        ok_(not listener.state)
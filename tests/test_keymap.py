@@ -0,0 +1,96 @@
+from nose.tools import eq_, ok_
+from pykeyboard.x11_keymap import Keymap
+from pymouse.x11 import close_display
+from unittest import TestCase
+from Xlib import X
+import gc
+import threading
+import weakref
+
+
+class StubEvent(object):
+    def __init__(self, type):
+        self.type = type
+
+
+class StubInfo(object):
+    min_keycode = 8
+    max_keycode = 12
+
+
+class StubProtocolDisplay(object):
+    def __init__(self):
+        self.info = StubInfo()
+        self.event_queue = []
+        self.event_queue_write_lock = threading.Lock()
+
+
+class StubDisplay(object):
+    """Stands in for an Xlib display with a small keyboard mapping."""
+    def __init__(self):
+        self.display = StubProtocolDisplay()
+        self._keymap_codes = [()] * 8 + [
+            (0x61, 0x41),
+            (0x62, 0x42, 0, 0, 0x63),
+            (0x61, 0x41),
+            (),
+            (0xffe1,)]
+        self.refreshed = []
+        self.closed = False
+
+    def pending_events(self):
+        return len(self.display.event_queue)
+
+    def refresh_keyboard_mapping(self, event):
+        self.refreshed.append(event)
+
+    def close(self):
+        self.closed = True
+
+
+class Test(TestCase):
+    def setUp(self):
+        self.display = StubDisplay()
+        self.keymap = Keymap(self.display)
+        self.changes = []
+
+    def _changed(self, event):
+        self.changes.append(event)
+
+    def test_build(self):
+        eq_((8, 0, 0), self.keymap.lookup('a'))
+        eq_((8, 1, 0), self.keymap.lookup('A'))
+        eq_((9, 0, 2), self.keymap.lookup('c'))
+        eq_(12, self.keymap.keycode('Shift_L'))
+        eq_(0, self.keymap.keycode('z'))
+
+    def test_update(self):
+        self.keymap.observe(self._changed)
+        eq_(9, self.keymap.keycode('c'))
+        other = StubEvent(X.KeyPress)
+        mapping = StubEvent(X.MappingNotify)
+        self.display.display.event_queue.extend([other, mapping])
+        self.display._keymap_codes[11] = (0x63,)
+
+        ok_(self.keymap.update(poll=True))
+        eq_(1, self.keymap.generation)
+        eq_([mapping], self.display.refreshed)
+        eq_([mapping], self.changes)
+        eq_([other], self.display.display.event_queue)
+        eq_(11, self.keymap.keycode('c'))
+
+        ok_(not self.keymap.update(poll=True, discard=True))
+        eq_([], self.display.display.event_queue)
+
+    def test_lifetime(self):
+        display = StubDisplay()
+        keymap = Keymap.for_display(display)
+        ok_(Keymap.for_display(display) is keymap)
+        close_display(display)
+        ok_(display.closed)
+        ok_(Keymap.for_display(display) is not keymap)
+
+        reference = weakref.ref(display)
+        del display, keymap
+        gc.collect()
+        ok_(reference() is None)
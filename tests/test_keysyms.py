@@ -0,0 +1,54 @@
+from nose.tools import eq_, ok_
+from pykeyboard import x11_keymap, x11_keysyms
+from unittest import TestCase
+import operator
+import os
+import shutil
+import tempfile
+
+
+class Test(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        x11_keymap._translation_tables = None
+
+    def tearDown(self):
+        x11_keymap.KEYSYM_CACHE = None
+        x11_keymap._translation_tables = None
+        shutil.rmtree(self.directory)
+
+    def test_shared(self):
+        keysym_to_string, string_to_keysym = x11_keymap.translation_tables()
+        ok_(x11_keymap.translation_tables()[0] is keysym_to_string)
+        eq_(0x61, string_to_keysym['a'])
+        eq_('Aogonek', keysym_to_string[string_to_keysym['Aogonek']])
+        self.assertRaises(TypeError, operator.setitem, string_to_keysym, 'a', 0)
+
+    def test_cache(self):
+        built = x11_keymap.translation_tables()
+        x11_keymap.KEYSYM_CACHE = os.path.join(self.directory, 'keysyms')
+        x11_keymap._translation_tables = None
+        eq_(built, x11_keymap.translation_tables())
+        ok_(os.path.exists(x11_keymap.KEYSYM_CACHE))
+
+        x11_keymap._translation_tables = None
+        eq_(built, x11_keymap.translation_tables())
+
+    def test_index(self):
+        keys, keysyms = x11_keysyms.index()
+        eq_(sorted(keys), keys)
+        eq_(len(keys), len(keysyms))
+        eq_(0x61, x11_keymap.string_to_keysym('a'))
+        eq_(0x6c1, x11_keymap.string_to_keysym(u'\u0430'))
+        eq_(0x6c1, x11_keymap.string_to_keysym('Cyrillic_a'))
+        eq_(0xfe20, x11_keymap.string_to_keysym('ISO_Left_Tab'))
+        self.assertRaises(KeyError, x11_keymap.string_to_keysym, 'Unknown')
+        eq_('Cyrillic_a', x11_keysyms.KEYSYMS[u'\u0430'])
+
+    def test_characters(self):
+        eq_(u'A', x11_keysyms.keysym_to_character(0x41))
+        eq_(u'é', x11_keysyms.keysym_to_character(0xe9))
+        eq_(u'а', x11_keysyms.keysym_to_character(0x6c1))
+        eq_(u'ā', x11_keysyms.keysym_to_character(0x1000101))
+        eq_(u'€', x11_keysyms.keysym_to_character(0x20ac))
+        eq_(None, x11_keysyms.keysym_to_character(0xff08))
@@ -0,0 +1,116 @@
+from nose.tools import eq_
+from pymouse.x11 import PyMouseEvent
+from pymouse.x11_record import (EVENT_LAYOUT, RecordEvent, BUTTON_EVENTS,
+                                POINTER_EVENTS)
+from unittest import TestCase, mock
+from Xlib import X
+import time
+
+
+def motion(x, y, time=0):
+    return RecordEvent(X.MotionNotify, 0, 0, time, 1, 1, 0, x, y, x, y, 0, 1)
+
+
+def press(button, x, y, time=0):
+    return RecordEvent(X.ButtonPress, button, 0, time, 1, 1, 0, x, y, x, y,
+                       0, 1)
+
+
+class Recorder(PyMouseEvent):
+    def __init__(self, **kwargs):
+        with mock.patch('pymouse.x11.Display'):
+            PyMouseEvent.__init__(self, **kwargs)
+        self.calls = []
+
+    def move(self, x, y):
+        self.calls.append(('move', x, y))
+
+    def click(self, x, y, button, press):
+        self.calls.append(('click', x, y, button, press))
+
+
+class FakeReply(object):
+    def __init__(self, events):
+        self.data = b''.join(EVENT_LAYOUT.pack(*event) for event in events)
+
+
+class StubMouse(object):
+    def __init__(self):
+        self.positions = []
+
+    def update_position(self, x, y):
+        self.positions.append((x, y))
+
+
+class BatchRecorder(Recorder):
+    def on_batch(self, events):
+        self.calls.append(('batch', events))
+
+
+class Test(TestCase):
+    def test_uncoalesced(self):
+        listener = Recorder()
+        listener.handle_events([motion(1, 1), motion(2, 2)])
+        eq_([('move', 1, 1), ('move', 2, 2)], listener.calls)
+        eq_(0, listener.motion_collapsed)
+
+    def test_reply(self):
+        listener = Recorder(coalesce_motion='reply')
+        listener.handle_events([motion(1, 1), motion(2, 2), press(1, 2, 2),
+                                motion(3, 3), motion(4, 4)])
+        eq_([('move', 2, 2), ('click', 2, 2, 1, True), ('move', 4, 4)],
+            listener.calls)
+        eq_(2, listener.motion_collapsed)
+
+    def test_distance(self):
+        listener = Recorder(coalesce_motion='distance', motion_distance=5)
+        listener.handle_events([motion(0, 0), motion(3, 0), motion(5, 4),
+                                motion(6, 4)])
+        eq_([('move', 0, 0), ('move', 5, 4)], listener.calls)
+
+        #The pending position is reported before a click
+        listener.handle_events([press(1, 6, 4)])
+        eq_([('move', 6, 4), ('click', 6, 4, 1, True)], listener.calls[2:])
+        eq_(1, listener.motion_collapsed)
+
+    def test_interval(self):
+        listener = Recorder(coalesce_motion='interval', motion_interval=0.05)
+        listener.handle_events([motion(0, 0, 1000), motion(1, 1, 1010),
+                                motion(2, 2, 1020), motion(3, 3, 1050)])
+        eq_([('move', 0, 0), ('move', 3, 3)], listener.calls)
+        eq_(2, listener.motion_collapsed)
+
+        #The last position of a movement is reported by the timer
+        listener.handle_events([motion(4, 4, 1060)])
+        eq_(2, len(listener.calls))
+        time.sleep(0.2)
+        eq_(('move', 4, 4), listener.calls[-1])
+
+    def test_batch(self):
+        listener = BatchRecorder(coalesce_motion='reply')
+        events = [motion(1, 1), motion(2, 2), press(1, 2, 2)]
+        listener.handler(FakeReply(events))
+        listener.handle_events(events[:1])
+        listener.handler(FakeReply([]))
+        #Motion is not coalesced, and empty batches are not handed over
+        eq_([('batch', events), ('batch', events[:1])], listener.calls)
+        eq_(0, listener.motion_collapsed)
+
+    def test_report_position(self):
+        with mock.patch('pymouse.x11.Display'):
+            listener = PyMouseEvent()
+        eq_(BUTTON_EVENTS, listener._wanted_events())
+        mouse = StubMouse()
+        listener.report_position(mouse)
+        eq_(POINTER_EVENTS, listener._wanted_events())
+
+        listener.handle_events(iter([motion(1, 1), press(1, 2, 2)]))
+        listener.handler(FakeReply([motion(3, 3), motion(4, 4)]))
+        eq_([(2, 2), (4, 4)], mouse.positions)
+
+        #Batches are handed over as well
+        listener = BatchRecorder()
+        listener.report_position(mouse)
+        listener.handler(FakeReply([motion(5, 5)]))
+        eq_((5, 5), mouse.positions[-1])
+        eq_([('batch', [motion(5, 5)])], listener.calls)
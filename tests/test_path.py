@@ -0,0 +1,41 @@
+from nose import SkipTest
+from nose.tools import eq_, ok_
+from unittest import TestCase
+
+try:
+    import numpy
+    from pymouse.path import path, delays
+except ImportError:
+    numpy = None
+
+
+class Test(TestCase):
+    def setUp(self):
+        if numpy is None:
+            raise SkipTest()
+
+    def test_end_points(self):
+        for kind in ('linear', 'minimum_jerk', 'bezier'):
+            points = path((10, 20), (110, -30), 0.5, 100, kind)
+            eq_((51, 2), points.shape)
+            eq_([10, 20], points[0].tolist())
+            eq_([110, -30], points[-1].tolist())
+
+    def test_linear(self):
+        points = path((0, 0), (100, 0), 1, 10, 'linear')
+        eq_(list(range(0, 101, 10)), points[:, 0].tolist())
+
+    def test_minimum_jerk_is_monotonic(self):
+        points = path((0, 0), (500, 0), 1, 100, 'minimum_jerk')
+        ok_((numpy.diff(points[:, 0]) >= 0).all())
+
+    def test_cached_relative_to_start(self):
+        first = path((0, 0), (50, 50), 0.2, 50)
+        second = path((100, 100), (150, 150), 0.2, 50)
+        eq_((first + 100).tolist(), second.tolist())
+
+    def test_unknown_kind(self):
+        self.assertRaises(ValueError, path, (0, 0), (1, 1), 1, 10, 'zigzag')
+
+    def test_delays(self):
+        eq_([0, 7, 6, 7, 7, 6, 7], delays(7, 150).tolist())
@@ -0,0 +1,73 @@
+from nose import SkipTest
+from nose.tools import eq_, ok_
+from pymouse.x11_record import RecordEvent, record_batch, record_events
+from unittest import TestCase
+from Xlib import X
+from Xlib.protocol import event
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class FakeReply(object):
+    def __init__(self, events):
+        self.data = b''.join(e._binary for e in events)
+
+
+class FakeDisplay(object):
+    """The parts of a display used to decode events with Xlib."""
+    def __init__(self):
+        self.display = self
+        self.event_classes = event.event_class.copy()
+
+
+def button_press(detail, x, y):
+    return event.ButtonPress(
+        detail=detail, time=1234, root=1, window=2, child=0, root_x=x,
+        root_y=y, event_x=x, event_y=y, state=X.ShiftMask, same_screen=1)
+
+
+class Test(TestCase):
+    def test_device_events(self):
+        events = [button_press(1, 10, -3),
+                  event.MotionNotify(
+                      detail=0, time=1235, root=1, window=2, child=0,
+                      root_x=640, root_y=480, event_x=0, event_y=0, state=0,
+                      same_screen=1)]
+        decoded = list(record_events(FakeReply(events), FakeDisplay()))
+        eq_(2, len(decoded))
+        ok_(all(isinstance(e, RecordEvent) for e in decoded))
+        for original, copy in zip(events, decoded):
+            for name in ('type', 'detail', 'time', 'root_x', 'root_y',
+                         'state'):
+                eq_(getattr(original, name), getattr(copy, name))
+
+    def test_other_events(self):
+        mapping = event.MappingNotify(
+            request=X.MappingKeyboard, first_keycode=8, count=2)
+        events = [button_press(3, 1, 2), mapping, button_press(4, 5, 6)]
+        decoded = list(record_events(FakeReply(events), FakeDisplay()))
+        eq_([X.ButtonPress, X.MappingNotify, X.ButtonPress],
+            [e.type for e in decoded])
+        eq_((5, 6), (decoded[2].root_x, decoded[2].root_y))
+        ok_(not isinstance(decoded[1], RecordEvent))
+
+    def test_empty(self):
+        eq_([], list(record_events(FakeReply([]), FakeDisplay())))
+
+    def test_batch(self):
+        mapping = event.MappingNotify(
+            request=X.MappingKeyboard, first_keycode=8, count=2)
+        reply = FakeReply([button_press(1, 10, 20), mapping,
+                           button_press(2, 30, -40)])
+        events = record_batch(reply, FakeDisplay())
+        eq_(3, len(events))
+        if numpy is None:
+            raise SkipTest()
+        events = record_batch(reply, FakeDisplay(), 'numpy')
+        eq_([1, 2], events['detail'].tolist())
+        eq_([10, 30], events['root_x'].tolist())
+        eq_([20, -40], events['root_y'].tolist())
+        eq_([1234, 1234], events['time'].tolist())
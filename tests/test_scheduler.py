@@ -0,0 +1,30 @@
+from nose.tools import eq_, ok_
+from pymouse.scheduler import Scheduler
+from unittest import TestCase
+import time
+
+
+class Test(TestCase):
+    def test_no_drift(self):
+        scheduler = Scheduler(0.01)
+        for i in range(20):
+            time.sleep(0.002)  # Time spent sending an event
+            scheduler.wait()
+        elapsed = time.monotonic() - scheduler.start
+        ok_(0.2 <= elapsed < 0.23)
+        eq_(20, scheduler.statistics()['count'])
+
+    def test_catch_up(self):
+        scheduler = Scheduler(0.01)
+        time.sleep(0.05)
+        start = time.monotonic()
+        for i in range(5):
+            scheduler.wait()
+        ok_(time.monotonic() - start < 0.01)
+
+    def test_no_interval(self):
+        scheduler = Scheduler(0)
+        for i in range(5):
+            scheduler.wait()
+        eq_(0, scheduler.statistics()['count'])
+        eq_(0.0, scheduler.statistics()['rate'])
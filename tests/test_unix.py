@@ -16,7 +16,7 @@ to start:
     nosetests -v
 '''
 
-from nose.tools import eq_
+from nose.tools import eq_, ok_
 from pymouse import PyMouse, PyMouseEvent
 from pyvirtualdisplay import Display
 from unittest import TestCase
@@ -90,6 +90,32 @@ class Test(TestCase):
                     mouse.move(*p)
                     eq_(expect_pos(p, size), mouse.position())
 
+    def test_move_tracked(self):
+        for size in screen_sizes:
+            with Display(visible=VISIBLE, size=size):
+                with PyMouse(track_position=True) as mouse:
+                    for p in positions:
+                        mouse.move(*p)
+                        eq_(expect_pos(p, size), mouse.position())
+                        mouse.invalidate_position()
+                        eq_(expect_pos(p, size), mouse.position())
+
+    def test_batch(self):
+        for size in screen_sizes:
+            with Display(visible=VISIBLE, size=size):
+                with PyMouse() as mouse:
+                    with mouse.batch():
+                        for p in positions:
+                            mouse.move(*p)
+                    eq_(expect_pos(positions[-1], size), mouse.position())
+
+    def test_shared_display(self):
+        with Display(visible=VISIBLE):
+            with PyMouse(shared=True) as first, \
+                    PyMouse(shared=True) as second, PyMouse() as third:
+                ok_(first.display is second.display)
+                ok_(first.display is not third.display)
+
     def test_event(self):
         for size in screen_sizes:
             with Display(visible=VISIBLE, size=size):
@@ -138,3 +164,6 @@ class Test(TestCase):
                 print("check scroll right")
                 check_scroll(7, 0, -1)
                 event.stop()
+                event.join(1.0)
+                event.close()
+                mouse.close()